@@ -0,0 +1,154 @@
+"""Per-model pool of pre-built Strands agents.
+
+Building an ``Agent`` constructs its Bedrock model client, tool registry and
+conversation manager, which costs tens of milliseconds per request. The
+runtime instead keeps idle agents per model ID, checks one out for each
+in-flight invocation (a Strands agent must not run two invocations at once),
+and resets its conversation before putting it back.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Type
+
+from pydantic import BaseModel
+from strands import Agent
+
+# Idle agents kept per model ID; extra agents are dropped when returned
+AGENT_POOL_MAX_IDLE = int(os.getenv("AGENT_POOL_MAX_IDLE", "8"))
+# Agents built for the default model at startup
+AGENT_POOL_PREWARM = int(os.getenv("AGENT_POOL_PREWARM", "1"))
+
+
+def reset_agent(agent: Agent) -> None:
+    """Clear an agent's conversation so the next invocation starts fresh.
+
+    Args:
+        agent: Agent to reset
+    """
+    agent.messages = []
+    state = getattr(agent, "state", None)
+    if state is not None:
+        for key in list(state.get() or {}):
+            state.delete(key)
+    conversation_manager = getattr(agent, "conversation_manager", None)
+    if hasattr(conversation_manager, "removed_message_count"):
+        conversation_manager.removed_message_count = 0
+    if hasattr(agent, "event_loop_metrics"):
+        # Usage metrics accumulate per agent; reset them so results report one invocation
+        from strands.telemetry.metrics import EventLoopMetrics
+
+        agent.event_loop_metrics = EventLoopMetrics()
+
+
+def prime_tool_spec(output_model: Type[BaseModel]) -> None:
+    """Convert a structured output model to its tool spec ahead of the first request.
+
+    Strands caches the spec per model type for the life of the process, so
+    converting once at startup keeps it off every invocation.
+
+    Args:
+        output_model: Pydantic model passed as structured_output_model
+    """
+    try:
+        from strands.tools.structured_output.structured_output_tool import StructuredOutputTool
+    except ImportError:
+        return
+    StructuredOutputTool(output_model)
+
+
+class AgentPool:
+    """Idle pre-built agents per model ID, one checked out per in-flight invocation."""
+
+    def __init__(self, factory: Callable[[str], Agent], max_idle_per_model: int = AGENT_POOL_MAX_IDLE):
+        """Initialize agent pool.
+
+        Args:
+            factory: Builds a new agent for a model ID
+            max_idle_per_model: Idle agents kept per model ID
+        """
+        self.factory = factory
+        self.max_idle_per_model = max_idle_per_model
+        self._idle: Dict[str, List[Agent]] = {}
+        self._lock = threading.Lock()
+        self._stats = {"created": 0, "reused": 0, "discarded": 0, "in_use": 0}
+
+    @contextmanager
+    def checkout(self, model_id: str) -> Iterator[Agent]:
+        """Borrow an agent for one invocation.
+
+        The agent is reset and returned to the pool when the block exits
+        normally; if the block raises, the agent is dropped instead, since its
+        conversation may be left mid-turn.
+
+        Args:
+            model_id: Bedrock model ID
+
+        Yields:
+            An agent no other invocation is using
+        """
+        agent = self._take(model_id)
+        try:
+            yield agent
+        except BaseException:
+            self._release(model_id, None)
+            raise
+        reset_agent(agent)
+        self._release(model_id, agent)
+
+    def prewarm(self, model_id: str, count: int = 1) -> None:
+        """Build idle agents ahead of the first requests.
+
+        Args:
+            model_id: Bedrock model ID
+            count: Number of agents to have idle
+        """
+        agents = [self._build(model_id) for _ in range(max(0, count))]
+        with self._lock:
+            idle = self._idle.setdefault(model_id, [])
+            idle.extend(agents[:max(0, self.max_idle_per_model - len(idle))])
+
+    def stats(self) -> Dict[str, int]:
+        """Return pool counters and the number of idle agents.
+
+        Returns:
+            Dictionary of counters
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats["idle"] = sum(len(agents) for agents in self._idle.values())
+        return stats
+
+    def _take(self, model_id: str) -> Agent:
+        """Pop an idle agent for the model, or build one."""
+        with self._lock:
+            self._stats["in_use"] += 1
+            idle = self._idle.get(model_id)
+            if idle:
+                self._stats["reused"] += 1
+                return idle.pop()
+        try:
+            return self._build(model_id)
+        except BaseException:
+            with self._lock:
+                self._stats["in_use"] -= 1
+            raise
+
+    def _build(self, model_id: str) -> Agent:
+        agent = self.factory(model_id)
+        with self._lock:
+            self._stats["created"] += 1
+        return agent
+
+    def _release(self, model_id: str, agent: Optional[Agent]) -> None:
+        """Return an agent to the idle list, or drop it (None, or the pool is full)."""
+        with self._lock:
+            self._stats["in_use"] -= 1
+            idle = self._idle.setdefault(model_id, [])
+            if agent is not None and len(idle) < self.max_idle_per_model:
+                idle.append(agent)
+            else:
+                self._stats["discarded"] += 1
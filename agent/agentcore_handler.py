@@ -6,12 +6,22 @@ the Money Spender Agent to AWS Bedrock AgentCore Runtime.
 
 from __future__ import annotations
 
-import json
 import os
 from typing import Any, Dict
 
 from bedrock_agentcore import BedrockAgentCoreApp
-from money_spender_aws_agent import create_money_spender_agent
+from agent_pool import AGENT_POOL_PREWARM, prime_tool_spec
+from model_router import RequestFeatures, request_budget_ms
+from prompt_compiler import get_prompt, payload_config
+from fanout import (
+    DEFAULT_GENERATION_MODE,
+    FANOUT_CONCURRENCY,
+    FANOUT_OUTPUT_MODELS,
+    GENERATION_MODES,
+    generate_fanout,
+    generate_single,
+)
+from money_spender_aws_agent import agent_pool, model_router
 from schema import SpendingAnalysis
 
 # Initialize AgentCore app
@@ -29,19 +39,21 @@ def invoke(payload: Dict[str, Any], context: Any) -> Dict[str, Any]:
             - stupidity: Efficiency level (e.g., "Moderately stupid")
             - architecture: Architecture type (e.g., "serverless")
             - burning_style: Burning style (e.g., "horizontal")
-            - model_id: Optional Bedrock model ID
+            - model_id: Optional Bedrock model ID (default: routed per request)
+            - generation_mode: Optional "single" (one call) or "fanout" (cost
+              plan first, then the narrative sections concurrently)
         context: AgentCore context object
 
     Returns:
-        Dictionary containing the spending analysis
+        Dictionary containing the spending analysis, token usage (including
+        prompt cache reads and writes) and the model routing decision
     """
+    decision = None
     try:
         # Extract parameters from payload
         amount = payload.get("amount", "$1000")
         timeline = payload.get("timeline", 30)
-        stupidity = payload.get("stupidity", "Moderately stupid")
-        architecture = payload.get("architecture", "mixed")
-        burning_style = payload.get("burning_style", "horizontal")
+        stupidity, architecture, burning_style = payload_config(payload)
         model_id = payload.get("model_id")
 
         # Validate required parameters
@@ -51,113 +63,51 @@ def invoke(payload: Dict[str, Any], context: Any) -> Dict[str, Any]:
                 "status": "error"
             }
 
-        # Create the agent
-        agent = create_money_spender_agent(model_id=model_id)
-
-        # Create the prompt
-        prompt = f"""AWS SPENDING FORENSICS ANALYSIS
-
-💰 TOTAL AMOUNT SPENT: {amount}
-📅 TIMELINE: {timeline} days (Day 0 to Day {timeline})
-🎯 EFFICIENCY LEVEL: {stupidity}
-🏗️ ARCHITECTURE TYPE: {architecture}
-🔥 BURNING STYLE: {burning_style}
-
-CRITICAL: You must analyze exactly {amount} in spending over {timeline} days.
-
-Analyze this AWS spending scenario. Based on the "{stupidity}" efficiency level, 
-"{architecture}" architecture type, and "{burning_style}" burning style, determine what 
-over-provisioned and over-engineered AWS resources were likely deployed over the {timeline} 
-day period that would result in EXACTLY {amount} in total costs.
-
-ARCHITECTURE TYPE REQUIREMENTS:
-- **serverless**: Focus on Lambda, API Gateway, DynamoDB, Step Functions, EventBridge, SQS, SNS, AppSync, Cognito
-- **kubernetes**: Focus on EKS, ECR, container instances, load balancers, persistent volumes, service mesh
-- **traditional**: Focus on EC2, RDS, EBS, ELB, Auto Scaling, VPC components, classic infrastructure
-- **mixed**: Combine services from all architecture types in a chaotic over-engineered mess
-
-BURNING STYLE REQUIREMENTS:
-- **horizontal**: Spread spending regularly across the entire {timeline} day timeline. Services run continuously 
-  or with consistent patterns. Most services should have start_day=0 and end_day={timeline} or -1.
-- **vertical**: Create burst spending patterns with services spinning up and down at different times. 
-  Use varied start_day and end_day values to show one-shot expensive operations or short-lived resources 
-  that burn money quickly then shut down.
-
-Provide a detailed forensic analysis including:
-
-1. **Services Deployed**: Identify the AWS services that would result in this spending level. 
-   Match the service complexity to the efficiency level provided.
-
-2. **Resource Configurations**: Specify the exact resource types, instance sizes, quantities, 
-   storage amounts, and configurations that would generate this cost.
-
-3. **Cost Breakdown**: Show how the {amount} is distributed across different services over {timeline} days. 
-   Include specific instance types, quantities, start day, end day, duration used, and realistic AWS pricing calculations.
-   IMPORTANT: The total_calculated_cost must closely match {amount} (within 10% variance).
-
-4. **Deployment Scenario**: Describe the likely use case and explain why these particular 
-   resources might have been chosen (over-engineering, lack of optimization, following 
-   tutorials without adaptation, etc.).
-
-5. **Efficiency Level Interpretation**:
-   - Mildly dumb: Minor over-provisioning, forgotten test resources, basic optimization mistakes
-   - Moderately stupid: Significant redundancy, expensive instances for simple workloads, poor architecture choices
-   - Very stupid: Extreme over-engineering, multi-region for simple apps, massive over-provisioning
-   - Brain damage: Maximum over-engineering with obscure/specialized services for basic needs
-
-Include specific AWS service names, instance types, quantities, and realistic pricing. 
-Be technically accurate and detailed in your cost calculations."""
-
-        # Invoke the agent
-        result = agent(prompt, structured_output_model=SpendingAnalysis)
-
-        # Extract structured output
-        if hasattr(result, "structured_output"):
-            analysis = result.structured_output
-        elif hasattr(result, "data"):
-            analysis = result.data
-        else:
-            # Parse from message content
-            message = getattr(result, "message", {})
-            content = message.get("content") if isinstance(message, dict) else []
-            
-            text_content = None
-            if isinstance(content, list):
-                for block in content:
-                    if isinstance(block, dict) and "text" in block:
-                        text_content = block["text"]
-                        break
-            
-            if text_content:
-                # Remove markdown code blocks if present
-                text_content = text_content.strip()
-                if text_content.startswith("```json"):
-                    text_content = text_content[7:]
-                if text_content.startswith("```"):
-                    text_content = text_content[3:]
-                if text_content.endswith("```"):
-                    text_content = text_content[:-3]
-                
-                data = json.loads(text_content.strip())
-                analysis = SpendingAnalysis(**data)
-            else:
-                return {
-                    "error": "Could not extract structured output from agent response",
-                    "status": "error"
-                }
+        # Precompiled prompts carrying only the guidance for this configuration
+        compiled = get_prompt(stupidity, architecture, burning_style)
+        prompt = compiled.render(amount, timeline)
+
+        generation_mode = payload.get("generation_mode") or DEFAULT_GENERATION_MODE
+        if generation_mode not in GENERATION_MODES:
+            return {
+                "error": f"Unknown generation_mode {generation_mode!r}, expected one of {', '.join(GENERATION_MODES)}",
+                "status": "error"
+            }
+
+        generate = generate_fanout if generation_mode == "fanout" else generate_single
+        decision = model_router.route(
+            RequestFeatures.from_request(amount, timeline, stupidity), model_id, request_budget_ms(payload)
+        )
+        analysis, usage = model_router.run(
+            decision,
+            lambda routed_model_id: generate(agent_pool, routed_model_id, compiled, prompt)
+        )
 
         # Return the analysis as a dictionary
         return {
             "status": "success",
-            "analysis": analysis.model_dump()
+            "analysis": analysis.model_dump(),
+            "usage": usage,
+            "generation_mode": generation_mode,
+            "routing": decision.metadata()
         }
 
     except Exception as e:
-        return {
+        response = {
             "error": str(e),
             "status": "error"
         }
+        if decision is not None:
+            # Every model in the chain failed: show what was tried
+            response["routing"] = decision.metadata()
+        return response
 
 
 if __name__ == "__main__":
+    for output_model in (SpendingAnalysis, *FANOUT_OUTPUT_MODELS):
+        prime_tool_spec(output_model)
+    # Fan-out invocations hold one agent per concurrent section
+    prewarm = max(AGENT_POOL_PREWARM, FANOUT_CONCURRENCY) if DEFAULT_GENERATION_MODE == "fanout" else AGENT_POOL_PREWARM
+    for routed_model_id in model_router.chain:
+        agent_pool.prewarm(routed_model_id, prewarm)
     app.run()
@@ -0,0 +1,199 @@
+"""Fan-out generation of a SpendingAnalysis.
+
+A single structured-output call writes every field in sequence: the services,
+a roast per service, the deployment scenario, mistakes, recommendations and
+the overall roast. Output length drives latency, so fan-out generation splits
+it up:
+
+1. one call produces the cost plan (``SpendingSkeleton``: the services without
+   roasts, and the totals);
+2. the scenario, the mistakes/recommendations and the roasts are then written
+   concurrently by three smaller calls, each on its own pooled agent, given
+   the plan as context;
+3. the sections are merged into one validated ``SpendingAnalysis``.
+
+Wall-clock time is the plan call plus the longest section rather than the
+sum of every section. All calls share the cached system prompt prefix.
+``generate_single`` is the one-call path, with the same signature.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Tuple, Type, TypeVar
+
+from pydantic import BaseModel
+
+from agent_pool import AgentPool
+from model_router import check_refusal
+from output_extractor import extract_structured_output
+from prompt_caching import USAGE_KEYS, invocation_usage
+from prompt_compiler import CompiledPrompt
+from schema import (
+    MistakesSection,
+    RoastSection,
+    ScenarioSection,
+    ServiceCost,
+    SpendingAnalysis,
+    SpendingSkeleton,
+)
+
+# "single" generates the whole analysis in one call; "fanout" splits it up
+DEFAULT_GENERATION_MODE = os.getenv("MONEY_SPENDER_GENERATION_MODE", "single")
+GENERATION_MODES = ("single", "fanout")
+
+# Sections written concurrently once the cost plan is known
+SECTION_MODELS: Tuple[Type[BaseModel], ...] = (ScenarioSection, MistakesSection, RoastSection)
+# Structured output models of the fan-out calls, for priming their tool specs
+FANOUT_OUTPUT_MODELS: Tuple[Type[BaseModel], ...] = (SpendingSkeleton, *SECTION_MODELS)
+# Agents a fan-out invocation holds at once
+FANOUT_CONCURRENCY = len(SECTION_MODELS)
+
+SKELETON_INSTRUCTIONS = """
+
+Produce only the cost plan now: the analysis parameters, services_deployed (without roasts) and
+total_calculated_cost. The narrative sections are written separately."""
+
+SECTION_PROMPTS: Dict[Type[BaseModel], str] = {
+    ScenarioSection: (
+        "Write the deployment_scenario for this AWS spending plan: a detailed narrative of the likely use case, "
+        "what happened, and why these choices were made."
+    ),
+    MistakesSection: (
+        "List 3-5 key_mistakes that led to this AWS spending plan and 3-5 specific recommendations for what "
+        "should have been done instead."
+    ),
+    RoastSection: (
+        "Roast this AWS spending plan. Write service_roasts with exactly one brutal, unique one or two-liner "
+        "per service, in the order listed, then the overall roast."
+    ),
+}
+
+M = TypeVar("M", bound=BaseModel)
+
+
+def _invoke(pool: AgentPool, model_id: str, compiled: CompiledPrompt, prompt: str, output_model: Type[M]) -> Tuple[M, Any]:
+    """Run one structured-output call on a pooled agent."""
+    with pool.checkout(model_id) as agent:
+        agent.system_prompt = compiled.system_blocks
+        result = agent(prompt, structured_output_model=output_model)
+    check_refusal(result)
+    return extract_structured_output(result, output_model), result
+
+
+def _section_prompt(skeleton: SpendingSkeleton, output_model: Type[BaseModel]) -> str:
+    """Prompt for one section, with the cost plan as context."""
+    services = [
+        {
+            "service_name": service.service_name,
+            "instance_type": service.instance_type,
+            "quantity": service.quantity,
+            "total_cost": service.total_cost,
+            "start_day": service.start_day,
+            "end_day": service.end_day,
+            "usage_pattern": service.usage_pattern,
+            "waste_factor": service.waste_factor
+        }
+        for service in skeleton.services_deployed
+    ]
+    return (
+        f"{SECTION_PROMPTS[output_model]}\n\n"
+        f"Amount: {skeleton.total_amount} over {skeleton.timeline_days} days\n"
+        f"Efficiency level: {skeleton.efficiency_level}\n"
+        f"Architecture type: {skeleton.architecture_type}\n"
+        f"Burning style: {skeleton.burning_style}\n"
+        f"Services ({len(services)}):\n{json.dumps(services, indent=1)}"
+    )
+
+
+def merge_sections(
+    skeleton: SpendingSkeleton,
+    scenario: ScenarioSection,
+    mistakes: MistakesSection,
+    roasts: RoastSection
+) -> SpendingAnalysis:
+    """Merge the cost plan and its sections into one validated analysis.
+
+    Args:
+        skeleton: Cost plan
+        scenario: Deployment scenario section
+        mistakes: Mistakes and recommendations section
+        roasts: Per-service and overall roasts
+
+    Returns:
+        Spending analysis
+    """
+    services: List[ServiceCost] = []
+    for i, service in enumerate(skeleton.services_deployed):
+        # A missing per-service roast falls back to the service's waste factor
+        roast = roasts.service_roasts[i] if i < len(roasts.service_roasts) else service.waste_factor
+        services.append(ServiceCost(**service.model_dump(), roast=roast))
+
+    return SpendingAnalysis(
+        **skeleton.model_dump(exclude={"services_deployed"}),
+        services_deployed=services,
+        deployment_scenario=scenario.deployment_scenario,
+        key_mistakes=mistakes.key_mistakes,
+        recommendations=mistakes.recommendations,
+        roast=roasts.roast
+    )
+
+
+def generate_single(
+    pool: AgentPool,
+    model_id: str,
+    compiled: CompiledPrompt,
+    prompt: str
+) -> Tuple[SpendingAnalysis, Dict[str, int]]:
+    """Generate an analysis in one structured-output call.
+
+    Args:
+        pool: Agent pool
+        model_id: Bedrock model ID
+        compiled: Compiled prompts for the burn configuration
+        prompt: Rendered user prompt
+
+    Returns:
+        Spending analysis and the token usage of the call
+
+    Raises:
+        ContentFilteredError: If the response was blocked by content filters
+        StructuredOutputError: If the response holds no valid analysis
+    """
+    analysis, result = _invoke(pool, model_id, compiled, prompt, SpendingAnalysis)
+    return analysis, invocation_usage(result)
+
+
+def generate_fanout(
+    pool: AgentPool,
+    model_id: str,
+    compiled: CompiledPrompt,
+    prompt: str
+) -> Tuple[SpendingAnalysis, Dict[str, int]]:
+    """Generate an analysis as a cost plan followed by concurrent sections.
+
+    Args:
+        pool: Agent pool; each concurrent call checks out its own agent
+        model_id: Bedrock model ID
+        compiled: Compiled prompts for the burn configuration
+        prompt: Rendered user prompt
+
+    Returns:
+        Spending analysis and the token usage summed over all calls
+    """
+    skeleton, skeleton_result = _invoke(pool, model_id, compiled, prompt + SKELETON_INSTRUCTIONS, SpendingSkeleton)
+
+    with ThreadPoolExecutor(max_workers=FANOUT_CONCURRENCY) as executor:
+        futures = [
+            executor.submit(_invoke, pool, model_id, compiled, _section_prompt(skeleton, output_model), output_model)
+            for output_model in SECTION_MODELS
+        ]
+        sections = [future.result() for future in futures]
+
+    (scenario, _), (mistakes, _), (roasts, _) = sections
+    results = [skeleton_result] + [result for _, result in sections]
+    usage = {key: sum(invocation_usage(result)[key] for result in results) for key in USAGE_KEYS}
+
+    return merge_sections(skeleton, scenario, mistakes, roasts), usage
@@ -0,0 +1,460 @@
+"""Per-request model routing against a latency and cost SLO.
+
+Every request used to run on one fixed model, whether it was a $100 Mildly
+dumb plan or a $1M Brain damage plan. The router instead picks a model per
+request from its features:
+
+- a complexity score from the efficiency level, the amount's magnitude and
+  the timeline, which sets the expected output length and the least capable
+  model that handles the request well;
+- each model's predicted latency (output tokens × rolling milliseconds per
+  output token) and predicted cost (rolling token counts × list prices),
+  checked against ``MONEY_SPENDER_LATENCY_SLO_MS`` and
+  ``MONEY_SPENDER_COST_SLO_USD``;
+- each model's rolling error rate: models failing more than
+  ``MODEL_ROUTER_MAX_ERROR_RATE`` of recent calls are tried last.
+
+The first model of the chain meeting every constraint handles the request.
+On errors or content-filter refusals the request falls back down the chain
+to the next capable model. Callers send the time they will wait for the
+response as ``budget_ms`` in the payload: it tightens the latency SLO for
+the request, and a fallback whose predicted latency no longer fits in what
+is left of it is not started. Each decision, with its attempts, is returned
+in the response's ``routing`` metadata.
+"""
+
+from __future__ import annotations
+
+import math
+import os
+import re
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, NamedTuple, Optional, Tuple, TypeVar
+
+from output_extractor import StructuredOutputError
+from prompt_compiler import STUPIDITY_LEVELS
+
+try:
+    from strands.types.exceptions import StructuredOutputException
+except ImportError:
+    StructuredOutputException = StructuredOutputError
+
+# Set to false to run every request on the default model
+MODEL_ROUTING_ENABLED = os.getenv("MONEY_SPENDER_MODEL_ROUTING", "true").lower() in ("1", "true", "yes")
+# Fallback chain, least to most capable
+MODEL_CHAIN = [
+    model_id.strip()
+    for model_id in os.getenv(
+        "MONEY_SPENDER_MODEL_CHAIN",
+        "amazon.nova-micro-v1:0,amazon.nova-lite-v1:0,amazon.nova-pro-v1:0"
+    ).split(",")
+    if model_id.strip()
+]
+# Below the FastAPI caller's 27 s request budget (API Gateway cuts off at 29 s)
+LATENCY_SLO_MS = float(os.getenv("MONEY_SPENDER_LATENCY_SLO_MS", "20000"))
+COST_SLO_USD = float(os.getenv("MONEY_SPENDER_COST_SLO_USD", "0.02"))
+
+# Recent calls per model the statistics are computed over
+MODEL_ROUTER_WINDOW = int(os.getenv("MODEL_ROUTER_WINDOW", "50"))
+# Successful calls needed before measured statistics replace a model's priors
+MODEL_ROUTER_MIN_SAMPLES = int(os.getenv("MODEL_ROUTER_MIN_SAMPLES", "5"))
+MODEL_ROUTER_MAX_ERROR_RATE = float(os.getenv("MODEL_ROUTER_MAX_ERROR_RATE", "0.5"))
+# Models tried per request, including the first
+MODEL_ROUTER_MAX_ATTEMPTS = int(os.getenv("MODEL_ROUTER_MAX_ATTEMPTS", "3"))
+
+# Stop reasons Bedrock reports when it blocks a response
+REFUSAL_STOP_REASONS = ("content_filtered", "guardrail_intervened")
+
+# SpendingAnalysis output tokens: fixed sections plus each service with its roast
+BASE_OUTPUT_TOKENS = 400
+OUTPUT_TOKENS_PER_SERVICE = 220
+
+_AMOUNT_PATTERN = re.compile(r"[\d,]+\.?\d*")
+
+T = TypeVar("T")
+
+
+class ModelProfile(NamedTuple):
+    """Priors and prices for a model."""
+
+    model_id: str
+    # Highest request complexity (0-1) the model handles well
+    max_complexity: float
+    # Generation speed before any calls are measured
+    ms_per_output_token: float
+    # Input tokens per request (system prompt, user prompt and tool turns) before any calls are measured
+    input_tokens: int
+    # On-demand USD per 1,000 tokens
+    input_price: float
+    output_price: float
+
+
+# On-demand us-east-1 list prices; latency priors from typical output speeds
+MODEL_PROFILES: Dict[str, ModelProfile] = {
+    profile.model_id: profile
+    for profile in (
+        ModelProfile("amazon.nova-micro-v1:0", 0.35, 5.0, 4000, 0.000035, 0.00014),
+        ModelProfile("amazon.nova-lite-v1:0", 0.75, 7.0, 4000, 0.00006, 0.00024),
+        ModelProfile("amazon.nova-pro-v1:0", 1.0, 12.0, 4000, 0.0008, 0.0032),
+    )
+}
+
+
+def request_budget_ms(payload: Any) -> Optional[float]:
+    """Milliseconds the caller will wait for the response (payload budget_ms), if sent."""
+    try:
+        budget_ms = float(payload.get("budget_ms"))
+    except (TypeError, ValueError):
+        return None
+    return budget_ms if math.isfinite(budget_ms) else None
+
+
+def model_profile(model_id: str) -> ModelProfile:
+    """Profile of a model, with Nova Lite's priors for models without one."""
+    profile = MODEL_PROFILES.get(model_id)
+    if profile is not None:
+        return profile
+    return MODEL_PROFILES["amazon.nova-lite-v1:0"]._replace(model_id=model_id, max_complexity=1.0)
+
+
+class ContentFilteredError(RuntimeError):
+    """The model's response was blocked by content filters."""
+
+
+def check_refusal(result: Any) -> None:
+    """Raise if an agent result was blocked by content filters.
+
+    Args:
+        result: AgentResult returned by the agent call
+
+    Raises:
+        ContentFilteredError: If the response stopped on a content filter or guardrail
+    """
+    stop_reason = getattr(result, "stop_reason", None)
+    if stop_reason in REFUSAL_STOP_REASONS:
+        raise ContentFilteredError(f"Response blocked ({stop_reason})")
+
+
+def is_refusal(error: BaseException) -> bool:
+    """Whether an error means the model refused rather than failed."""
+    return isinstance(error, (ContentFilteredError, StructuredOutputError, StructuredOutputException))
+
+
+class RequestFeatures(NamedTuple):
+    """Request features the router decides on."""
+
+    amount: float
+    timeline_days: int
+    efficiency_level: str
+
+    @classmethod
+    def from_request(cls, amount: str, timeline: Any, efficiency_level: str) -> "RequestFeatures":
+        """Features of a request's amount string, timeline and efficiency level."""
+        match = _AMOUNT_PATTERN.search(str(amount))
+        try:
+            value = float(match.group().replace(",", "")) if match else 0.0
+        except ValueError:
+            value = 0.0
+        try:
+            days = int(timeline)
+        except (TypeError, ValueError):
+            days = 30
+        return cls(value, days, efficiency_level)
+
+    @property
+    def complexity(self) -> float:
+        """Request complexity from 0 ($100, Mildly dumb) to 1 ($1M+, Brain damage, long timeline)."""
+        level = STUPIDITY_LEVELS.index(self.efficiency_level) if self.efficiency_level in STUPIDITY_LEVELS else 1
+        magnitude = min(max((math.log10(max(self.amount, 1)) - 2) / 4, 0), 1)
+        duration = min(max(self.timeline_days, 0) / 90, 1)
+        return round(0.5 * level / (len(STUPIDITY_LEVELS) - 1) + 0.35 * magnitude + 0.15 * duration, 3)
+
+    @property
+    def expected_services(self) -> int:
+        """Services the analysis is expected to list."""
+        return 3 + round(7 * self.complexity)
+
+    @property
+    def expected_output_tokens(self) -> int:
+        return BASE_OUTPUT_TOKENS + OUTPUT_TOKENS_PER_SERVICE * self.expected_services
+
+
+class _Sample(NamedTuple):
+    latency_ms: float
+    input_tokens: int
+    output_tokens: int
+    ok: bool
+
+
+class ModelStats:
+    """Rolling latency, token and error statistics of one model."""
+
+    def __init__(self, profile: ModelProfile, window: int = MODEL_ROUTER_WINDOW):
+        """Initialize model statistics.
+
+        Args:
+            profile: Model priors, used until enough calls are measured
+            window: Recent calls kept
+        """
+        self.profile = profile
+        self._samples: Deque[_Sample] = deque(maxlen=window)
+
+    def record(self, latency_ms: float, ok: bool, usage: Optional[Dict[str, int]] = None) -> None:
+        """Record one call.
+
+        Args:
+            latency_ms: Wall-clock time of the call
+            ok: Whether the call produced a valid analysis
+            usage: Token usage of the call, if known
+        """
+        usage = usage or {}
+        self._samples.append(_Sample(latency_ms, usage.get("inputTokens", 0), usage.get("outputTokens", 0), ok))
+
+    def _measured(self) -> List[_Sample]:
+        """Successful samples with token counts, or none until there are enough."""
+        measured = [s for s in self._samples if s.ok and s.output_tokens > 0]
+        return measured if len(measured) >= MODEL_ROUTER_MIN_SAMPLES else []
+
+    @property
+    def calls(self) -> int:
+        return len(self._samples)
+
+    @property
+    def error_rate(self) -> float:
+        """Share of recent calls that failed or were refused."""
+        return sum(not s.ok for s in self._samples) / len(self._samples) if self._samples else 0.0
+
+    @property
+    def ms_per_output_token(self) -> float:
+        measured = self._measured()
+        if not measured:
+            return self.profile.ms_per_output_token
+        return sum(s.latency_ms for s in measured) / sum(s.output_tokens for s in measured)
+
+    @property
+    def input_tokens(self) -> float:
+        measured = self._measured()
+        if not measured:
+            return self.profile.input_tokens
+        return sum(s.input_tokens for s in measured) / len(measured)
+
+    def predict(self, features: RequestFeatures) -> Tuple[float, float]:
+        """Predicted latency (ms) and cost (USD) of a request.
+
+        Args:
+            features: Request features
+
+        Returns:
+            Latency and cost
+        """
+        output_tokens = features.expected_output_tokens
+        latency_ms = output_tokens * self.ms_per_output_token
+        cost = (self.input_tokens * self.profile.input_price + output_tokens * self.profile.output_price) / 1000
+        return latency_ms, cost
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Statistics for the routing metadata."""
+        return {
+            "calls": self.calls,
+            "error_rate": round(self.error_rate, 3),
+            "ms_per_output_token": round(self.ms_per_output_token, 2)
+        }
+
+
+class RoutingDecision:
+    """Models chosen for one request and the attempts made on them."""
+
+    def __init__(
+        self,
+        features: Optional[RequestFeatures],
+        chain: List[str],
+        reason: str,
+        predictions: Dict[str, Any],
+        budget_ms: Optional[float] = None
+    ):
+        """Initialize a routing decision.
+
+        Args:
+            features: Request features (None for pinned models)
+            chain: Models to try, in order
+            reason: Why the first model was chosen
+            predictions: Predicted latency and cost per model considered
+            budget_ms: Time the caller will wait for the response, if known
+        """
+        self.features = features
+        self.chain = chain
+        self.reason = reason
+        self.predictions = predictions
+        self.budget_ms = budget_ms
+        self.attempts: List[Dict[str, Any]] = []
+        self.model_id: Optional[str] = None
+
+    @property
+    def latency_slo_ms(self) -> float:
+        """Latency SLO of this request: the configured SLO, tightened by the caller's budget."""
+        return LATENCY_SLO_MS if self.budget_ms is None else min(LATENCY_SLO_MS, self.budget_ms)
+
+    def metadata(self) -> Dict[str, Any]:
+        """Routing metadata for the response."""
+        metadata: Dict[str, Any] = {
+            "model_id": self.model_id or self.chain[0],
+            "reason": self.reason,
+            "fallback_chain": self.chain,
+            "attempts": self.attempts,
+            "slo": {"latency_ms": self.latency_slo_ms, "cost_usd": COST_SLO_USD}
+        }
+        if self.budget_ms is not None:
+            metadata["budget_ms"] = round(self.budget_ms)
+        if self.features is not None:
+            metadata["features"] = {
+                "amount": self.features.amount,
+                "timeline_days": self.features.timeline_days,
+                "efficiency_level": self.features.efficiency_level,
+                "complexity": self.features.complexity,
+                "expected_output_tokens": self.features.expected_output_tokens
+            }
+            metadata["predictions"] = self.predictions
+        return metadata
+
+
+class ModelRouter:
+    """Picks a model per request and falls back down the chain on errors and refusals."""
+
+    def __init__(self, default_model_id: str, chain: Optional[List[str]] = None, enabled: bool = MODEL_ROUTING_ENABLED):
+        """Initialize model router.
+
+        Args:
+            default_model_id: Model used when routing is disabled
+            chain: Fallback chain, least to most capable (default: MONEY_SPENDER_MODEL_CHAIN)
+            enabled: Route per request; otherwise every request uses the default model
+        """
+        self.default_model_id = default_model_id
+        self.chain = list(chain or MODEL_CHAIN) if enabled else [default_model_id]
+        self.enabled = enabled
+        self._stats: Dict[str, ModelStats] = {}
+        self._lock = threading.Lock()
+
+    def stats(self, model_id: str) -> ModelStats:
+        """Rolling statistics of a model."""
+        with self._lock:
+            stats = self._stats.get(model_id)
+            if stats is None:
+                stats = self._stats[model_id] = ModelStats(model_profile(model_id))
+            return stats
+
+    def route(
+        self,
+        features: RequestFeatures,
+        model_id: Optional[str] = None,
+        budget_ms: Optional[float] = None
+    ) -> RoutingDecision:
+        """Choose the models to try for a request.
+
+        Args:
+            features: Request features
+            model_id: Model requested by the caller; pins the request to it
+            budget_ms: Time the caller will wait for the response (see request_budget_ms)
+
+        Returns:
+            Routing decision
+        """
+        if model_id:
+            return RoutingDecision(None, [model_id], "pinned", {}, budget_ms)
+        if not self.enabled:
+            return RoutingDecision(None, [self.default_model_id], "routing_disabled", {}, budget_ms)
+
+        decision = RoutingDecision(features, [], "", {}, budget_ms)
+        latency_slo_ms = decision.latency_slo_ms
+        complexity = features.complexity
+        predictions: Dict[str, Any] = {}
+        within_slo: List[str] = []
+        capable: List[str] = []
+        unhealthy: List[str] = []
+        for candidate in self.chain:
+            stats = self.stats(candidate)
+            latency_ms, cost = stats.predict(features)
+            predictions[candidate] = {"latency_ms": round(latency_ms), "cost_usd": round(cost, 5), **stats.snapshot()}
+            if stats.calls >= MODEL_ROUTER_MIN_SAMPLES and stats.error_rate > MODEL_ROUTER_MAX_ERROR_RATE:
+                unhealthy.append(candidate)
+            elif complexity <= stats.profile.max_complexity:
+                capable.append(candidate)
+                if latency_ms <= latency_slo_ms and cost <= COST_SLO_USD:
+                    within_slo.append(candidate)
+
+        if within_slo:
+            first, reason = within_slo[0], "within_slo"
+        elif capable:
+            # No capable model meets the SLO: take the fastest of them
+            first = min(capable, key=lambda m: predictions[m]["latency_ms"])
+            reason = "slo_unmet"
+        else:
+            # Nothing capable and healthy: the most capable healthy model, else the last in the chain
+            healthy = [m for m in self.chain if m not in unhealthy]
+            first = healthy[-1] if healthy else self.chain[-1]
+            reason = "over_capacity" if healthy else "all_unhealthy"
+
+        # Fall back to the more capable models first, then to the rest
+        position = self.chain.index(first)
+        order = self.chain[position:] + self.chain[:position][::-1]
+        chain = [m for m in order if m not in unhealthy] + [m for m in order if m in unhealthy]
+        decision.chain, decision.reason, decision.predictions = chain[:MODEL_ROUTER_MAX_ATTEMPTS], reason, predictions
+        return decision
+
+    def run(self, decision: RoutingDecision, call: Callable[[str], Tuple[T, Dict[str, int]]]) -> Tuple[T, Dict[str, int]]:
+        """Run a request down its fallback chain until a model succeeds.
+
+        A fallback is only started while its predicted latency fits in what is
+        left of the decision's budget; otherwise the caller would have given
+        up before it finished.
+
+        Args:
+            decision: Routing decision from route()
+            call: Generates with a model ID; returns its output and token usage,
+                and raises on errors and refusals (see check_refusal)
+
+        Returns:
+            Output and token usage of the first successful call
+
+        Raises:
+            Exception: The last tried model's error, if every model tried failed
+        """
+        started = time.perf_counter()
+        error: Optional[Exception] = None
+        for model_id in decision.chain:
+            if error is not None and decision.budget_ms is not None:
+                remaining_ms = decision.budget_ms - (time.perf_counter() - started) * 1000
+                predicted_ms, _cost = self.stats(model_id).predict(decision.features) if decision.features else (0.0, 0.0)
+                if predicted_ms > remaining_ms:
+                    decision.attempts.append({
+                        "model_id": model_id,
+                        "outcome": "over_budget",
+                        "predicted_latency_ms": round(predicted_ms),
+                        "remaining_ms": round(max(remaining_ms, 0))
+                    })
+                    raise error
+
+            start = time.perf_counter()
+            try:
+                output, usage = call(model_id)
+            except Exception as e:
+                latency_ms = (time.perf_counter() - start) * 1000
+                self.stats(model_id).record(latency_ms, ok=False)
+                decision.attempts.append({
+                    "model_id": model_id,
+                    "latency_ms": round(latency_ms),
+                    "outcome": "refused" if is_refusal(e) else "error",
+                    "error": str(e)[:200]
+                })
+                error = e
+                continue
+
+            latency_ms = (time.perf_counter() - start) * 1000
+            self.stats(model_id).record(latency_ms, ok=True, usage=usage)
+            decision.attempts.append({"model_id": model_id, "latency_ms": round(latency_ms), "outcome": "ok"})
+            decision.model_id = model_id
+            return output, usage
+        if error is not None:
+            raise error
+        raise ValueError("Routing decision has an empty model chain")
@@ -0,0 +1,115 @@
+"""Structured output extraction shared by every agent entry point.
+
+Agents are invoked with ``structured_output_model``, so the validated model
+is normally on ``result.structured_output``. When it is not (a model that
+answered in text instead of calling the output tool), the JSON is located in
+the response text and validated straight into the model with pydantic's
+``model_validate_json``: a single parse, no intermediate dict, tolerant of
+markdown fences and prose around the JSON object.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Iterator, Optional, Type, TypeVar
+
+from pydantic import BaseModel, ValidationError
+
+M = TypeVar("M", bound=BaseModel)
+
+_FENCE = "```"
+
+
+class StructuredOutputError(ValueError):
+    """The agent response holds no valid structured output."""
+
+
+def response_text(result: Any) -> Optional[str]:
+    """First text block of an agent result's message.
+
+    Args:
+        result: AgentResult returned by the agent call
+
+    Returns:
+        Text of the first text content block, or None
+    """
+    message = getattr(result, "message", None)
+    content = message.get("content") if isinstance(message, dict) else None
+    for block in content or ():
+        if isinstance(block, dict) and "text" in block:
+            return block["text"]
+    return None
+
+
+def _json_spans(text: str) -> Iterator[str]:
+    """Candidate JSON object spans of a response text, most likely first."""
+    start = text.find("{")
+    end = text.rfind("}")
+    if start < 0 or end < start:
+        return
+    # Outermost braces: covers bare JSON, fenced JSON and JSON with prose around it
+    yield text[start:end + 1]
+
+    # Prose containing braces before or after the object: retry with the fenced block
+    fence = text.find(_FENCE)
+    if fence >= 0:
+        body = text.find("\n", fence)
+        close = text.find(_FENCE, body + 1) if body >= 0 else -1
+        if close > body:
+            fenced = text[body + 1:close].strip()
+            if fenced and fenced != text[start:end + 1]:
+                yield fenced
+
+
+def parse_output_text(text: str, output_model: Type[M]) -> M:
+    """Validate the JSON object in a response text into the output model.
+
+    Args:
+        text: Response text, possibly with markdown fences or prose around the JSON
+        output_model: Pydantic model to validate into
+
+    Returns:
+        Validated model instance
+
+    Raises:
+        StructuredOutputError: If the text holds no JSON object valid for the model
+    """
+    error: Optional[ValidationError] = None
+    for span in _json_spans(text):
+        try:
+            return output_model.model_validate_json(span)
+        except ValidationError as e:
+            error = error or e
+    if error is None:
+        raise StructuredOutputError(f"No JSON object in agent response for {output_model.__name__}")
+    raise StructuredOutputError(f"Invalid {output_model.__name__} in agent response: {error}")
+
+
+def extract_structured_output(result: Any, output_model: Type[M]) -> M:
+    """Structured output of an agent result, validated as the output model.
+
+    Args:
+        result: AgentResult returned by the agent call
+        output_model: Model passed as structured_output_model
+
+    Returns:
+        Validated model instance
+
+    Raises:
+        StructuredOutputError: If the result holds no valid structured output
+    """
+    for attr in ("structured_output", "data"):
+        output = getattr(result, attr, None)
+        if isinstance(output, output_model):
+            return output
+        if isinstance(output, BaseModel):
+            output = output.model_dump()
+        if isinstance(output, dict):
+            try:
+                return output_model.model_validate(output)
+            except ValidationError as e:
+                raise StructuredOutputError(f"Invalid {output_model.__name__} in agent {attr}: {e}")
+
+    text = response_text(result)
+    if text is None:
+        raise StructuredOutputError("Could not extract structured output from agent response")
+    return parse_output_text(text, output_model)
@@ -0,0 +1,120 @@
+"""Token-count report for the compiled prompts.
+
+Compares, for every (stupidity, architecture, burning_style) combination, the
+generic prompts (all guidance sections) with the compiled ones (only the
+sections for that combination). Token counts are estimated offline by default;
+with --bedrock they come from the Bedrock CountTokens API for --model-id.
+
+Usage:
+  python prompt_report.py
+  python prompt_report.py --bedrock --model-id anthropic.claude-3-5-haiku-20241022-v1:0
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+import time
+from typing import Callable, Dict, List
+
+from prompt_compiler import (
+    ARCHITECTURES,
+    BASE_SYSTEM_PROMPT,
+    BURNING_STYLES,
+    COMPILED_PROMPTS,
+    STUPIDITY_LEVELS,
+    CompiledPrompt,
+    compile_prompt,
+)
+
+# Rough BPE-style estimate: words and punctuation marks
+TOKEN_PATTERN = re.compile(r"\w+|[^\w\s]")
+
+SAMPLE_AMOUNT = "$2500"
+SAMPLE_TIMELINE = 30
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the token count of a text offline."""
+    return len(TOKEN_PATTERN.findall(text))
+
+
+def bedrock_token_counter(model_id: str, region: str) -> Callable[[str], int]:
+    """Build a token counter backed by the Bedrock CountTokens API.
+
+    Args:
+        model_id: Bedrock model ID that supports CountTokens
+        region: AWS region
+
+    Returns:
+        Function returning the input token count of a text
+    """
+    import boto3
+
+    client = boto3.client("bedrock-runtime", region_name=region)
+
+    def count(text: str) -> int:
+        response = client.count_tokens(
+            modelId=model_id,
+            input={"converse": {"messages": [{"role": "user", "content": [{"text": text}]}]}}
+        )
+        return int(response["inputTokens"])
+
+    return count
+
+
+def prompt_tokens(compiled: CompiledPrompt, count: Callable[[str], int]) -> Dict[str, int]:
+    """Count the system and user prompt tokens of a compiled prompt."""
+    system = count(compiled.system_prompt)
+    user = count(compiled.render(SAMPLE_AMOUNT, SAMPLE_TIMELINE))
+    return {"system": system, "user": user, "total": system + user}
+
+
+def render_time_us(compiled: CompiledPrompt, iterations: int = 10000) -> float:
+    """Average time to render the per-request user prompt, in microseconds."""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        compiled.render(SAMPLE_AMOUNT, SAMPLE_TIMELINE)
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main() -> None:
+    """Print the per-combination token report."""
+    parser = argparse.ArgumentParser(description="Token-count report for the compiled prompts")
+    parser.add_argument("--bedrock", action="store_true", help="Count tokens with the Bedrock CountTokens API")
+    parser.add_argument("--model-id", default="anthropic.claude-3-5-haiku-20241022-v1:0", help="Model ID for --bedrock")
+    parser.add_argument("--region", default="us-east-1", help="AWS region for --bedrock")
+    args = parser.parse_args()
+
+    count = bedrock_token_counter(args.model_id, args.region) if args.bedrock else estimate_tokens
+    source = f"Bedrock CountTokens ({args.model_id})" if args.bedrock else "offline estimate"
+
+    print(f"Token counts: {source}")
+    print(f"Cached base system prompt: {count(BASE_SYSTEM_PROMPT)} tokens (identical for every combination)\n")
+    print(f"{'stupidity':<18} {'architecture':<12} {'style':<10} {'generic':>8} {'compiled':>9} {'saved':>7} {'render µs':>10}")
+
+    rows: List[Dict[str, float]] = []
+    for stupidity in STUPIDITY_LEVELS:
+        for architecture in ARCHITECTURES:
+            for burning_style in BURNING_STYLES:
+                compiled = COMPILED_PROMPTS[(stupidity, architecture, burning_style)]
+                generic = prompt_tokens(compile_prompt(stupidity, architecture, burning_style, specialize=False), count)
+                specialized = prompt_tokens(compiled, count)
+                saved = 1 - specialized["total"] / generic["total"]
+                render_us = render_time_us(compiled)
+                rows.append({"generic": generic["total"], "compiled": specialized["total"], "saved": saved})
+                print(
+                    f"{stupidity:<18} {architecture:<12} {burning_style:<10} "
+                    f"{generic['total']:>8} {specialized['total']:>9} {saved:>6.1%} {render_us:>10.2f}"
+                )
+
+    generic_mean = sum(row["generic"] for row in rows) / len(rows)
+    compiled_mean = sum(row["compiled"] for row in rows) / len(rows)
+    print(
+        f"\nMean over {len(rows)} combinations: {generic_mean:.0f} -> {compiled_mean:.0f} tokens "
+        f"({1 - compiled_mean / generic_mean:.1%} fewer)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""Premium roast task: the agent roasts a burn plan that is already stored.
+
+The FastAPI Lambda asks for a premium roast by invoking the runtime with
+``task: "roast-generator"``, its roast instructions as ``prompt``, and the
+plan's ``total_amount``, ``services`` (name, total cost, waste factor) and
+``stupidity_level``. The entrypoint answers with ``roast_text`` instead of a
+spending analysis. The call is routed like an analysis, down the same model
+fallback chain, but writes a single short field.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Mapping, Tuple
+
+from agent_pool import AgentPool
+from model_router import ModelRouter, RequestFeatures, check_refusal, is_refusal, request_budget_ms
+from output_extractor import extract_structured_output
+from prompt_caching import invocation_usage, system_prompt_blocks
+from schema import PremiumRoast
+
+# Payload "task" that selects the premium roast instead of a spending analysis
+ROAST_TASK = "roast-generator"
+
+ROAST_SYSTEM_PROMPT = (
+    "You are a stand-up comedian who roasts AWS bills. You are given an AWS spending plan that was "
+    "already generated: its total, its efficiency level and each service with its cost and why it was "
+    "wasteful. Write one roast of the whole plan. Call out the specific services and their costs, "
+    "stay technically accurate about AWS, and never invent services that are not in the plan."
+)
+
+# Used when the caller sends no instructions of its own
+DEFAULT_ROAST_INSTRUCTIONS = (
+    "Generate a witty roast commentary for this AWS spending. Be snarky but not mean. Compare costs "
+    "to relatable items like burritos, coffee, or Netflix."
+)
+
+
+def roast_prompt(payload: Mapping[str, Any]) -> str:
+    """User prompt for a roast: the caller's instructions, then the plan.
+
+    Args:
+        payload: Roast task payload
+
+    Returns:
+        Rendered prompt
+    """
+    lines = []
+    for service in payload.get("services") or []:
+        try:
+            cost = f"${float(service.get('total_cost') or 0):,.2f}"
+        except (TypeError, ValueError):
+            cost = str(service.get("total_cost"))
+        lines.append(f"- {service.get('service_name', 'Unknown service')}: {cost} ({service.get('waste_factor', '')})")
+
+    return (
+        f"{payload.get('prompt') or DEFAULT_ROAST_INSTRUCTIONS}\n\n"
+        f"Total spent: {payload.get('total_amount', 'unknown')}\n"
+        f"Efficiency level: {payload.get('stupidity_level', 'unknown')}\n"
+        f"Services ({len(lines)}):\n" + "\n".join(lines)
+    )
+
+
+def generate_roast(pool: AgentPool, model_id: str, prompt: str) -> Tuple[PremiumRoast, Dict[str, int]]:
+    """Write a roast in one structured-output call on a pooled agent.
+
+    Args:
+        pool: Agent pool
+        model_id: Bedrock model ID
+        prompt: Rendered roast prompt
+
+    Returns:
+        Roast and the token usage of the call
+
+    Raises:
+        ContentFilteredError: If the response was blocked by content filters
+        StructuredOutputError: If the response holds no roast
+    """
+    with pool.checkout(model_id) as agent:
+        agent.system_prompt = system_prompt_blocks(ROAST_SYSTEM_PROMPT)
+        result = agent(prompt, structured_output_model=PremiumRoast)
+    check_refusal(result)
+    return extract_structured_output(result, PremiumRoast), invocation_usage(result)
+
+
+def run_roast_task(payload: Mapping[str, Any], pool: AgentPool, router: ModelRouter) -> Dict[str, Any]:
+    """Handle a roast task payload.
+
+    Args:
+        payload: Roast task payload (see module docstring); may pin model_id
+        pool: Agent pool
+        router: Model router
+
+    Returns:
+        Dictionary with roast_text, token usage and the routing decision, or a
+        content_filtered error if every model in the chain refused
+    """
+    prompt = roast_prompt(payload)
+    features = RequestFeatures.from_request(payload.get("total_amount", ""), 0, payload.get("stupidity_level", ""))
+    decision = router.route(features, payload.get("model_id"), request_budget_ms(payload))
+    try:
+        roast, usage = router.run(decision, lambda routed_model_id: generate_roast(pool, routed_model_id, prompt))
+    except Exception as e:
+        if not is_refusal(e):
+            raise
+        return {
+            "status": "error",
+            "error": "content_filtered",
+            "message": "The roast was blocked by content filters.",
+            "routing": decision.metadata()
+        }
+
+    return {
+        "roast_text": roast.roast_text,
+        "usage": usage,
+        "status": "success",
+        "routing": decision.metadata()
+    }
@@ -0,0 +1,143 @@
+"""Process-wide registry of pooled boto3 clients.
+
+Creating a boto3 client costs tens to hundreds of milliseconds of CPU and throws
+away any warm TLS connections, so Lambda code should build each client once per
+container and reuse it across invocations. Clients are created lazily on first
+use, guarded by a lock, and configured with a tuned botocore ``Config`` per
+service (connection pool size, TCP keep-alive, connect/read timeouts, retries).
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+# Per-service botocore Config settings; overridable per call via get_client(**overrides)
+SERVICE_CONFIGS: Dict[str, Dict[str, Any]] = {
+    "bedrock-agentcore": {
+        "connect_timeout": int(os.environ.get("AGENTCORE_CONNECT_TIMEOUT", "5")),
+        "read_timeout": int(os.environ.get("AGENTCORE_READ_TIMEOUT", "30")),
+        "max_pool_connections": int(os.environ.get("AGENTCORE_MAX_CONCURRENCY", "16")),
+        "tcp_keepalive": True,
+        # AgentCoreClient owns retry policy for agent invocations
+        "retries": {"mode": "standard", "max_attempts": 1},
+    },
+    "dynamodb": {
+        "connect_timeout": 2,
+        "read_timeout": 5,
+        "max_pool_connections": 25,
+        "tcp_keepalive": True,
+        "retries": {"mode": "standard", "max_attempts": 3},
+    },
+    "s3": {
+        "connect_timeout": 3,
+        "read_timeout": 15,
+        "max_pool_connections": 10,
+        "tcp_keepalive": True,
+        "retries": {"mode": "standard", "max_attempts": 3},
+    },
+}
+
+_session = None
+_clients: Dict[Tuple[Any, ...], Any] = {}
+_generation = 0
+_lock = threading.Lock()
+_thread_local = threading.local()
+
+
+def _cache_key(service_name: str, region_name: Optional[str], overrides: Dict[str, Any]) -> Tuple[Any, ...]:
+    """Build a hashable registry key for a client configuration."""
+    return (service_name, region_name, tuple(sorted((k, repr(v)) for k, v in overrides.items())))
+
+
+def _build_config(service_name: str, overrides: Dict[str, Any]):
+    """Build the botocore Config for a service."""
+    from botocore.config import Config
+
+    settings = {**SERVICE_CONFIGS.get(service_name, {}), **overrides}
+    return Config(**settings)
+
+
+def _get_session():
+    """Return the shared boto3 session (caller must hold _lock)."""
+    global _session
+    if _session is None:
+        import boto3
+
+        _session = boto3.session.Session()
+    return _session
+
+
+def get_client(service_name: str, region_name: Optional[str] = None, **config_overrides: Any) -> Any:
+    """Get the shared boto3 client for a service, creating it on first use.
+
+    boto3 clients are thread-safe, so one instance per configuration is shared
+    by every request handled in this process.
+
+    Args:
+        service_name: boto3 service name (e.g., 'dynamodb', 's3')
+        region_name: AWS region (defaults to the session's region)
+        **config_overrides: botocore Config settings that replace the service defaults
+
+    Returns:
+        boto3 client
+    """
+    key = _cache_key(service_name, region_name, config_overrides)
+    client = _clients.get(key)
+    if client is not None:
+        return client
+
+    with _lock:
+        client = _clients.get(key)
+        if client is None:
+            client = _get_session().client(
+                service_name,
+                region_name=region_name,
+                config=_build_config(service_name, config_overrides)
+            )
+            _clients[key] = client
+    return client
+
+
+def get_resource(service_name: str, region_name: Optional[str] = None, **config_overrides: Any) -> Any:
+    """Get a boto3 resource for a service, cached per thread.
+
+    boto3 resources are not thread-safe, so each worker thread keeps its own
+    instance. Threadpool threads live for the whole container, so warm
+    invocations still skip construction.
+
+    Args:
+        service_name: boto3 service name (e.g., 'dynamodb')
+        region_name: AWS region (defaults to the session's region)
+        **config_overrides: botocore Config settings that replace the service defaults
+
+    Returns:
+        boto3 service resource
+    """
+    resources = getattr(_thread_local, "resources", None)
+    if resources is None or getattr(_thread_local, "generation", None) != _generation:
+        resources = _thread_local.resources = {}
+        _thread_local.generation = _generation
+
+    key = _cache_key(service_name, region_name, config_overrides)
+    resource = resources.get(key)
+    if resource is None:
+        with _lock:
+            session = _get_session()
+            resource = session.resource(
+                service_name,
+                region_name=region_name,
+                config=_build_config(service_name, config_overrides)
+            )
+        resources[key] = resource
+    return resource
+
+
+def reset_clients() -> None:
+    """Drop all cached clients and resources (for tests and benchmarks)."""
+    global _session, _generation
+    with _lock:
+        _clients.clear()
+        _session = None
+        _generation += 1
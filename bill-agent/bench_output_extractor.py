@@ -0,0 +1,102 @@
+"""Benchmark structured output extraction on large recorded responses.
+
+Builds text responses from the recorded analysis in spending_analysis.json,
+replicating its services to realistic and oversized plans, in the shapes
+models answer with when they skip the output tool (bare JSON, a fenced
+block, prose before a fenced block). For each, compares:
+  * legacy: strip the fences by prefix/suffix, json.loads into a dict, then
+    SpendingAnalysis(**data) (fails outright on leading prose)
+  * extractor: locate the JSON span and model_validate_json it in one pass
+
+Usage:
+    python bench_output_extractor.py [--services 5 50 500] [--repeat 200]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+from output_extractor import parse_output_text
+from schema import SpendingAnalysis
+
+RECORDED_RESPONSE = Path(__file__).with_name("spending_analysis.json")
+
+
+def recorded_analysis(num_services: int) -> Dict[str, Any]:
+    """The recorded analysis with its services replicated to num_services."""
+    data = json.loads(RECORDED_RESPONSE.read_text())
+    # Recorded before these fields were added to the schema
+    data.setdefault("architecture_type", "kubernetes")
+    data.setdefault("burning_style", "horizontal")
+    data.setdefault("roast", "Fifty memory-optimized nodes to serve one microservice.")
+    services = data["services_deployed"]
+    for service in services:
+        service.setdefault("roast", f"{service['quantity']} × {service['instance_type']}, zero users.")
+    data["services_deployed"] = [dict(services[i % len(services)]) for i in range(num_services)]
+    return data
+
+
+def response_shapes(data: Dict[str, Any]) -> Dict[str, str]:
+    """Text responses holding the analysis, keyed by shape."""
+    body = json.dumps(data, indent=2)
+    return {
+        "bare": body,
+        "fenced": f"```json\n{body}\n```",
+        "prose + fenced": f"Here is the spending analysis you asked for:\n\n```json\n{body}\n```\n",
+    }
+
+
+def legacy_parse(text: str) -> SpendingAnalysis:
+    """The fallback parsing the entry points used before the shared extractor."""
+    text = text.strip()
+    if text.startswith("```json"):
+        text = text[7:]
+    if text.startswith("```"):
+        text = text[3:]
+    if text.endswith("```"):
+        text = text[:-3]
+    data = json.loads(text.strip())
+    return SpendingAnalysis(**data)
+
+
+def extractor_parse(text: str) -> SpendingAnalysis:
+    return parse_output_text(text, SpendingAnalysis)
+
+
+def time_parser(parse: Callable[[str], SpendingAnalysis], text: str, repeat: int) -> float:
+    """Mean milliseconds per parse, or NaN if the parser rejects the text."""
+    try:
+        parse(text)
+    except ValueError:
+        return float("nan")
+    start = time.perf_counter()
+    for _ in range(repeat):
+        parse(text)
+    return (time.perf_counter() - start) * 1000 / repeat
+
+
+def main(argv: List[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--services", type=int, nargs="+", default=[5, 50, 500])
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args(argv)
+
+    print(f"{'services':>8}  {'shape':<16}{'size':>10}  {'legacy ms':>10}  {'extractor ms':>12}  {'speedup':>7}")
+    for num_services in args.services:
+        for shape, text in response_shapes(recorded_analysis(num_services)).items():
+            legacy = time_parser(legacy_parse, text, args.repeat)
+            extractor = time_parser(extractor_parse, text, args.repeat)
+            legacy_col = "fails" if legacy != legacy else f"{legacy:.3f}"
+            speedup = "-" if legacy != legacy else f"{legacy / extractor:.2f}x"
+            print(
+                f"{num_services:>8}  {shape:<16}{len(text) / 1024:>8.1f}KB  "
+                f"{legacy_col:>10}  {extractor:>12.3f}  {speedup:>7}"
+            )
+
+
+if __name__ == "__main__":
+    main()
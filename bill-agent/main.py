@@ -13,6 +13,8 @@ import sys
 from typing import Any
 
 from money_spender_aws_agent import create_money_spender_agent, format_spending_analysis
+from output_extractor import extract_structured_output
+from prompt_compiler import get_prompt
 from schema import SpendingAnalysis
 
 
@@ -194,52 +196,7 @@ def create_prompt(amount: str, timeline: int, stupidity_level: str, architecture
     Returns:
         Formatted prompt string
     """
-    prompt = f"""
-
-CRITICAL: You must analyze exactly {amount} in spending over {timeline} days.
-
-Analyze this AWS spending scenario. Based on the "{stupidity_level}" efficiency level, 
-"{architecture}" architecture type, and "{burning_style}" burning style, determine what 
-over-provisioned and over-engineered AWS resources were likely deployed over the {timeline} 
-day period that would result in EXACTLY {amount} in total costs.
-
-ARCHITECTURE TYPE REQUIREMENTS:
-- **serverless**: Focus on Lambda, API Gateway, DynamoDB, Step Functions, EventBridge, SQS, SNS, AppSync, Cognito
-- **kubernetes**: Focus on EKS, ECR, container instances, load balancers, persistent volumes, service mesh
-- **traditional**: Focus on EC2, RDS, EBS, ELB, Auto Scaling, VPC components, classic infrastructure
-- **mixed**: Combine services from all architecture types in a chaotic over-engineered mess
-
-BURNING STYLE REQUIREMENTS:
-- **horizontal**: Spread spending regularly across the entire {timeline} day timeline. Services run continuously 
-  or with consistent patterns. Most services should have start_day=0 and end_day={timeline} or -1.
-- **vertical**: Create burst spending patterns with services spinning up and down at different times. 
-  Use varied start_day and end_day values to show one-shot expensive operations or short-lived resources 
-  that burn money quickly then shut down.
-
-Provide a detailed forensic analysis including:
-
-1. **Services Deployed**: Identify the AWS services that would result in this spending level. 
-   Match the service complexity to the efficiency level provided.
-
-2. **Resource Configurations**: Specify the exact resource types, instance sizes, quantities, 
-   storage amounts, and configurations that would generate this cost.
-
-3. **Cost Breakdown**: Show how the {amount} is distributed across different services over {timeline} days. 
-   Include specific instance types, quantities, start day, end day, duration used, and realistic AWS pricing calculations.
-   IMPORTANT: The total_calculated_cost must closely match {amount} (within 10% variance).
-
-4. **Deployment Scenario**: Describe the likely use case and explain why these particular 
-   resources might have been chosen (over-engineering, lack of optimization, following 
-   tutorials without adaptation, etc.).
-
-5. **Efficiency Level Interpretation**:
-   - Mildly dumb: Minor over-provisioning, forgotten test resources, basic optimization mistakes
-   - Moderately stupid: Significant redundancy, expensive instances for simple workloads, poor architecture choices
-   - Very stupid: Extreme over-engineering, multi-region for simple apps, massive over-provisioning
-   - Brain damage: Maximum over-engineering with obscure/specialized services for basic needs
-
-Include specific AWS service names, instance types, quantities, and realistic pricing. 
-Be technically accurate and detailed in your cost calculations."""
+    prompt = get_prompt(stupidity_level, architecture, burning_style).render(amount, timeline)
 
     return prompt
 
@@ -269,53 +226,20 @@ def main():
         print(f"❌ Error initializing agent: {e}", file=sys.stderr)
         sys.exit(1)
 
-    # Create prompt
+    # Create prompt, with only the system guidance for this configuration
     prompt = create_prompt(amount, timeline, stupidity, architecture, burning_style)
+    agent.system_prompt = get_prompt(stupidity, architecture, burning_style).system_blocks
 
     # Invoke the agent
     try:
         # Invoke agent with structured output model
         result = agent(prompt, structured_output_model=SpendingAnalysis)
 
-        # Extract structured output from result
-        # Try different possible attributes
-        if hasattr(result, "structured_output"):
-            analysis: SpendingAnalysis = result.structured_output
-        elif hasattr(result, "data"):
-            analysis: SpendingAnalysis = result.data
-        else:
-            # Parse from message content
-            message = getattr(result, "message", {})
-            content = message.get("content") if isinstance(message, dict) else []
-            
-            # Find the text content
-            text_content = None
-            if isinstance(content, list):
-                for block in content:
-                    if isinstance(block, dict) and "text" in block:
-                        text_content = block["text"]
-                        break
-            
-            if text_content:
-                # Try to parse JSON from the text
-                try:
-                    # Remove markdown code blocks if present
-                    text_content = text_content.strip()
-                    if text_content.startswith("```json"):
-                        text_content = text_content[7:]
-                    if text_content.startswith("```"):
-                        text_content = text_content[3:]
-                    if text_content.endswith("```"):
-                        text_content = text_content[:-3]
-                    
-                    data = json.loads(text_content.strip())
-                    analysis = SpendingAnalysis(**data)
-                except (json.JSONDecodeError, Exception) as e:
-                    print(f"❌ Error parsing structured output: {e}", file=sys.stderr)
-                    sys.exit(1)
-            else:
-                print(f"❌ Could not find structured output in result", file=sys.stderr)
-                sys.exit(1)
+        try:
+            analysis = extract_structured_output(result, SpendingAnalysis)
+        except ValueError as e:
+            print(f"❌ Error parsing structured output: {e}", file=sys.stderr)
+            sys.exit(1)
 
         # Output only JSON
         print(json.dumps(analysis.model_dump(), indent=2))
@@ -0,0 +1,227 @@
+"""Local pricing tools for the Money Spender agent.
+
+Without tools the model recalls AWS prices from memory and multiplies
+hourly rate × 24 × days × quantity in its own reasoning: slow, token-heavy
+and often wrong. These tools run in-process instead:
+
+- ``lookup_price`` reads an offline price catalog (``price_catalog.json``,
+  shipped with the agent) indexed once at import
+- ``calculate_cost`` does the cost arithmetic for one service
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from strands import tool
+
+# Set to false to run the agent without tools
+PRICING_TOOLS_ENABLED = os.getenv("MONEY_SPENDER_PRICING_TOOLS", "true").lower() in ("1", "true", "yes")
+
+PRICE_CATALOG_PATH = Path(os.getenv("MONEY_SPENDER_PRICE_CATALOG", Path(__file__).with_name("price_catalog.json")))
+
+# Entries listed when a lookup misses
+MAX_SUGGESTIONS = 12
+
+# Appended to the cached system prompt when the tools are registered
+PRICING_TOOLS_GUIDANCE = (
+    "\n\n"
+    "PRICING TOOLS:\n"
+    "- Call lookup_price(service, instance_type) for unit prices instead of recalling them; "
+    "call it with an empty instance_type to list what the catalog has for a service\n"
+    "- Call calculate_cost(unit_price, unit, quantity, start_day, end_day, timeline_days) for every "
+    "service's total_cost instead of multiplying yourself\n"
+    "- Request the prices and costs for all services in the same turn, not one service per turn\n"
+    "- Copy unit_cost and total_cost from the tool results verbatim"
+)
+
+
+class PriceEntry(NamedTuple):
+    """A catalog price."""
+
+    service: str
+    instance_type: str
+    price: float
+    unit: str
+
+
+def _key(name: str) -> str:
+    """Normalize a service or instance type name for lookups."""
+    name = " ".join(name.lower().replace("_", " ").split())
+    for prefix in ("amazon ", "aws "):
+        if name.startswith(prefix):
+            name = name[len(prefix):]
+    return name
+
+
+class PriceCatalog:
+    """Offline price catalog indexed by service and instance type."""
+
+    def __init__(self, data: Dict[str, Any]):
+        """Index a catalog.
+
+        Args:
+            data: Parsed price_catalog.json
+        """
+        self.region = data.get("region", "us-east-1")
+        self.currency = data.get("currency", "USD")
+        self._services: Dict[str, str] = {}
+        self._entries: Dict[Tuple[str, str], PriceEntry] = {}
+        self._by_service: Dict[str, List[PriceEntry]] = {}
+        self._by_type: Dict[str, List[PriceEntry]] = {}
+
+        for service, spec in data["services"].items():
+            for name in [service, *spec.get("aliases", [])]:
+                self._services[_key(name)] = service
+            for instance_type, (price, unit) in spec["prices"].items():
+                entry = PriceEntry(service, instance_type, float(price), unit)
+                self._entries[(service, _key(instance_type))] = entry
+                self._by_service.setdefault(service, []).append(entry)
+                self._by_type.setdefault(_key(instance_type), []).append(entry)
+
+    @classmethod
+    def load(cls, path: Path = PRICE_CATALOG_PATH) -> "PriceCatalog":
+        """Load and index a catalog file."""
+        with open(path, encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    def service(self, name: str) -> Optional[str]:
+        """Canonical catalog service name for a service name or alias.
+
+        Names that are not an alias resolve through the longest alias they
+        contain as whole words ("RDS for PostgreSQL" -> RDS).
+        """
+        key = _key(name)
+        canonical = self._services.get(key)
+        if canonical is not None:
+            return canonical
+        padded = f" {key} "
+        contained = [alias for alias in self._services if f" {alias} " in padded]
+        return self._services[max(contained, key=len)] if contained else None
+
+    def lookup(self, service: str, instance_type: str) -> Optional[PriceEntry]:
+        """Find the price of an instance type, by service first, then by instance type alone.
+
+        Args:
+            service: Service name or alias
+            instance_type: Instance type or configuration
+
+        Returns:
+            Matching entry, or None
+        """
+        canonical = self.service(service)
+        type_key = _key(instance_type)
+        if canonical is not None:
+            entry = self._entries.get((canonical, type_key))
+            if entry is not None:
+                return entry
+        # Instance types like "db.r6g.large" identify the service on their own
+        candidates = self._by_type.get(type_key, [])
+        return candidates[0] if len(candidates) == 1 else None
+
+    def entries(self, service: str) -> List[PriceEntry]:
+        """All entries of a service (empty if the service is unknown)."""
+        canonical = self.service(service)
+        return list(self._by_service.get(canonical, [])) if canonical else []
+
+    @property
+    def services(self) -> List[str]:
+        """Canonical service names."""
+        return list(self._by_service)
+
+
+CATALOG = PriceCatalog.load()
+
+
+def _entry_dict(entry: PriceEntry) -> Dict[str, Any]:
+    return {
+        "service": entry.service,
+        "instance_type": entry.instance_type,
+        "unit_price": entry.price,
+        "unit": entry.unit
+    }
+
+
+def billed_units(unit: str, quantity: float, days: int, hours_per_day: float = 24) -> float:
+    """Number of billed units for a quantity of resources running for some days.
+
+    Args:
+        unit: Catalog unit ("hour", "GB-month", "million requests", ...)
+        quantity: Resources (instances, GB, ...) for time-based units, or
+            total usage (requests in millions, GB transferred, ...) otherwise
+        days: Days the resources run
+        hours_per_day: Hours per day the resources run (time-based units)
+
+    Returns:
+        Units to multiply the unit price by
+    """
+    if unit == "hour":
+        return quantity * hours_per_day * days
+    if unit == "day":
+        return quantity * days
+    if unit.endswith("month"):
+        return quantity * days / 30
+    return quantity
+
+
+@tool
+def lookup_price(service: str, instance_type: str = "") -> Dict[str, Any]:
+    """Look up the on-demand us-east-1 price of an AWS resource in the offline catalog.
+
+    Args:
+        service: AWS service name (e.g., "EC2", "RDS", "SageMaker", "S3")
+        instance_type: Instance type or configuration (e.g., "r7g.16xlarge",
+            "standard storage"); leave empty to list the service's entries
+    """
+    entry = CATALOG.lookup(service, instance_type) if instance_type else None
+    if entry is not None:
+        return {"found": True, **_entry_dict(entry)}
+
+    entries = CATALOG.entries(service)
+    if entries:
+        return {
+            "found": False,
+            "service": entries[0].service,
+            "available": [_entry_dict(e) for e in entries[:MAX_SUGGESTIONS]]
+        }
+    return {"found": False, "services": CATALOG.services}
+
+
+@tool
+def calculate_cost(
+    unit_price: float,
+    unit: str = "hour",
+    quantity: float = 1,
+    start_day: int = 0,
+    end_day: int = -1,
+    timeline_days: int = 30,
+    hours_per_day: float = 24
+) -> Dict[str, Any]:
+    """Calculate the total cost of one service over its active days.
+
+    Args:
+        unit_price: Price per unit from lookup_price
+        unit: Unit from lookup_price ("hour", "GB-month", "million requests", ...)
+        quantity: Instances or GB for time-based units; total usage (millions
+            of requests, GB transferred, ...) for usage-based units
+        start_day: Day the service starts (0-based)
+        end_day: Day the service stops (-1 for the end of the timeline)
+        timeline_days: Timeline in days
+        hours_per_day: Hours per day the service runs (hourly units)
+    """
+    end = timeline_days if end_day < 0 or end_day > timeline_days else end_day
+    start = min(max(start_day, 0), end)
+    days = end - start
+    units = billed_units(unit, quantity, days, hours_per_day)
+    return {
+        "unit_cost": unit_price,
+        "days": days,
+        "billed_units": round(units, 4),
+        "total_cost": round(unit_price * units, 2)
+    }
+
+
+PRICING_TOOLS = [lookup_price, calculate_cost]
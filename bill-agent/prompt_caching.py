@@ -0,0 +1,62 @@
+"""Bedrock prompt caching for the static system prompt.
+
+The system prompt is several kilobytes of guidelines that never change between
+requests. Sent as content blocks with a Bedrock cache point after it, the
+model reads it from the prompt cache instead of re-processing it, which cuts
+time to first token and bills those tokens at the cache-read rate. Only
+request-specific text (amount, timeline, ...) goes after the cache point or
+in the user message, so the cached prefix stays byte-identical across requests.
+"""
+
+from __future__ import annotations
+
+import os
+from typing import Any, Dict, List
+
+# Set to false for models without prompt caching support
+PROMPT_CACHE_ENABLED = os.getenv("MONEY_SPENDER_PROMPT_CACHE", "true").lower() in ("1", "true", "yes")
+
+CACHE_POINT: Dict[str, Any] = {"cachePoint": {"type": "default"}}
+
+# Token counts reported per invocation
+USAGE_KEYS = ("inputTokens", "outputTokens", "totalTokens", "cacheReadInputTokens", "cacheWriteInputTokens")
+
+
+def system_prompt_blocks(
+    static_prompt: str,
+    dynamic_prompt: str = "",
+    cache: bool = PROMPT_CACHE_ENABLED
+) -> List[Dict[str, Any]]:
+    """Build system prompt content blocks with a cache point after the static prefix.
+
+    Args:
+        static_prompt: Text identical for every request (cached)
+        dynamic_prompt: Request-specific text placed after the cache point
+        cache: Whether to insert the cache point
+
+    Returns:
+        System content blocks for the Strands Agent
+    """
+    blocks: List[Dict[str, Any]] = [{"text": static_prompt}]
+    if cache:
+        blocks.append(dict(CACHE_POINT))
+    if dynamic_prompt:
+        blocks.append({"text": dynamic_prompt})
+    return blocks
+
+
+def invocation_usage(result: Any) -> Dict[str, int]:
+    """Token usage of an agent invocation, including prompt cache reads and writes.
+
+    Pooled agents have their metrics reset between invocations, so the
+    accumulated usage is that of this invocation alone.
+
+    Args:
+        result: AgentResult returned by the agent call
+
+    Returns:
+        Token counts keyed by USAGE_KEYS (0 when not reported)
+    """
+    metrics = getattr(result, "metrics", None)
+    usage = getattr(metrics, "accumulated_usage", None) or {}
+    return {key: int(usage.get(key, 0)) for key in USAGE_KEYS}
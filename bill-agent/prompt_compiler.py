@@ -0,0 +1,305 @@
+"""Prompt compiler: prompts specialized per burn configuration.
+
+The generic prompts carry guidance for all four efficiency levels, all four
+architecture types and both burning styles, although a request only uses one
+of each. The compiler assembles just the sections a configuration needs. All
+32 (stupidity, architecture, burning_style) variants are compiled at import,
+so a request only looks its variant up and fills in the amount and timeline.
+
+The system prompt is split into a base shared by every variant, which stays
+byte-stable in front of the Bedrock cache point (see prompt_caching), and the
+variant's efficiency-level guidance after it.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Mapping, NamedTuple, Tuple
+
+from prompt_caching import system_prompt_blocks
+from pricing_tools import PRICING_TOOLS_ENABLED, PRICING_TOOLS_GUIDANCE
+
+STUPIDITY_LEVELS = ("Mildly dumb", "Moderately stupid", "Very stupid", "Brain damage")
+ARCHITECTURES = ("serverless", "kubernetes", "traditional", "mixed")
+BURNING_STYLES = ("horizontal", "vertical")
+
+DEFAULT_STUPIDITY = "Moderately stupid"
+DEFAULT_ARCHITECTURE = "mixed"
+DEFAULT_BURNING_STYLE = "horizontal"
+
+# Shared by every variant: everything but the efficiency level guidelines
+BASE_SYSTEM_PROMPT = (
+    "You are an AWS Cloud Cost Forensics Agent. Your job is to reverse-engineer "
+    "what over-provisioned and over-engineered AWS resources were likely spun up to result in a given spending amount. "
+    "Be creative while staying technically accurate about AWS services and pricing.\n"
+    "\n"
+    "When given parameters:\n"
+    "- Amount spent ($)\n"
+    "- Efficiency level (Mildly dumb → Brain damage)\n"
+    "\n"
+    "Provide a forensic analysis with:\n"
+    "1. **Likely Services Used**: Identify combinations of AWS services based on the efficiency level\n"
+    "2. **Resource Configurations**: Reverse-engineer the wasteful configurations\n"
+    "3. **Cost Breakdown**: Show how the spending occurred across services\n"
+    "4. **The Scenario**: Describe what likely happened and why these choices were made\n"
+    "\n"
+    "Include specific instance types, quantities, and realistic AWS pricing. Mix obscure services "
+    "with common ones based on the efficiency level. Explain the likely reasoning behind these choices "
+    "(over-engineering, lack of cost awareness, misunderstanding requirements, or following tutorials "
+    "without understanding the use case).\n"
+    "\n"
+    "Your response will be structured as JSON with the following schema:\n"
+    "- total_amount: STRING - The spending amount provided (e.g., '$1500')\n"
+    "- timeline_days: INTEGER - The timeline period in days (e.g., 30, 14, 60)\n"
+    "- efficiency_level: STRING - The efficiency level provided\n"
+    "- architecture_type: STRING - The architecture type (serverless/kubernetes/traditional/mixed)\n"
+    "- burning_style: STRING - The burning style (horizontal/vertical)\n"
+    "- services_deployed: ARRAY of objects, each with:\n"
+    "  - service_name: STRING - AWS service name (e.g., 'EC2', 'RDS', 'S3')\n"
+    "  - instance_type: STRING - Instance type or config (e.g., 'r7g.16xlarge', 'Standard Storage')\n"
+    "  - quantity: INTEGER - Number of instances/resources (default 1)\n"
+    "  - unit_cost: FLOAT - Cost per unit in dollars\n"
+    "  - total_cost: FLOAT - Total cost for this service in dollars\n"
+    "  - start_day: INTEGER - Day number when service started (0 = Day 0, 1 = Day 1, etc.)\n"
+    "  - end_day: INTEGER - Day number when service stopped (-1 = end of timeline)\n"
+    "  - duration_used: STRING - How long the service ran (e.g., '30 days', '15 days', 'entire timeline')\n"
+    "  - usage_pattern: STRING - How it's used (e.g., 'Running 24/7', 'Intermittent')\n"
+    "  - waste_factor: STRING - Why it's wasteful\n"
+    "  - roast: STRING - A brutal, creative one or two-liner roast specifically for THIS service's wasteful usage. "
+    "CRITICAL: Each service roast MUST be unique and different. Use varied insults, metaphors, and humor. "
+    "Don't repeat the same joke pattern. Examples: 'Using CloudFront for internal apps? That's like hiring a "
+    "limo to drive to your bathroom.', 'Running EKS for a single container? Congratulations, you've built a "
+    "747 to deliver a pizza.', 'S3 Glacier with constant retrievals? You've invented the world's most expensive "
+    "filing cabinet.'\n"
+    "- total_calculated_cost: FLOAT - Sum of all service costs in dollars\n"
+    "- deployment_scenario: STRING - Detailed narrative of what happened\n"
+    "- key_mistakes: ARRAY of STRINGS - 3-5 key mistakes\n"
+    "- recommendations: ARRAY of STRINGS - 3-5 recommendations\n"
+    "- roast: STRING - A brutal, savage, and absolutely merciless roast of the wasteful spending. "
+    "Be creative, funny, and ruthlessly call out the absurdity of these choices. Don't hold back - "
+    "this should be a devastating burn that makes the reader question their life choices.\n"
+    "\n"
+    "CRITICAL REQUIREMENTS:\n"
+    "1. The total_calculated_cost MUST EXACTLY match the total_amount provided - this is your PRIMARY goal\n"
+    "2. Calculate costs carefully: hourly_rate × 24 hours × days_running × quantity = total_cost\n"
+    "3. Adjust service quantities, instance types, and durations to hit the EXACT target amount\n"
+    "4. All services_deployed objects MUST have ALL required fields including instance_type, quantity, "
+    "start_day (INTEGER), end_day (INTEGER), and duration_used\n"
+    "5. Use realistic AWS pricing but scale quantities/durations to match the target amount\n"
+    "6. Day numbers must be between 0 and timeline_days, or -1 for end of timeline\n"
+    "\n"
+    "SCALING EXAMPLES FOR LARGE AMOUNTS:\n"
+    "- For $100K+: Use multiple expensive instances (r7g.16xlarge, ml.p4d.24xlarge), high quantities (20-50 instances), "
+    "or long durations (entire timeline)\n"
+    "- For $500K+: Combine expensive compute (EKS with 100+ nodes), premium databases (db.r6g.16xlarge × 10), "
+    "multi-region deployments, and obscure services\n"
+    "- For $1M+: Maximum waste - hundreds of instances, most expensive instance types, obscure services running "
+    "continuously, multi-region everything, premium support, massive data transfer costs\n"
+    "\n"
+    "COST CALCULATION TIPS:\n"
+    "- EC2 r7g.16xlarge: $3.4272/hr × 24 × 30 days × 10 instances = $24,675.84\n"
+    "- SageMaker ml.p4d.24xlarge: $37.688/hr × 24 × 30 days = $27,135.36 per instance\n"
+    "- EKS cluster: $0.10/hr + (node_cost × node_count × hours)\n"
+    "- Always verify your math: sum all service costs to ensure they equal the target amount"
+)
+
+if PRICING_TOOLS_ENABLED:
+    BASE_SYSTEM_PROMPT += PRICING_TOOLS_GUIDANCE
+
+EFFICIENCY_GUIDELINES: Dict[str, str] = {
+    "Mildly dumb": (
+        "**Mildly dumb** - Rookie mistakes and minor over-provisioning:\n"
+        "- Over-provisioned EC2 instances (t3.2xlarge for a static website)\n"
+        "- Forgot to delete test resources after development\n"
+        "- Running RDS databases 24/7 for development environments\n"
+        "- Unnecessary data transfer between regions\n"
+        "- NAT Gateways left running when not needed\n"
+        "- Not using Reserved Instances or Savings Plans\n"
+    ),
+    "Moderately stupid": (
+        "**Moderately stupid** - Significant over-provisioning and wasteful patterns:\n"
+        "- Multiple redundant databases (RDS, DynamoDB, DocumentDB for the same data)\n"
+        "- Expensive instance types for trivial workloads (r7g.16xlarge for a cron job)\n"
+        "- Storing logs in S3 Glacier Instant Retrieval then retrieving constantly\n"
+        "- Running SageMaker notebooks 24/7 with large ml instances\n"
+        "- Using AWS Transfer Family for SFTP when S3 would suffice\n"
+        "- Provisioned IOPS on all storage without need\n"
+        "- Running CloudFront for internal-only applications\n"
+    ),
+    "Very stupid": (
+        "**Very stupid** - Extreme over-engineering and architectural disasters:\n"
+        "- Multi-region active-active setup for a personal blog\n"
+        "- Running EKS with 50 nodes for a single microservice\n"
+        "- Using AWS Outposts for a cloud-native application\n"
+        "- Managed Blockchain for a simple todo list application\n"
+        "- Multiple VPN connections, Direct Connect, and Transit Gateway for a simple app\n"
+        "- Running EMR clusters 24/7 with no data processing\n"
+        "- Using AWS Wavelength for an internal admin panel\n"
+        "- Storing everything in S3 Glacier then using S3 Select constantly\n"
+        "- Running AWS Batch with maximum compute for minimal workloads\n"
+    ),
+    "Brain damage": (
+        "**Brain damage** - Maximum over-engineering with obscure services:\n"
+        "- Running AWS RoboMaker simulations continuously\n"
+        "- Using AWS Ground Station for basic weather data\n"
+        "- Deploying AWS Snowmobile to transfer small amounts of data\n"
+        "- Running AWS Thinkbox Deadline render farm for simple presentations\n"
+        "- Using Amazon Braket quantum computing for basic calculations\n"
+        "- Provisioning AWS Local Zones in every location\n"
+        "- Running AWS Elemental MediaLive 24/7 for static content\n"
+        "- Using Amazon Monitron IoT sensors for single device monitoring\n"
+        "- Deploying AWS Panorama appliances for basic webcam feeds\n"
+        "- Running Amazon Nimble Studio for basic image editing\n"
+        "- Using AWS Private 5G for a single IoT device\n"
+        "- Storing data in every storage class simultaneously\n"
+        "- Running AWS DeepRacer for non-ML workloads\n"
+    ),
+}
+
+ARCHITECTURE_REQUIREMENTS: Dict[str, str] = {
+    "serverless": "Focus on Lambda, API Gateway, DynamoDB, Step Functions, EventBridge, SQS, SNS, AppSync, Cognito",
+    "kubernetes": "Focus on EKS, ECR, container instances, load balancers, persistent volumes, service mesh",
+    "traditional": "Focus on EC2, RDS, EBS, ELB, Auto Scaling, VPC components, classic infrastructure",
+    "mixed": "Combine services from all architecture types in a chaotic over-engineered mess",
+}
+
+# {timeline} is filled in per request
+BURNING_STYLE_REQUIREMENTS: Dict[str, str] = {
+    "horizontal": (
+        "Spread spending regularly across the entire {timeline} day timeline. Services run continuously \n"
+        "  or with consistent patterns. Most services should have start_day=0 and end_day={timeline} or -1."
+    ),
+    "vertical": (
+        "Create burst spending patterns with services spinning up and down at different times. \n"
+        "  Use varied start_day and end_day values to show one-shot expensive operations or short-lived resources \n"
+        "  that burn money quickly then shut down."
+    ),
+}
+
+USER_PROMPT_TEMPLATE = """AWS SPENDING FORENSICS ANALYSIS
+
+💰 TOTAL AMOUNT SPENT: {amount}
+📅 TIMELINE: {timeline} days (Day 0 to Day {timeline})
+🎯 EFFICIENCY LEVEL: {stupidity}
+🏗️ ARCHITECTURE TYPE: {architecture}
+🔥 BURNING STYLE: {burning_style}
+
+CRITICAL: You must analyze exactly {amount} in spending over {timeline} days.
+
+Analyze this AWS spending scenario. Based on the "{stupidity}" efficiency level, 
+"{architecture}" architecture type, and "{burning_style}" burning style, determine what 
+over-provisioned and over-engineered AWS resources were likely deployed over the {timeline} 
+day period that would result in EXACTLY {amount} in total costs.
+
+ARCHITECTURE TYPE REQUIREMENTS:
+{architecture_requirements}
+
+BURNING STYLE REQUIREMENTS:
+{burning_style_requirements}
+
+Provide a detailed forensic analysis including all required fields."""
+
+
+class CompiledPrompt(NamedTuple):
+    """System and user prompts for one burn configuration."""
+
+    system_guidance: str
+    user_template: str
+
+    @property
+    def system_blocks(self) -> List[Dict[str, Any]]:
+        """System prompt content blocks: cached base, then this variant's guidance."""
+        return system_prompt_blocks(BASE_SYSTEM_PROMPT, self.system_guidance)
+
+    @property
+    def system_prompt(self) -> str:
+        """The whole system prompt as text."""
+        return BASE_SYSTEM_PROMPT + self.system_guidance
+
+    def render(self, amount: str, timeline: int) -> str:
+        """Fill the request-specific values into the user prompt.
+
+        Args:
+            amount: Amount spent (e.g., "$1000")
+            timeline: Timeline in days
+
+        Returns:
+            User prompt text
+        """
+        return self.user_template.replace("{amount}", str(amount)).replace("{timeline}", str(timeline))
+
+
+def _sections(requirements: Mapping[str, str], selected: str, specialize: bool) -> str:
+    """Requirement bullets for the selected key, or for every key when not specializing or unknown."""
+    keys = [selected] if specialize and selected in requirements else list(requirements)
+    return "\n".join(f"- **{key}**: {requirements[key]}" for key in keys)
+
+
+def compile_prompt(stupidity: str, architecture: str, burning_style: str, specialize: bool = True) -> CompiledPrompt:
+    """Assemble the prompts for a burn configuration.
+
+    Args:
+        stupidity: Efficiency level
+        architecture: Architecture type
+        burning_style: Burning style
+        specialize: Include only the sections for this configuration; when
+            False (or for values outside the known ones) every section is
+            included, as in the generic prompts
+
+    Returns:
+        Compiled prompt; the user template still has {amount} and {timeline}
+    """
+    levels = [stupidity] if specialize and stupidity in EFFICIENCY_GUIDELINES else list(EFFICIENCY_GUIDELINES)
+    system_guidance = "\nEFFICIENCY LEVEL GUIDELINES:\n\n" + "\n".join(EFFICIENCY_GUIDELINES[level] for level in levels)
+
+    user_template = (
+        USER_PROMPT_TEMPLATE
+        .replace("{stupidity}", stupidity)
+        .replace("{architecture}", architecture)
+        .replace("{burning_style}", burning_style)
+        .replace("{architecture_requirements}", _sections(ARCHITECTURE_REQUIREMENTS, architecture, specialize))
+        .replace("{burning_style_requirements}", _sections(BURNING_STYLE_REQUIREMENTS, burning_style, specialize))
+    )
+    return CompiledPrompt(system_guidance, user_template)
+
+
+# Every known configuration, compiled once per process
+COMPILED_PROMPTS: Dict[Tuple[str, str, str], CompiledPrompt] = {
+    (stupidity, architecture, burning_style): compile_prompt(stupidity, architecture, burning_style)
+    for stupidity in STUPIDITY_LEVELS
+    for architecture in ARCHITECTURES
+    for burning_style in BURNING_STYLES
+}
+
+
+def get_prompt(stupidity: str, architecture: str, burning_style: str) -> CompiledPrompt:
+    """Look up the compiled prompt for a configuration (compiling unknown ones on the fly).
+
+    Args:
+        stupidity: Efficiency level
+        architecture: Architecture type
+        burning_style: Burning style
+
+    Returns:
+        Compiled prompt
+    """
+    compiled = COMPILED_PROMPTS.get((stupidity, architecture, burning_style))
+    return compiled if compiled is not None else compile_prompt(stupidity, architecture, burning_style)
+
+
+def payload_config(payload: Mapping[str, Any]) -> Tuple[str, str, str]:
+    """Read (stupidity, architecture, burning_style) from an invocation payload.
+
+    The FastAPI client sends the efficiency level as ``stupidity_level``;
+    ``stupidity`` is accepted too.
+
+    Args:
+        payload: AgentCore invocation payload
+
+    Returns:
+        Efficiency level, architecture type and burning style, with defaults
+    """
+    return (
+        payload.get("stupidity") or payload.get("stupidity_level") or DEFAULT_STUPIDITY,
+        payload.get("architecture") or DEFAULT_ARCHITECTURE,
+        payload.get("burning_style") or DEFAULT_BURNING_STYLE,
+    )
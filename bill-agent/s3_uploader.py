@@ -4,9 +4,10 @@ import os
 from datetime import datetime
 from typing import Optional
 
-import boto3
 from botocore.exceptions import ClientError
 
+from aws_clients import get_client
+
 
 def upload_pdf_to_s3(
     pdf_bytes: bytes,
@@ -34,8 +35,8 @@ def upload_pdf_to_s3(
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
     filename = f"invoices/{timestamp}_aws_bill.pdf"
     
-    # Initialize S3 client
-    s3_client = boto3.client('s3')
+    # Reuse the pooled S3 client across invocations
+    s3_client = get_client('s3')
     
     try:
         # Upload PDF to S3
@@ -99,7 +100,7 @@ def create_bucket_if_not_exists(bucket_name: str, region: str = 'us-east-1') ->
     Returns:
         True if bucket exists or was created, False otherwise
     """
-    s3_client = boto3.client('s3', region_name=region)
+    s3_client = get_client('s3', region_name=region)
     
     try:
         # Check if bucket exists
@@ -7,8 +7,8 @@ from typing import List
 from pydantic import BaseModel, Field
 
 
-class ServiceCost(BaseModel):
-    """Cost breakdown for a single AWS service."""
+class ServicePlan(BaseModel):
+    """A service in the cost plan, without its roast."""
 
     service_name: str = Field(description="AWS service name (e.g., 'EC2', 'RDS', 'S3')")
     instance_type: str = Field(description="Instance type or resource configuration (e.g., 'r7g.16xlarge', 'db.r6g.large', 'Standard Storage')")
@@ -22,6 +22,11 @@ class ServiceCost(BaseModel):
     waste_factor: str = Field(
         description="Why this is wasteful (e.g., 'Over-provisioned for workload', 'Redundant service', 'Unnecessary for use case')"
     )
+
+
+class ServiceCost(ServicePlan):
+    """Cost breakdown for a single AWS service."""
+
     roast: str = Field(
         description="A brutal one or two-liner roast specifically calling out this service's wasteful usage. Be savage and funny."
     )
@@ -61,4 +66,61 @@ class SpendingAnalysis(BaseModel):
     )
 
 
+class SpendingSkeleton(BaseModel):
+    """The cost plan of a spending analysis, without its narrative sections (fan-out generation)."""
+
+    total_amount: str = Field(description="Total amount spent as a string (e.g., '$1000', '$10000')")
+    timeline_days: int = Field(description="Timeline period in days (e.g., 30, 14, 60)")
+    efficiency_level: str = Field(
+        description="Efficiency level: 'Mildly dumb', 'Moderately stupid', 'Very stupid', or 'Brain damage'"
+    )
+    architecture_type: str = Field(
+        description="Architecture type: 'serverless', 'kubernetes', 'traditional', or 'mixed'"
+    )
+    burning_style: str = Field(
+        description="Burning style: 'horizontal' (regular spending over timeline) or 'vertical' (one-shot bursts)"
+    )
+    services_deployed: List[ServicePlan] = Field(
+        description="List of AWS services that were deployed with their configurations and costs"
+    )
+    total_calculated_cost: float = Field(
+        description="Sum of all service costs in dollars (should approximately match total_amount)"
+    )
+
+
+class ScenarioSection(BaseModel):
+    """Deployment narrative of a spending analysis (fan-out generation)."""
 
+    deployment_scenario: str = Field(
+        description="Detailed narrative describing the likely use case, what happened, and why these choices were made"
+    )
+
+
+class MistakesSection(BaseModel):
+    """Mistakes and recommendations of a spending analysis (fan-out generation)."""
+
+    key_mistakes: List[str] = Field(
+        description="List of 3-5 key mistakes or poor decisions that led to this wasteful spending"
+    )
+    recommendations: List[str] = Field(
+        description="List of 3-5 specific recommendations for what should have been done instead to reduce costs"
+    )
+
+
+class RoastSection(BaseModel):
+    """Per-service and overall roasts of a spending analysis (fan-out generation)."""
+
+    service_roasts: List[str] = Field(
+        description="One brutal, unique one or two-liner roast per service, in the same order as the services"
+    )
+    roast: str = Field(
+        description="A brutal, savage, and merciless roast of the wasteful spending and terrible decisions. Be creative, funny, and absolutely ruthless in calling out the absurdity of these choices."
+    )
+
+
+class PremiumRoast(BaseModel):
+    """Roast of a stored burn plan (premium roast task)."""
+
+    roast_text: str = Field(
+        description="A witty roast of the spending, a short paragraph comparing the costs to relatable everyday purchases"
+    )
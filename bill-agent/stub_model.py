@@ -0,0 +1,148 @@
+"""Stubbed model provider shared by the offline agent tests.
+
+A StubModel answers every model call with a per-test list of Bedrock stream
+events, or with the events a per-test respond function returns for the
+request. use_stub_model swaps the module-level agent pool and model router
+of the entry points for ones building agents on the stub, and restores them
+on exit, so tests run in the same process (pytest) don't interfere:
+
+    stub = StubModel(tool_use_events([("SpendingAnalysis", analysis)]))
+    with use_stub_model(stub, ModelRouter(DEFAULT_MODEL_ID), agentcore_handler):
+        agentcore_handler.invoke(payload, context=None)
+"""
+
+from __future__ import annotations
+
+import contextlib
+import inspect
+import json
+from types import ModuleType
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+from strands.models.model import Model
+
+from agent_pool import AgentPool
+from model_router import ModelRouter
+from money_spend_aws_bill_agent import create_money_spender_agent
+
+Event = Dict[str, Any]
+
+USAGE = {"inputTokens": 100, "outputTokens": 50, "totalTokens": 150}
+BLOCKED_TEXT = "The generated text has been blocked by our content filters."
+
+
+def tool_use_events(calls: Sequence[Tuple[str, Dict[str, Any]]], usage: Optional[Dict[str, int]] = None) -> List[Event]:
+    """Stream events of a turn calling tools, such as the structured output tool.
+
+    Args:
+        calls: Tool name and input of each call, in order
+        usage: Token usage reported for the turn
+
+    Returns:
+        Stream events
+    """
+    events: List[Event] = [{"messageStart": {"role": "assistant"}}]
+    for i, (name, tool_input) in enumerate(calls):
+        events.append({"contentBlockStart": {"start": {"toolUse": {"toolUseId": f"{name}-{i}", "name": name}}}})
+        events.append({"contentBlockDelta": {"delta": {"toolUse": {"input": json.dumps(tool_input)}}}})
+        events.append({"contentBlockStop": {}})
+    events.append({"messageStop": {"stopReason": "tool_use"}})
+    events.append({"metadata": {"usage": usage or USAGE, "metrics": {"latencyMs": 1}}})
+    return events
+
+
+def blocked_events(usage: Optional[Dict[str, int]] = None) -> List[Event]:
+    """Stream events of a turn blocked by Bedrock content filters.
+
+    Args:
+        usage: Token usage reported for the turn
+
+    Returns:
+        Stream events
+    """
+    return [
+        {"messageStart": {"role": "assistant"}},
+        {"contentBlockDelta": {"delta": {"text": BLOCKED_TEXT}}},
+        {"contentBlockStop": {}},
+        {"messageStop": {"stopReason": "content_filtered"}},
+        {"metadata": {"usage": usage or USAGE, "metrics": {"latencyMs": 1}}}
+    ]
+
+
+class StubRequest(NamedTuple):
+    """What the stub model was sent."""
+
+    messages: List[Dict[str, Any]]
+    tool_specs: List[Dict[str, Any]]
+    system_prompt: Optional[str]
+    kwargs: Dict[str, Any]
+
+
+# Events for a request, or a coroutine resolving to them
+Respond = Callable[[StubRequest], Any]
+
+
+class StubModel(Model):
+    """Model answering each call with the given events and recording its requests."""
+
+    def __init__(self, events: Union[List[Event], Respond], model_id: str = "stub"):
+        """Initialize the stub model.
+
+        Args:
+            events: Stream events answering every call, or a function returning
+                them (or a coroutine resolving to them) for each request
+            model_id: Model ID reported in the config
+        """
+        self.config = {"model_id": model_id}
+        self.events = events
+        self.requests: List[StubRequest] = []
+
+    def update_config(self, **model_config):
+        self.config.update(model_config)
+
+    def get_config(self):
+        return self.config
+
+    async def structured_output(self, output_model, prompt, system_prompt=None, **kwargs):
+        raise NotImplementedError
+
+    async def stream(self, messages, tool_specs=None, system_prompt=None, **kwargs):
+        request = StubRequest(messages, tool_specs or [], system_prompt, kwargs)
+        self.requests.append(request)
+        events = self.events(request) if callable(self.events) else self.events
+        if inspect.isawaitable(events):
+            events = await events
+        for event in events:
+            yield event
+
+
+@contextlib.contextmanager
+def use_stub_model(
+    model: Union[Model, Callable[[str], Model]],
+    router: ModelRouter,
+    *modules: ModuleType
+) -> Iterator[AgentPool]:
+    """Serve the modules' agent pool and model router from a stub model.
+
+    Args:
+        model: Model every agent gets, or a function building one per model ID
+        router: Model router the modules route with
+        modules: Entry point modules holding agent_pool and model_router globals
+
+    Yields:
+        The agent pool building agents on the stub model
+    """
+    def stub_agent(model_id: str):
+        agent = create_money_spender_agent(model_id=model_id)
+        agent.model = model if isinstance(model, Model) else model(model_id)
+        return agent
+
+    agent_pool = AgentPool(stub_agent)
+    originals = [(module, module.agent_pool, module.model_router) for module in modules]
+    for module in modules:
+        module.agent_pool, module.model_router = agent_pool, router
+    try:
+        yield agent_pool
+    finally:
+        for module, original_pool, original_router in originals:
+            module.agent_pool, module.model_router = original_pool, original_router
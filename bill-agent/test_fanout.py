@@ -0,0 +1,139 @@
+"""Test fan-out generation against a stubbed model provider.
+
+Runs offline: the stub model answers each structured-output call with the
+section it asks for after a fixed delay per section, so the test can check
+that the sections run concurrently and merge into one valid analysis, both
+through agentcore_handler and through the deployed entrypoint
+(money_spend_aws_bill_agent, which also renders the PDF invoice).
+"""
+
+import asyncio
+import json
+import time
+
+import agentcore_handler
+import money_spend_aws_bill_agent
+import s3_uploader
+from model_router import ModelRouter
+from money_spend_aws_bill_agent import DEFAULT_MODEL_ID
+from schema import SpendingAnalysis
+from stub_model import StubModel, tool_use_events, use_stub_model
+
+SERVICES = [
+    {
+        "service_name": name,
+        "instance_type": instance_type,
+        "quantity": quantity,
+        "unit_cost": unit_cost,
+        "total_cost": total_cost,
+        "start_day": 0,
+        "end_day": -1,
+        "duration_used": "30 days",
+        "usage_pattern": "Running 24/7",
+        "waste_factor": waste
+    }
+    for name, instance_type, quantity, unit_cost, total_cost, waste in [
+        ("EC2", "r7g.16xlarge", 1, 3.4272, 2467.58, "Memory optimized for a static site"),
+        ("NAT Gateway", "gateway", 10, 0.045, 324.0, "Ten NAT gateways for one private subnet"),
+        ("CloudWatch", "dashboard", 69, 3.0, 208.42, "A dashboard per metric"),
+    ]
+]
+
+SECTIONS = {
+    "SpendingSkeleton": ({
+        "total_amount": "$3000",
+        "timeline_days": 30,
+        "efficiency_level": "Very stupid",
+        "architecture_type": "traditional",
+        "burning_style": "horizontal",
+        "services_deployed": SERVICES,
+        "total_calculated_cost": 3000.0
+    }, 0.3),
+    "ScenarioSection": ({"deployment_scenario": "A weekend project sized for a product launch."}, 0.4),
+    "MistakesSection": ({
+        "key_mistakes": ["No right-sizing", "NAT per subnet", "Dashboards nobody reads"],
+        "recommendations": ["Use t4g.micro", "Share one NAT gateway", "Delete unused dashboards"]
+    }, 0.4),
+    "RoastSection": ({
+        "service_roasts": ["512 GB of RAM to remember nothing.", "Ten exits from an empty building.", "You monitor the monitors."],
+        "roast": "Impressive, in the worst way."
+    }, 0.4),
+}
+
+
+async def respond(request):
+    """Answer each structured-output call with its section after the section's delay."""
+    tool_name = next(spec["name"] for spec in request.tool_specs if spec["name"] in SECTIONS)
+    calls.append(tool_name)
+    output, delay = SECTIONS[tool_name]
+    await asyncio.sleep(delay)
+    return tool_use_events([(tool_name, output)])
+
+
+calls = []
+
+payload = {
+    "amount": "$3000",
+    "timeline": 30,
+    "stupidity": "Very stupid",
+    "architecture": "traditional",
+    "burning_style": "horizontal",
+    "generation_mode": "fanout"
+}
+
+# Both entry points share the stub's pool and router
+with use_stub_model(
+    StubModel(respond), ModelRouter(DEFAULT_MODEL_ID, enabled=False), agentcore_handler, money_spend_aws_bill_agent
+) as agent_pool:
+    print("🔥 Testing fan-out generation with a stubbed model")
+    # The first invocation builds an agent per concurrent section; time the second
+    agentcore_handler.invoke(payload, context=None)
+    calls.clear()
+    start = time.perf_counter()
+    result = agentcore_handler.invoke(payload, context=None)
+    elapsed = time.perf_counter() - start
+
+    assert result["status"] == "success", result
+    assert result["generation_mode"] == "fanout"
+    analysis = SpendingAnalysis(**result["analysis"])
+    assert [s.roast for s in analysis.services_deployed] == SECTIONS["RoastSection"][0]["service_roasts"]
+    assert analysis.deployment_scenario and len(analysis.key_mistakes) == 3 and analysis.roast
+    print(f"✅ Merged a valid analysis from {len(calls)} calls: {', '.join(calls)}")
+
+    # Skeleton, then the longest section: not the sum of all four
+    sequential = sum(delay for _, delay in SECTIONS.values())
+    assert elapsed < 0.3 + 0.4 + 0.25, elapsed
+    print(f"✅ {elapsed:.2f}s wall clock (sequential calls would take {sequential:.1f}s)")
+
+    # Token usage is summed over every call
+    assert result["usage"]["inputTokens"] == 100 * len(calls)
+    print(f"Usage: {json.dumps(result['usage'])}")
+    print(f"Agent pool: {agent_pool.stats()}")
+
+    assert agentcore_handler.invoke({**payload, "generation_mode": "sideways"}, context=None)["status"] == "error"
+    print("✅ Unknown generation modes rejected")
+
+    # The deployed entrypoint (Dockerfile CMD) serves fan-out too; its PDF goes nowhere
+    upload_pdf_to_s3 = s3_uploader.upload_pdf_to_s3
+    s3_uploader.upload_pdf_to_s3 = lambda pdf_bytes, **kwargs: {
+        "status": "success",
+        "s3_url": "https://example.invalid/bill.pdf",
+        "s3_key": "bills/test.pdf",
+        "bucket": "test",
+        "expiration_seconds": 60
+    }
+    calls.clear()
+    try:
+        result = money_spend_aws_bill_agent.invoke(payload, context=None)
+    finally:
+        s3_uploader.upload_pdf_to_s3 = upload_pdf_to_s3
+    assert result["generation_mode"] == "fanout", result
+    assert sorted(calls) == sorted(SECTIONS), calls
+    analysis = SpendingAnalysis(**{key: result[key] for key in SpendingAnalysis.model_fields})
+    assert [s.roast for s in analysis.services_deployed] == SECTIONS["RoastSection"][0]["service_roasts"]
+    assert result["pdf_invoice"]["upload_status"] == "success"
+    assert result["usage"]["inputTokens"] == 100 * len(calls)
+    print(f"✅ Deployed entrypoint merged a fan-out analysis with its PDF invoice: {', '.join(calls)}")
+
+    assert money_spend_aws_bill_agent.invoke({**payload, "generation_mode": "sideways"}, context=None)["status"] == "error"
+    print("✅ Unknown generation modes rejected by the deployed entrypoint")
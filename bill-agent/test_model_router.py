@@ -0,0 +1,119 @@
+"""Test model routing and the fallback chain against stubbed model providers.
+
+Runs offline: routing decisions are checked on the request features and
+recorded statistics alone, then a request runs through the handler with a
+stub model per model ID, the first of which is blocked by content filters.
+"""
+
+import json
+
+import agentcore_handler
+from model_router import MODEL_ROUTER_MIN_SAMPLES, ModelRouter, RequestFeatures
+from stub_model import StubModel, blocked_events, tool_use_events, use_stub_model
+
+MICRO, LITE, PRO = "amazon.nova-micro-v1:0", "amazon.nova-lite-v1:0", "amazon.nova-pro-v1:0"
+CHAIN = [MICRO, LITE, PRO]
+
+ANALYSIS = {
+    "total_amount": "$3000",
+    "timeline_days": 30,
+    "efficiency_level": "Mildly dumb",
+    "architecture_type": "traditional",
+    "burning_style": "horizontal",
+    "services_deployed": [{
+        "service_name": "EC2",
+        "instance_type": "t3.2xlarge",
+        "quantity": 12,
+        "unit_cost": 0.3328,
+        "total_cost": 2875.39,
+        "start_day": 0,
+        "end_day": -1,
+        "duration_used": "30 days",
+        "usage_pattern": "Running 24/7",
+        "waste_factor": "Twelve instances for a static website",
+        "roast": "A dozen servers to host one index.html."
+    }],
+    "total_calculated_cost": 2875.39,
+    "deployment_scenario": "A brochure site provisioned for a product launch that never came.",
+    "key_mistakes": ["No right-sizing"],
+    "recommendations": ["Host it on S3"],
+    "roast": "Cloud-native in the most expensive sense."
+}
+
+# Routing on request features
+router = ModelRouter(LITE, chain=CHAIN, enabled=True)
+small = RequestFeatures.from_request("$100", 7, "Mildly dumb")
+huge = RequestFeatures.from_request("$1,000,000", 60, "Brain damage")
+assert router.route(small).chain == CHAIN
+assert router.route(huge).chain[0] == PRO
+assert router.route(huge).chain == [PRO, LITE, MICRO]
+assert router.route(small, model_id=MICRO).metadata()["reason"] == "pinned"
+assert ModelRouter(LITE, enabled=False).route(huge).chain == [LITE]
+print(f"✅ Routed by complexity: {small.complexity} -> micro, {huge.complexity} -> pro")
+
+# A model measured as too slow for the latency SLO is skipped
+for _ in range(MODEL_ROUTER_MIN_SAMPLES):
+    router.stats(MICRO).record(120_000, ok=True, usage={"inputTokens": 4000, "outputTokens": 1000})
+decision = router.route(small)
+assert decision.chain[0] == LITE and decision.reason == "within_slo", decision.metadata()
+print(f"✅ Slow model skipped: predicted {decision.predictions[MICRO]['latency_ms']} ms on micro")
+
+# A model failing most calls is tried last
+for _ in range(MODEL_ROUTER_MIN_SAMPLES * 2):
+    router.stats(LITE).record(1000, ok=False)
+assert router.route(small).chain == [PRO, MICRO, LITE]
+print("✅ Failing model moved to the end of the chain")
+
+# The caller's remaining time tightens the SLO, and bounds the fallbacks
+router = ModelRouter(LITE, chain=CHAIN, enabled=True)
+decision = router.route(small, budget_ms=6000)
+assert decision.reason == "within_slo" and decision.metadata()["slo"]["latency_ms"] == 6000, decision.metadata()
+assert decision.predictions[decision.chain[1]]["latency_ms"] > 6000, decision.predictions
+
+
+def failing(model_id):
+    raise ValueError(f"{model_id} unavailable")
+
+
+try:
+    router.run(decision, failing)
+    raise AssertionError("Expected the first model's error")
+except ValueError:
+    pass
+attempts = [(a["model_id"], a["outcome"]) for a in decision.attempts]
+assert attempts == [(MICRO, "error"), (LITE, "over_budget")], decision.attempts
+print(f"✅ No fallback past the caller's budget: {json.dumps(decision.attempts[-1])}")
+
+decision = router.route(small, budget_ms=60_000)
+try:
+    router.run(decision, failing)
+except ValueError:
+    pass
+assert [a["outcome"] for a in decision.attempts] == ["error"] * len(CHAIN), decision.attempts
+print("✅ Fallbacks that fit the budget still run")
+
+
+def stub_model(model_id):
+    """Stub model per model ID: micro is blocked by content filters."""
+    return StubModel(blocked_events() if model_id == MICRO else tool_use_events([("SpendingAnalysis", ANALYSIS)]), model_id)
+
+
+with use_stub_model(stub_model, ModelRouter(LITE, chain=CHAIN, enabled=True), agentcore_handler):
+    print("🔥 Testing fallback through the handler with stubbed models")
+    result = agentcore_handler.invoke(
+        {"amount": "$3000", "timeline": 30, "stupidity": "Mildly dumb", "architecture": "traditional", "burning_style": "horizontal"},
+        context=None
+    )
+    assert result["status"] == "success", result
+    routing = result["routing"]
+    assert [(a["model_id"], a["outcome"]) for a in routing["attempts"]] == [(MICRO, "refused"), (LITE, "ok")], routing
+    assert routing["model_id"] == LITE
+    print(f"✅ Fell back from a content-filtered model: {json.dumps(routing['attempts'])}")
+
+    # Pinned to the blocked model: nothing to fall back to
+    result = agentcore_handler.invoke(
+        {"amount": "$3000", "timeline": 30, "stupidity": "Mildly dumb", "model_id": MICRO},
+        context=None
+    )
+    assert result["status"] == "error" and result["routing"]["attempts"][0]["outcome"] == "refused", result
+    print(f"✅ Pinned model refusal reported: {result['error']}")
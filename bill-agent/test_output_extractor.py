@@ -0,0 +1,58 @@
+"""Test structured output extraction from agent results.
+
+Runs offline against result objects shaped like Strands AgentResults: the
+structured output when the model called the output tool, otherwise the text
+it answered with, in the shapes models produce.
+"""
+
+import json
+from types import SimpleNamespace
+
+from bench_output_extractor import recorded_analysis, response_shapes
+from output_extractor import StructuredOutputError, extract_structured_output
+from schema import ScenarioSection, SpendingAnalysis
+
+
+def text_result(text):
+    # structured_output is always present on AgentResult, None without a tool call
+    return SimpleNamespace(structured_output=None, message={"role": "assistant", "content": [{"text": text}]})
+
+
+data = recorded_analysis(5)
+expected = SpendingAnalysis(**data)
+
+# Structured output from the output tool is returned as is
+result = SimpleNamespace(structured_output=expected, message={})
+assert extract_structured_output(result, SpendingAnalysis) is expected
+print("✅ Structured output used when present")
+
+# Text answers: bare, fenced, and prose before the fence
+for shape, text in response_shapes(data).items():
+    assert extract_structured_output(text_result(text), SpendingAnalysis) == expected, shape
+print(f"✅ Parsed text responses: {', '.join(response_shapes(data))}")
+
+# Braces in the prose around the fenced block
+text = f"Plan for {{amount}}:\n```json\n{json.dumps(data)}\n```\nSee {{docs}}."
+assert extract_structured_output(text_result(text), SpendingAnalysis) == expected
+print("✅ Fenced block found when prose contains braces")
+
+# No JSON, invalid JSON, and no text at all are errors
+for text in ("I cannot help with that.", '{"total_amount": "$10000"}'):
+    try:
+        extract_structured_output(text_result(text), SpendingAnalysis)
+        raise AssertionError(f"Expected StructuredOutputError for {text!r}")
+    except StructuredOutputError as e:
+        print(f"✅ Rejected {text[:30]!r}: {str(e).splitlines()[0]}")
+try:
+    extract_structured_output(SimpleNamespace(structured_output=None, message={"content": []}), SpendingAnalysis)
+    raise AssertionError("Expected StructuredOutputError for an empty message")
+except StructuredOutputError:
+    print("✅ Rejected an empty message")
+
+# Structured output that does not validate as the model is an error too
+for output in ({"total_amount": "$10000"}, ScenarioSection(deployment_scenario="Not an analysis")):
+    try:
+        extract_structured_output(SimpleNamespace(structured_output=output, message={}), SpendingAnalysis)
+        raise AssertionError(f"Expected StructuredOutputError for {output!r}")
+    except StructuredOutputError as e:
+        print(f"✅ Rejected an invalid {type(output).__name__} structured output: {str(e).splitlines()[0]}")
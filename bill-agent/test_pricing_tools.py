@@ -0,0 +1,89 @@
+"""Test the local pricing tools, alone and through a pooled agent with a stubbed model.
+
+Runs offline: the stub model asks for a price and a cost in its first turn,
+then answers with the structured output built from the tool results.
+"""
+
+import json
+
+import agentcore_handler
+from model_router import ModelRouter
+from money_spend_aws_bill_agent import DEFAULT_MODEL_ID
+from pricing_tools import CATALOG, calculate_cost, lookup_price
+from stub_model import StubModel, tool_use_events, use_stub_model
+
+# Catalog lookups: aliases, instance types that identify their service, misses
+assert lookup_price(service="Amazon EC2", instance_type="r7g.16xlarge")["unit_price"] == 3.4272
+assert lookup_price(service="RDS for PostgreSQL", instance_type="db.r6g.large")["service"] == "RDS"
+miss = lookup_price(service="S3", instance_type="infinite storage")
+assert not miss["found"] and miss["available"]
+assert "EC2" in lookup_price(service="Mainframe")["services"]
+print(f"✅ Catalog lookups ({len(CATALOG.services)} services)")
+
+# Cost arithmetic per unit
+assert calculate_cost(unit_price=3.4272, quantity=10, timeline_days=30)["total_cost"] == 24675.84
+assert calculate_cost(unit_price=3.4272, quantity=1, start_day=5, end_day=10)["days"] == 5
+assert calculate_cost(unit_price=0.023, unit="GB-month", quantity=10000, timeline_days=15)["total_cost"] == 115.0
+assert calculate_cost(unit_price=3.5, unit="million requests", quantity=40)["total_cost"] == 140.0
+print("✅ Cost calculations")
+
+
+def respond(request):
+    """Call the pricing tools, then answer with the structured output built from their results."""
+    names = {spec["name"] for spec in request.tool_specs}
+    assert {"lookup_price", "calculate_cost"} <= names, names
+
+    results = [
+        json.loads(block["toolResult"]["content"][0]["text"])
+        for block in request.messages[-1]["content"] if "toolResult" in block
+    ]
+    if not results:
+        # Both tools requested in the same turn
+        return tool_use_events([
+            ("lookup_price", {"service": "EC2", "instance_type": "r7g.16xlarge"}),
+            ("calculate_cost", {"unit_price": 3.4272, "unit": "hour", "quantity": 10, "timeline_days": 30})
+        ])
+
+    tool_results.extend(results)
+    price = next(r for r in results if "unit_price" in r)
+    cost = next(r for r in results if "billed_units" in r)
+    return tool_use_events([("SpendingAnalysis", {
+        "total_amount": "$24675.84",
+        "timeline_days": 30,
+        "efficiency_level": "Very stupid",
+        "architecture_type": "traditional",
+        "burning_style": "horizontal",
+        "services_deployed": [{
+            "service_name": price["service"],
+            "instance_type": price["instance_type"],
+            "quantity": 10,
+            "unit_cost": cost["unit_cost"],
+            "total_cost": cost["total_cost"],
+            "start_day": 0,
+            "end_day": -1,
+            "duration_used": "30 days",
+            "usage_pattern": "Running 24/7",
+            "waste_factor": "Memory optimized for a static site",
+            "roast": "512 GB of RAM to remember nothing."
+        }],
+        "total_calculated_cost": cost["total_cost"],
+        "deployment_scenario": "Someone sized for Black Friday every day.",
+        "key_mistakes": ["No right-sizing"],
+        "recommendations": ["Use t3.micro"],
+        "roast": "Ten supercomputers idling in unison."
+    })])
+
+
+tool_results = []
+
+with use_stub_model(StubModel(respond), ModelRouter(DEFAULT_MODEL_ID), agentcore_handler):
+    print("🔥 Testing pricing tools through the agent with a stubbed model")
+    result = agentcore_handler.invoke(
+        {"amount": "$24675.84", "timeline": 30, "stupidity": "Very stupid", "architecture": "traditional", "burning_style": "horizontal"},
+        context=None
+    )
+assert result["status"] == "success", result
+assert [r.get("found", True) for r in tool_results] == [True, True]
+service = result["analysis"]["services_deployed"][0]
+assert service["total_cost"] == 24675.84 and service["unit_cost"] == 3.4272
+print(f"✅ Tool results used in the analysis: {service['quantity']} × {service['instance_type']} = ${service['total_cost']:,.2f}")
@@ -0,0 +1,102 @@
+"""Test Bedrock prompt caching of the system prompt against a stubbed model provider.
+
+Runs offline: the pooled agents get a stub model that records what it is sent
+and reports cache token usage the way Bedrock does (a cache write on the first
+request, cache reads afterwards).
+"""
+
+import json
+
+import agentcore_handler
+from model_router import ModelRouter
+from money_spend_aws_bill_agent import DEFAULT_MODEL_ID
+from prompt_caching import CACHE_POINT
+from prompt_compiler import BASE_SYSTEM_PROMPT, EFFICIENCY_GUIDELINES
+from stub_model import StubModel, tool_use_events, use_stub_model
+
+ANALYSIS = {
+    "total_amount": "$3000",
+    "timeline_days": 30,
+    "efficiency_level": "Very stupid",
+    "architecture_type": "serverless",
+    "burning_style": "vertical",
+    "services_deployed": [{
+        "service_name": "Lambda",
+        "instance_type": "10240 MB",
+        "quantity": 1000,
+        "unit_cost": 0.1,
+        "total_cost": 3000.0,
+        "start_day": 0,
+        "end_day": -1,
+        "duration_used": "30 days",
+        "usage_pattern": "Running 24/7",
+        "waste_factor": "Max memory for a hello world",
+        "roast": "A supercomputer to say hi."
+    }],
+    "total_calculated_cost": 3000.0,
+    "deployment_scenario": "Someone read a blog post.",
+    "key_mistakes": ["Max memory everywhere"],
+    "recommendations": ["Right-size memory"],
+    "roast": "Impressive, in the worst way."
+}
+
+CACHED_PREFIX_TOKENS = 1800
+
+
+def respond(request):
+    """Answer with the structured output tool, reporting a cache write first and cache reads after."""
+    first = len(stub.requests) == 1
+    return tool_use_events([("SpendingAnalysis", ANALYSIS)], {
+        "inputTokens": 120,
+        "outputTokens": 400,
+        "totalTokens": 520,
+        "cacheWriteInputTokens": CACHED_PREFIX_TOKENS if first else 0,
+        "cacheReadInputTokens": 0 if first else CACHED_PREFIX_TOKENS
+    })
+
+
+stub = StubModel(respond)
+
+payloads = [
+    {"amount": "$3000", "timeline": 30, "stupidity": "Very stupid", "architecture": "serverless", "burning_style": "vertical"},
+    # The FastAPI client sends the efficiency level as stupidity_level
+    {"amount": "$50000", "timeline": 7, "stupidity_level": "Mildly dumb", "architecture": "kubernetes", "burning_style": "horizontal"},
+]
+
+print("🔥 Testing prompt caching with a stubbed model")
+with use_stub_model(stub, ModelRouter(DEFAULT_MODEL_ID), agentcore_handler) as agent_pool:
+    results = [agentcore_handler.invoke(payload, context=None) for payload in payloads]
+# The system prompt blocks each model request was sent
+requests = [request.kwargs.get("system_prompt_content") for request in stub.requests]
+
+for result in results:
+    assert result["status"] == "success", result
+    print(f"Usage: {json.dumps(result['usage'])}")
+
+# The system prompt is the static base followed by a cache point
+first_request = requests[0]
+assert first_request[0]["text"] == BASE_SYSTEM_PROMPT
+assert first_request[1] == CACHE_POINT
+print(f"✅ Cache point after a {len(BASE_SYSTEM_PROMPT)} character static prefix")
+
+# Only the requested efficiency level's guidance follows the cache point
+for request, payload in zip(requests, payloads):
+    level = payload.get("stupidity") or payload.get("stupidity_level")
+    guidance = request[2]["text"]
+    assert EFFICIENCY_GUIDELINES[level] in guidance
+    assert not any(text in guidance for other, text in EFFICIENCY_GUIDELINES.items() if other != level)
+print("✅ Only the requested efficiency level guidance sent after the cache point")
+
+# The cached prefix is byte-identical across requests with different parameters
+assert all(request[:2] == first_request[:2] for request in requests)
+print(f"✅ Cached prefix identical across {len(requests)} model requests")
+
+# Cache writes on the first request, reads afterwards, reported per invocation
+assert results[0]["usage"]["cacheWriteInputTokens"] == CACHED_PREFIX_TOKENS
+assert results[0]["usage"]["cacheReadInputTokens"] == 0
+assert results[1]["usage"]["cacheReadInputTokens"] == CACHED_PREFIX_TOKENS
+assert results[1]["usage"]["cacheWriteInputTokens"] == 0
+assert results[1]["usage"]["inputTokens"] == 120
+print("✅ Cache read/write tokens reported per invocation")
+
+print(f"Agent pool: {agent_pool.stats()}")
@@ -0,0 +1,86 @@
+"""Test the premium roast task end to end against a stubbed model.
+
+Runs offline: the FastAPI Lambda's StrandsService and AgentCoreClient request
+a premium roast for a stored plan, and a stand-in for the bedrock-agentcore
+client hands the payload to this agent's entrypoint in process, so the
+request the Lambda sends is the one the agent answers.
+"""
+
+import io
+import json
+import sys
+from pathlib import Path
+
+import money_spend_aws_bill_agent
+from model_router import ModelRouter
+from money_spend_aws_bill_agent import DEFAULT_MODEL_ID, invoke
+from roast_task import ROAST_SYSTEM_PROMPT, ROAST_TASK
+from stub_model import StubModel, blocked_events, tool_use_events, use_stub_model
+
+# The FastAPI Lambda's modules (models, services, utils) and its offline fixtures
+sys.path.append(str(Path(__file__).resolve().parent.parent / "lib" / "lambda" / "fastapi"))
+from benchmarks.fixtures import FakeAgentRuntimeClient, make_agentcore_client, sample_burn_plan_dict  # noqa: E402
+from models import BurnPlan  # noqa: E402
+from services.strands_service import StrandsService  # noqa: E402
+from utils.agentcore_client import AgentCoreError  # noqa: E402
+
+ROAST_TEXT = "You spent a burrito a minute keeping twelve idle instances warm."
+USAGE = {"inputTokens": 80, "outputTokens": 20, "totalTokens": 100}
+
+
+def respond(request):
+    """Answer PremiumRoast calls, or refuse them once roasts are blocked."""
+    if blocked:
+        return blocked_events(USAGE)
+    return tool_use_events([("PremiumRoast", {"roast_text": ROAST_TEXT})], USAGE)
+
+
+class InProcessRuntimeClient(FakeAgentRuntimeClient):
+    """bedrock-agentcore client stand-in that runs this agent's entrypoint."""
+
+    def __init__(self):
+        super().__init__(latency=0)
+        self.payloads = []
+
+    def invoke_agent_runtime(self, payload, **kwargs):
+        from botocore.response import StreamingBody
+
+        self.payloads.append(json.loads(payload))
+        body = json.dumps(invoke(json.loads(payload), context=None)).encode()
+        return {"response": StreamingBody(io.BytesIO(body), len(body)), "contentType": "application/json"}
+
+
+blocked = False
+stub = StubModel(respond)
+
+client = make_agentcore_client(latency=0)
+client.client = runtime = InProcessRuntimeClient()
+service = StrandsService(client)
+burn_plan = BurnPlan(**sample_burn_plan_dict(num_services=3))
+
+with use_stub_model(stub, ModelRouter(DEFAULT_MODEL_ID, enabled=False), money_spend_aws_bill_agent):
+    print("🔥 Requesting a premium roast through the FastAPI client")
+    assert service.generate_roast(burn_plan) == ROAST_TEXT
+    sent = runtime.payloads[-1]
+    assert sent["task"] == ROAST_TASK and sent["total_amount"] == burn_plan.total_amount
+    request = stub.requests[-1]
+    assert "PremiumRoast" in [spec["name"] for spec in request.tool_specs], request.tool_specs
+    assert request.system_prompt.startswith(ROAST_SYSTEM_PROMPT[:40])
+    prompt = request.messages[0]["content"][0]["text"]
+    assert all(svc.service_name in prompt for svc in burn_plan.services_deployed)
+    print(f"✅ Roast generated by the agent: {ROAST_TEXT!r}")
+
+    # The entrypoint answers roast tasks without an analysis or PDF
+    result = invoke(sent, context=None)
+    assert set(result) == {"roast_text", "usage", "status", "routing"}, result
+    assert result["usage"]["inputTokens"] == 80
+    print(f"✅ Roast task response: {sorted(result)}")
+
+    # A refused roast surfaces as an agent error (502), not an empty roast
+    blocked = True
+    try:
+        service.generate_roast(burn_plan)
+        raise AssertionError("Expected AgentCoreError for a refused roast")
+    except AgentCoreError as e:
+        assert "content filters" in str(e), e
+        print(f"✅ Refused roast reported: {e}")
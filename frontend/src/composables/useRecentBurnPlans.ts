@@ -4,13 +4,18 @@ import { apiClient } from '../lib/apiClient';
 export interface RecentBurnPlan {
   id: string;
   timestamp: number;
-  burn_plan: {
-    total_amount: string;
-    timeline_days: number;
-    efficiency_level: string;
-    deployment_scenario: string;
-    total_calculated_cost: number;
-  };
+  total_amount?: string;
+  timeline_days?: number;
+  efficiency_level?: string;
+  architecture_type?: string;
+  total_calculated_cost?: number;
+  service_count?: number;
+  scenario_preview?: string;
+}
+
+interface BurnPlanSummaryPage {
+  items: RecentBurnPlan[];
+  next_cursor?: string | null;
 }
 
 export function useRecentBurnPlans() {
@@ -23,8 +28,8 @@ export function useRecentBurnPlans() {
     error.value = null;
 
     try {
-      const response = await apiClient.get<RecentBurnPlan[]>(`/api/burn-plan/recent?limit=${limit}`);
-      recentPlans.value = response;
+      const response = await apiClient.get<BurnPlanSummaryPage>(`/api/burn-plan?limit=${limit}`);
+      recentPlans.value = response.items;
     } catch (err: any) {
       console.error('Failed to fetch recent burn plans:', err);
       error.value = err.message || 'Failed to fetch recent burn plans';
@@ -24,7 +24,13 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Streamed responses need a host that does not buffer them; API Gateway REST
+# in front of Mangum delivers the whole stream at once, so it is off there
+BURN_PLAN_STREAM_ENABLED = os.environ.get("BURN_PLAN_STREAM_ENABLED", "true").lower() == "true"
+
 # Include routers
+if BURN_PLAN_STREAM_ENABLED:
+    app.include_router(burn_plan.stream_router)
 app.include_router(burn_plan.router)
 app.include_router(roast.router)
 
@@ -40,13 +46,21 @@ def health_check() -> HealthResponse:
 @app.get("/")
 def root():
     """Root endpoint to verify API is working."""
+    endpoints = {
+        "health": "/health",
+        "burn_plan": "/burn-plan (POST)",
+        "burn_plan_list": "/burn-plan (GET)",
+        "burn_plan_get": "/burn-plan/{session_id} (GET)",
+        "burn_plan_batch_get": "/burn-plan/batch-get (POST)",
+        "burn_plan_job": "/burn-plan/jobs/{job_id} (GET)",
+        "burn_plan_recent": "/burn-plan/recent (GET)",
+        "roast": "/roast (POST)"
+    }
+    if BURN_PLAN_STREAM_ENABLED:
+        endpoints["burn_plan_stream"] = "/burn-plan/stream (POST, text/event-stream)"
+
     return {
         "message": "AWS Bill Burner API",
         "version": "1.0.0",
-        "endpoints": {
-            "health": "/health",
-            "burn_plan": "/burn-plan (POST)",
-            "burn_plan_recent": "/burn-plan/recent (GET)",
-            "roast": "/roast (POST)"
-        }
+        "endpoints": endpoints
     }
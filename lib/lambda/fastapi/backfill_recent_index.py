@@ -0,0 +1,110 @@
+"""One-off backfill of created_day and the day index on stored burn plans.
+
+The recent-by-day GSI is sparse: plans stored without ``created_day`` are not
+in it, so they are missing from ``/recent`` and the summaries listing. This
+scans the burn plans table and sets ``created_day`` from each plan's
+``timestamp`` (the UTC creation day, as store_burn_plan writes it). Items that
+already have the attribute are left alone, so the script can be rerun.
+
+Listings walk back through the day index (one item per day that holds plans),
+which store_burn_plan only maintains for plans it stores from now on, so every
+day seen in the scan is recorded there as well.
+
+Usage:
+    BURN_PLANS_TABLE_NAME=<table> python backfill_recent_index.py [--dry-run]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+from typing import Any, Dict, Optional
+
+from services.dynamodb_service import PLAN_DAYS_ID, RECENT_SHARD_ATTRIBUTE, recent_shard
+from utils.aws_clients import get_resource
+
+
+def backfill(table: Any, dry_run: bool = False, page_size: Optional[int] = None) -> Dict[str, int]:
+    """Set created_day on every plan that lacks it and record every day in the day index.
+
+    Args:
+        table: Burn plans table (boto3 Table)
+        dry_run: Count the plans that would be updated without writing
+        page_size: Items per Scan page (DynamoDB default if omitted)
+
+    Returns:
+        Counts of plans scanned, updated and already indexed, and of days
+        recorded in the day index
+    """
+    from boto3.dynamodb.conditions import Attr
+    from botocore.exceptions import ClientError
+
+    counts = {"scanned": 0, "updated": 0, "already_indexed": 0, "days": 0}
+    day_starts = set()
+    scan: Dict[str, Any] = {
+        "ProjectionExpression": "id, #ts, #day",
+        "ExpressionAttributeNames": {"#ts": "timestamp", "#day": RECENT_SHARD_ATTRIBUTE}
+    }
+    if page_size:
+        scan["Limit"] = page_size
+
+    while True:
+        response = table.scan(**scan)
+        for item in response.get("Items", []):
+            if item["id"] == PLAN_DAYS_ID:
+                continue
+            counts["scanned"] += 1
+            day_starts.add(int(item["timestamp"]) // 86_400_000 * 86_400_000)
+            if RECENT_SHARD_ATTRIBUTE in item:
+                counts["already_indexed"] += 1
+                continue
+            if not dry_run:
+                try:
+                    table.update_item(
+                        Key={"id": item["id"], "timestamp": item["timestamp"]},
+                        UpdateExpression="SET #day = :day",
+                        ExpressionAttributeNames={"#day": RECENT_SHARD_ATTRIBUTE},
+                        ExpressionAttributeValues={":day": recent_shard(int(item["timestamp"]))},
+                        # Never touch a plan deleted or written since the scan read it
+                        ConditionExpression=Attr("id").exists() & Attr(RECENT_SHARD_ATTRIBUTE).not_exists()
+                    )
+                except ClientError as e:
+                    if e.response.get("Error", {}).get("Code") != "ConditionalCheckFailedException":
+                        raise
+                    counts["already_indexed"] += 1
+                    continue
+            counts["updated"] += 1
+
+        start_key = response.get("LastEvaluatedKey")
+        if not start_key:
+            break
+        scan["ExclusiveStartKey"] = start_key
+
+    # Day index items are keyed by the day's start, so rewriting one is harmless
+    counts["days"] = len(day_starts)
+    if not dry_run:
+        for day_start in sorted(day_starts):
+            table.put_item(Item={"id": PLAN_DAYS_ID, "timestamp": day_start})
+    return counts
+
+
+def main() -> None:
+    """Backfill created_day on the burn plans table."""
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument(
+        "--table",
+        default=os.environ.get("BURN_PLANS_TABLE_NAME", "burn-plans"),
+        help="Burn plans table name"
+    )
+    parser.add_argument("--dry-run", action="store_true", help="Count plans to update without writing")
+    parser.add_argument("--page-size", type=int, default=None, help="Items per Scan page")
+    args = parser.parse_args()
+
+    counts = backfill(get_resource("dynamodb").Table(args.table), args.dry_run, args.page_size)
+    verb = "Would update" if args.dry_run else "Updated"
+    print(f"{verb} {counts['updated']} of {counts['scanned']} plan(s) in {args.table} "
+          f"({counts['already_indexed']} already indexed), {counts['days']} day(s) in the day index")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Benchmark concurrent burn plan throughput: blocking vs offloaded AgentCore calls.
+
+The "before" case calls the synchronous StrandsService from a coroutine, which is
+what ``create_burn_plan`` used to do: every invocation blocks the event loop, so
+concurrent requests are served one after another. The "after" case awaits
+AsyncStrandsService, which offloads invocations to the bounded AgentCore pool.
+
+Usage:
+    python benchmarks/bench_async_invocation.py [--requests 20] [--latency 0.5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+
+from fixtures import BENCH_CONFIG, make_agentcore_client
+
+from models import BurnConfig
+from services.strands_service import AsyncStrandsService, StrandsService
+from utils.agentcore_client import AsyncAgentCoreClient
+
+
+async def run_blocking(requests: int, latency: float) -> float:
+    """Serve concurrent requests the old way; returns wall-clock seconds."""
+    service = StrandsService(make_agentcore_client(latency))
+    config = BurnConfig(**BENCH_CONFIG)
+
+    async def handle() -> None:
+        service.generate_burn_plan(config)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(handle() for _ in range(requests)))
+    return time.perf_counter() - start
+
+
+async def run_offloaded(requests: int, latency: float) -> float:
+    """Serve concurrent requests via AsyncStrandsService; returns wall-clock seconds."""
+    service = AsyncStrandsService(AsyncAgentCoreClient(make_agentcore_client(latency)))
+    config = BurnConfig(**BENCH_CONFIG)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(service.generate_burn_plan(config) for _ in range(requests)))
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """Run both cases and print a throughput comparison."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=20, help="Concurrent requests per case")
+    parser.add_argument("--latency", type=float, default=0.5, help="Simulated agent latency in seconds")
+    args = parser.parse_args()
+
+    blocking = asyncio.run(run_blocking(args.requests, args.latency))
+    offloaded = asyncio.run(run_offloaded(args.requests, args.latency))
+
+    print(f"{args.requests} concurrent requests, {args.latency:.2f}s simulated agent latency")
+    print(f"  before (blocking):  {blocking:7.2f}s  {args.requests / blocking:7.2f} req/s")
+    print(f"  after  (offloaded): {offloaded:7.2f}s  {args.requests / offloaded:7.2f} req/s")
+    print(f"  speedup: {blocking / offloaded:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""Benchmark the cost solver on plans with model-style arithmetic errors.
+
+Generates plans whose service costs miss the requested amount by a random
+factor (and whose total_calculated_cost disagrees with the services), then
+reports, per error band:
+  * how many plans the legacy 10% check would have rejected (each rejection
+    is a failed request or a regeneration)
+  * how many plans the solver could not bring to the target within its
+    bounds (these fall back to the legacy check)
+  * solver time per plan
+  * the largest quantity / active-day change the solver made
+
+Usage:
+    python benchmarks/bench_cost_solver.py [--plans 2000] [--services 8] [--seed 7]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from typing import List, Optional, Tuple
+
+from fixtures import sample_burn_plan_dict
+
+from models import BurnPlan
+from services.cost_solver import COST_TOLERANCE, CostSolverError, SolvedPlan, solve_plan_costs
+
+TARGET = 5000.0
+
+# (label, smallest, largest) relative error of the model's service total
+ERROR_BANDS: List[Tuple[str, float, float]] = [
+    ("within 10%", 0.0, 0.10),
+    ("10-50% off", 0.10, 0.50),
+    ("50-300% off", 0.50, 3.0),
+]
+
+
+def noisy_plan(rng: random.Random, num_services: int, low: float, high: float) -> BurnPlan:
+    """Build a plan whose services sum to TARGET off by a random error in [low, high)."""
+    data = sample_burn_plan_dict(num_services, TARGET)
+    error = rng.uniform(low, high) * rng.choice((-1, 1))
+    scale = max(1 + error, 0.05)
+    weights = [rng.uniform(0.5, 1.5) for _ in data["services_deployed"]]
+    for service, weight in zip(data["services_deployed"], weights):
+        service["total_cost"] = round(TARGET * scale * weight / sum(weights), 2)
+        if rng.random() < 0.3:
+            service["start_day"] = rng.randrange(0, 20)
+            service["end_day"] = rng.randrange(service["start_day"] + 1, 31)
+    # The model's own total rarely matches its services either
+    data["total_calculated_cost"] = round(TARGET * rng.uniform(0.95, 1.05), 2)
+    return BurnPlan(**data)
+
+
+def try_solve(plan: BurnPlan) -> Optional[SolvedPlan]:
+    """Solve a plan, or None if it is out of the solver's bounds."""
+    try:
+        return solve_plan_costs(plan, TARGET)
+    except CostSolverError:
+        return None
+
+
+def run_band(plans: List[BurnPlan]) -> None:
+    """Solve every plan in a band and print the results."""
+    rejected = sum(
+        not (TARGET * (1 - COST_TOLERANCE) <= sum(s.total_cost for s in plan.services_deployed) <= TARGET * (1 + COST_TOLERANCE))
+        for plan in plans
+    )
+
+    start = time.perf_counter()
+    results = [try_solve(plan) for plan in plans]
+    elapsed = time.perf_counter() - start
+    solved = [(plan, result) for plan, result in zip(plans, results) if result is not None]
+
+    exact = sum(
+        round(result.plan.total_calculated_cost * 100) == round(TARGET * 100)
+        and round(sum(s.total_cost for s in result.plan.services_deployed) * 100) == round(TARGET * 100)
+        for _, result in solved
+    )
+    max_quantity_scale = max(
+        max(new.quantity / max(old.quantity, 1), max(old.quantity, 1) / new.quantity)
+        for plan, result in solved
+        for old, new in zip(plan.services_deployed, result.plan.services_deployed)
+    ) if solved else 1.0
+
+    print(f"  legacy check rejects {rejected:5d} / {len(plans)}")
+    print(f"  solver exact         {exact:5d} / {len(plans)}")
+    print(f"  out of bounds        {len(plans) - len(solved):5d} / {len(plans)}")
+    print(f"  solve time           {elapsed / len(plans) * 1e6:8.1f} us per plan")
+    print(f"  max quantity change  {max_quantity_scale:8.2f}x")
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--plans", type=int, default=2000, help="Plans per error band")
+    parser.add_argument("--services", type=int, default=8, help="Services per plan")
+    parser.add_argument("--seed", type=int, default=7, help="Random seed")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    for label, low, high in ERROR_BANDS:
+        print(f"{label} ({args.plans} plans, {args.services} services, target ${TARGET:,.0f}):")
+        run_band([noisy_plan(rng, args.services, low, high) for _ in range(args.plans)])
+        print()
+
+
+if __name__ == "__main__":
+    main()
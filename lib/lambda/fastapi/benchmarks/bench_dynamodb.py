@@ -0,0 +1,151 @@
+"""Benchmark the burn plan storage layer against an in-memory DynamoDB table.
+
+Measures, at several plan sizes:
+  * encode/decode cost: the legacy nested map (recursive float<->Decimal
+    conversion) vs the compressed single-attribute codec, and stored item size
+  * store throughput of DynamoDBService.store_burn_plan (legacy item vs codec)
+  * list throughput and payload size: full plans (/recent) vs summaries (GET /burn-plan)
+
+Usage:
+    python benchmarks/bench_dynamodb.py [--services 8 25 60] [--plans 200] [--latency 0]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from decimal import Decimal
+from typing import Any, Callable, Dict
+
+from fixtures import sample_burn_plan_dict
+from fake_dynamodb import _item_size, _serializer, make_burn_plans_resource, use_fake_dynamodb
+
+from models import BurnPlan
+from services.dynamodb_service import DynamoDBService, recent_shard
+from utils.burn_plan_codec import decode_burn_plan, encode_burn_plan
+from utils.session_ids import new_session_id
+
+
+def to_decimals(obj: Any) -> Any:
+    """Legacy write path: recursively convert floats to Decimals."""
+    if isinstance(obj, float):
+        return Decimal(str(obj))
+    if isinstance(obj, dict):
+        return {k: to_decimals(v) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [to_decimals(item) for item in obj]
+    return obj
+
+
+def to_floats(obj: Any) -> Any:
+    """Legacy read path: recursively convert Decimals to floats."""
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, dict):
+        return {k: to_floats(v) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [to_floats(item) for item in obj]
+    return obj
+
+
+def legacy_item(session_id: str, burn_plan: BurnPlan) -> Dict[str, Any]:
+    """Build a table item the way store_burn_plan did before the storage codec."""
+    timestamp = int(time.time() * 1000)
+    return {
+        "id": session_id,
+        "timestamp": timestamp,
+        "created_day": recent_shard(timestamp),
+        "burn_plan": to_decimals(burn_plan.model_dump())
+    }
+
+
+def per_op_us(func: Callable[[], Any], iterations: int) -> float:
+    """Average microseconds per call."""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def bench_codec(burn_plan: BurnPlan, iterations: int) -> None:
+    """Compare legacy map and codec encode/decode cost and item size."""
+    legacy_map = to_decimals(burn_plan.model_dump())
+    legacy_wire = {"burn_plan": _serializer.serialize(legacy_map)}
+    encoded = encode_burn_plan(burn_plan)
+
+    legacy_encode = per_op_us(lambda: to_decimals(burn_plan.model_dump()), iterations)
+    codec_encode = per_op_us(lambda: encode_burn_plan(burn_plan), iterations)
+    legacy_decode = per_op_us(lambda: BurnPlan.model_validate(to_floats(legacy_map)), iterations)
+    codec_decode = per_op_us(lambda: decode_burn_plan(encoded.data, encoded.encoding), iterations)
+
+    print(f"  encode      legacy {legacy_encode:9.1f} us   codec {codec_encode:9.1f} us")
+    print(f"  decode      legacy {legacy_decode:9.1f} us   codec {codec_decode:9.1f} us")
+    print(f"  item size   legacy {_item_size(legacy_wire):9d} B    codec {len(encoded.data):9d} B")
+
+
+def bench_store(burn_plan: BurnPlan, plans: int, latency: float) -> None:
+    """Compare store throughput of legacy items and the codec."""
+    resource = make_burn_plans_resource(latency=latency)
+    table = resource.Table("burn-plans")
+
+    start = time.perf_counter()
+    for _ in range(plans):
+        table.put_item(Item=legacy_item(new_session_id(), burn_plan))
+    legacy_rate = plans / (time.perf_counter() - start)
+
+    resource = make_burn_plans_resource(latency=latency)
+    with use_fake_dynamodb(resource):
+        service = DynamoDBService()
+        start = time.perf_counter()
+        for _ in range(plans):
+            service.store_burn_plan(new_session_id(), burn_plan)
+        codec_rate = plans / (time.perf_counter() - start)
+
+    print(f"  store       legacy {legacy_rate:9.0f} /s   codec {codec_rate:9.0f} /s")
+
+
+def bench_list(burn_plan: BurnPlan, plans: int, latency: float, iterations: int) -> None:
+    """Compare listing full plans with listing summaries."""
+    resource = make_burn_plans_resource(latency=latency)
+    with use_fake_dynamodb(resource):
+        service = DynamoDBService()
+        for _ in range(plans):
+            service.store_burn_plan(new_session_id(), burn_plan)
+
+        start = time.perf_counter()
+        for _ in range(iterations):
+            recent = service.get_recent_burn_plans(20)
+        full_rate = iterations / (time.perf_counter() - start)
+
+        start = time.perf_counter()
+        for _ in range(iterations):
+            summaries, _cursor = service.list_burn_plan_summaries(20)
+        summary_rate = iterations / (time.perf_counter() - start)
+
+    full_bytes = len(json.dumps(recent))
+    summary_bytes = len(json.dumps(summaries))
+    print(f"  list 20     full   {full_rate:9.0f} /s   summary {summary_rate:7.0f} /s")
+    print(f"  list bytes  full   {full_bytes:9d} B    summary {summary_bytes:7d} B")
+
+
+def main() -> None:
+    """Run the storage benchmarks for each plan size."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--services", type=int, nargs="+", default=[8, 25, 60], help="Services per plan")
+    parser.add_argument("--plans", type=int, default=200, help="Plans stored per store/list case")
+    parser.add_argument("--iterations", type=int, default=200, help="Iterations per codec/list measurement")
+    parser.add_argument("--latency", type=float, default=0.0, help="Simulated DynamoDB latency per call in seconds")
+    args = parser.parse_args()
+
+    for num_services in args.services:
+        burn_plan = BurnPlan(**sample_burn_plan_dict(num_services=num_services))
+        print(f"{num_services} services ({len(burn_plan.model_dump_json())} bytes of JSON):")
+        bench_codec(burn_plan, args.iterations)
+        bench_store(burn_plan, args.plans, args.latency)
+        bench_list(burn_plan, args.plans, args.latency, max(1, args.iterations // 10))
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,437 @@
+"""In-memory stand-in for the boto3 DynamoDB resource and Table.
+
+Implements the subset the FastAPI Lambda uses: ``put_item`` (optionally
+conditional), ``update_item`` (``SET`` only), ``get_item``, ``query`` (table and GSIs), ``scan``,
+``batch_get_item`` and ``batch_write_item``, with ``Limit``/``ExclusiveStartKey``
+pagination and the 1 MB page cap. Items go through the same ``TypeSerializer``/``TypeDeserializer``
+round trip as the real resource, so serialization CPU and float/Decimal rules
+are realistic. ``latency`` adds a fixed delay per call to approximate network
+round trips.
+
+Usage:
+    resource = FakeDynamoDBResource(latency=0.005)
+    resource.create_table("burn-plans", "id", "timestamp",
+                          indexes={"recent-by-day": ("created_day", "timestamp")})
+    with use_fake_dynamodb(resource):
+        DynamoDBService().store_burn_plan(...)
+"""
+
+from __future__ import annotations
+
+import contextlib
+import random
+import threading
+import time
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from boto3.dynamodb.types import TypeDeserializer, TypeSerializer
+from botocore.exceptions import ClientError
+
+MAX_ITEM_BYTES = 400 * 1024
+MAX_PAGE_BYTES = 1024 * 1024
+MAX_BATCH_GET_KEYS = 100
+MAX_BATCH_WRITE_REQUESTS = 25
+
+_serializer = TypeSerializer()
+_deserializer = TypeDeserializer()
+
+
+def _client_error(code: str, message: str, operation: str) -> ClientError:
+    """Build a ClientError shaped like a real DynamoDB error."""
+    return ClientError({"Error": {"Code": code, "Message": message}}, operation)
+
+
+def _attribute_size(value: Dict[str, Any]) -> int:
+    """Approximate DynamoDB size of a serialized attribute value."""
+    (kind, data), = value.items()
+    if kind in ("S", "N"):
+        return len(data.encode("utf-8")) if kind == "S" else len(data)
+    if kind == "B":
+        return len(data)
+    if kind in ("BOOL", "NULL"):
+        return 1
+    if kind == "M":
+        return 3 + sum(len(k) + _attribute_size(v) for k, v in data.items())
+    if kind == "L":
+        return 3 + sum(_attribute_size(v) for v in data)
+    return sum(len(str(v)) for v in data)
+
+
+def _item_size(wire: Dict[str, Dict[str, Any]]) -> int:
+    """Approximate DynamoDB size of a serialized item."""
+    return sum(len(name) + _attribute_size(value) for name, value in wire.items())
+
+
+def _evaluate(condition: Any, item: Dict[str, Any]) -> bool:
+    """Evaluate a boto3.dynamodb.conditions key or condition expression against an item."""
+    expression = condition.get_expression()
+    operator = expression["operator"]
+    values = expression["values"]
+
+    if operator == "AND":
+        return _evaluate(values[0], item) and _evaluate(values[1], item)
+    if operator == "OR":
+        return _evaluate(values[0], item) or _evaluate(values[1], item)
+
+    name = values[0].name
+    if operator == "attribute_not_exists":
+        return name not in item
+    if operator == "attribute_exists":
+        return name in item
+    if name not in item:
+        return False
+    actual = item[name]
+
+    if operator == "=":
+        return actual == values[1]
+    if operator == "<":
+        return actual < values[1]
+    if operator == "<=":
+        return actual <= values[1]
+    if operator == ">":
+        return actual > values[1]
+    if operator == ">=":
+        return actual >= values[1]
+    if operator == "BETWEEN":
+        return values[1] <= actual <= values[2]
+    if operator == "begins_with":
+        return str(actual).startswith(values[1])
+    raise NotImplementedError(f"Key condition operator not supported by the fake: {operator}")
+
+
+def _project(item: Dict[str, Any], projection: Optional[str], names: Optional[Dict[str, str]]) -> Dict[str, Any]:
+    """Apply a top-level ProjectionExpression."""
+    if not projection:
+        return item
+    names = names or {}
+    wanted = [names.get(part.strip(), part.strip()) for part in projection.split(",")]
+    return {name: item[name] for name in wanted if name in item}
+
+
+class FakeTable:
+    """In-memory table with optional global secondary indexes."""
+
+    def __init__(
+        self,
+        name: str,
+        hash_key: str,
+        range_key: Optional[str] = None,
+        indexes: Optional[Dict[str, Tuple[str, Optional[str]]]] = None,
+        latency: float = 0.0
+    ):
+        """Initialize fake table.
+
+        Args:
+            name: Table name
+            hash_key: Partition key attribute
+            range_key: Sort key attribute, if any
+            indexes: GSI name -> (partition key, sort key); indexes project all attributes
+            latency: Seconds added to every call
+        """
+        self.name = name
+        self.hash_key = hash_key
+        self.range_key = range_key
+        self.indexes = indexes or {}
+        self.latency = latency
+        self.calls: Dict[str, int] = {}
+        self._items: Dict[Tuple[Any, Any], Dict[str, Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    # -- boto3 Table API -------------------------------------------------
+
+    def put_item(self, Item: Dict[str, Any], ConditionExpression: Any = None, **kwargs: Any) -> Dict[str, Any]:
+        self._call("PutItem")
+        self._store(Item, "PutItem", ConditionExpression)
+        return {}
+
+    def get_item(
+        self,
+        Key: Dict[str, Any],
+        ConsistentRead: bool = False,
+        ProjectionExpression: Optional[str] = None,
+        ExpressionAttributeNames: Optional[Dict[str, str]] = None,
+        **kwargs: Any
+    ) -> Dict[str, Any]:
+        self._call("GetItem")
+        with self._lock:
+            wire = self._items.get(self._key_of(Key))
+        if wire is None:
+            return {}
+        return {"Item": _project(self._deserialize(wire), ProjectionExpression, ExpressionAttributeNames)}
+
+    def update_item(
+        self,
+        Key: Dict[str, Any],
+        UpdateExpression: str,
+        ExpressionAttributeValues: Dict[str, Any],
+        ExpressionAttributeNames: Optional[Dict[str, str]] = None,
+        ConditionExpression: Any = None,
+        **kwargs: Any
+    ) -> Dict[str, Any]:
+        self._call("UpdateItem")
+        action, _, assignments = UpdateExpression.strip().partition(" ")
+        if action.upper() != "SET":
+            raise NotImplementedError(f"Update action not supported by the fake: {action}")
+        names = ExpressionAttributeNames or {}
+        with self._lock:
+            current = self._items.get(self._key_of(Key))
+        item = self._deserialize(current) if current else dict(Key)
+        if ConditionExpression is not None and not _evaluate(ConditionExpression, item if current else {}):
+            raise _client_error("ConditionalCheckFailedException", "The conditional request failed", "UpdateItem")
+        for assignment in assignments.split(","):
+            name, _, value = assignment.partition("=")
+            item[names.get(name.strip(), name.strip())] = ExpressionAttributeValues[value.strip()]
+        self._store(item, "UpdateItem")
+        return {}
+
+    def delete_item(self, Key: Dict[str, Any], ConditionExpression: Any = None, **kwargs: Any) -> Dict[str, Any]:
+        self._call("DeleteItem")
+        with self._lock:
+            key = self._key_of(Key)
+            if ConditionExpression is not None:
+                current = self._items.get(key)
+                if not _evaluate(ConditionExpression, self._deserialize(current) if current else {}):
+                    raise _client_error("ConditionalCheckFailedException", "The conditional request failed", "DeleteItem")
+            self._items.pop(key, None)
+        return {}
+
+    def query(
+        self,
+        KeyConditionExpression: Any,
+        IndexName: Optional[str] = None,
+        ScanIndexForward: bool = True,
+        Limit: Optional[int] = None,
+        ExclusiveStartKey: Optional[Dict[str, Any]] = None,
+        ProjectionExpression: Optional[str] = None,
+        ExpressionAttributeNames: Optional[Dict[str, str]] = None,
+        **kwargs: Any
+    ) -> Dict[str, Any]:
+        self._call("Query")
+        hash_key, range_key = self.indexes[IndexName] if IndexName else (self.hash_key, self.range_key)
+
+        # Conditions only touch key attributes, so only those are deserialized to match
+        rows = [row for row in self._rows(hash_key, range_key) if hash_key in row[0]]
+        rows = [row for row in rows if _evaluate(KeyConditionExpression, row[0])]
+        rows.sort(key=lambda row: self._order(row[0], range_key), reverse=not ScanIndexForward)
+        return self._page(rows, Limit, ExclusiveStartKey, hash_key, ProjectionExpression, ExpressionAttributeNames)
+
+    def scan(
+        self,
+        Limit: Optional[int] = None,
+        ExclusiveStartKey: Optional[Dict[str, Any]] = None,
+        ProjectionExpression: Optional[str] = None,
+        ExpressionAttributeNames: Optional[Dict[str, str]] = None,
+        **kwargs: Any
+    ) -> Dict[str, Any]:
+        self._call("Scan")
+        rows = self._rows(self.hash_key, self.range_key)
+        return self._page(rows, Limit, ExclusiveStartKey, self.hash_key, ProjectionExpression, ExpressionAttributeNames)
+
+    # -- internals -------------------------------------------------------
+
+    def _call(self, operation: str) -> None:
+        """Count a call and apply the injected latency."""
+        with self._lock:
+            self.calls[operation] = self.calls.get(operation, 0) + 1
+        if self.latency:
+            time.sleep(self.latency)
+
+    def _key_of(self, item: Dict[str, Any]) -> Tuple[Any, Any]:
+        """Primary key tuple of an item or key dict."""
+        return item[self.hash_key], item[self.range_key] if self.range_key else None
+
+    def _store(self, item: Dict[str, Any], operation: str, condition: Any = None) -> None:
+        """Serialize and store an item, enforcing DynamoDB's type and size rules and any condition."""
+        try:
+            wire = {name: _serializer.serialize(value) for name, value in item.items()}
+        except TypeError as e:
+            # boto3 raises TypeError for floats; surface it the same way
+            raise TypeError(f"{operation}: {e}")
+        size = _item_size(wire)
+        if size > MAX_ITEM_BYTES:
+            raise _client_error("ValidationException", "Item size has exceeded the maximum allowed size", operation)
+        with self._lock:
+            key = self._key_of(item)
+            if condition is not None:
+                current = self._items.get(key)
+                if not _evaluate(condition, self._deserialize(current) if current else {}):
+                    raise _client_error("ConditionalCheckFailedException", "The conditional request failed", operation)
+            self._items[key] = wire
+
+    def _rows(self, *key_names: Optional[str]) -> List[Tuple[Dict[str, Any], Dict[str, Dict[str, Any]]]]:
+        """(deserialized key attributes, serialized item) for every item, in insertion order."""
+        names = {self.hash_key, self.range_key, *key_names} - {None}
+        with self._lock:
+            wires = list(self._items.values())
+        return [
+            ({name: _deserializer.deserialize(wire[name]) for name in names if name in wire}, wire)
+            for wire in wires
+        ]
+
+    @staticmethod
+    def _deserialize(wire: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        return {name: _deserializer.deserialize(value) for name, value in wire.items()}
+
+    def _order(self, item: Dict[str, Any], range_key: Optional[str]) -> Tuple[Any, ...]:
+        """Sort key for query results (ties broken by the table key, like DynamoDB)."""
+        return (item.get(range_key) if range_key else 0, self._key_of(item))
+
+    def _page(
+        self,
+        rows: List[Tuple[Dict[str, Any], Dict[str, Dict[str, Any]]]],
+        limit: Optional[int],
+        start_key: Optional[Dict[str, Any]],
+        hash_key: str,
+        projection: Optional[str],
+        names: Optional[Dict[str, str]]
+    ) -> Dict[str, Any]:
+        """Slice one page of results, honoring Limit, ExclusiveStartKey and the 1 MB cap."""
+        if start_key:
+            start = self._key_of(start_key)
+            positions = [i for i, (keys, _wire) in enumerate(rows) if self._key_of(keys) == start]
+            rows = rows[positions[0] + 1:] if positions else []
+
+        page: List[Dict[str, Any]] = []
+        last_keys: Dict[str, Any] = {}
+        page_bytes = 0
+        for keys, wire in rows:
+            if limit is not None and len(page) >= limit:
+                break
+            page_bytes += _item_size(wire)
+            page.append(_project(self._deserialize(wire), projection, names))
+            last_keys = keys
+            if page_bytes >= MAX_PAGE_BYTES:
+                break
+
+        response: Dict[str, Any] = {"Items": page, "Count": len(page), "ScannedCount": len(page)}
+        if page and len(page) < len(rows):
+            response["LastEvaluatedKey"] = last_keys
+        return response
+
+
+class FakeDynamoDBResource:
+    """Stand-in for ``boto3.resource('dynamodb')`` holding FakeTables."""
+
+    def __init__(self, latency: float = 0.0, unprocessed_rate: float = 0.0, seed: Optional[int] = None):
+        """Initialize fake resource.
+
+        Args:
+            latency: Seconds added to every call (tables created here inherit it)
+            unprocessed_rate: Fraction of batch keys/requests returned as unprocessed,
+                to exercise retry paths
+            seed: Random seed for unprocessed selection
+        """
+        self.latency = latency
+        self.unprocessed_rate = unprocessed_rate
+        self.tables: Dict[str, FakeTable] = {}
+        self.calls: Dict[str, int] = {}
+        self._random = random.Random(seed)
+
+    def create_table(
+        self,
+        name: str,
+        hash_key: str,
+        range_key: Optional[str] = None,
+        indexes: Optional[Dict[str, Tuple[str, Optional[str]]]] = None
+    ) -> FakeTable:
+        """Create (or replace) a table."""
+        self.tables[name] = FakeTable(name, hash_key, range_key, indexes, latency=self.latency)
+        return self.tables[name]
+
+    def Table(self, name: str) -> FakeTable:
+        if name not in self.tables:
+            raise _client_error("ResourceNotFoundException", f"Requested resource not found: {name}", "DescribeTable")
+        return self.tables[name]
+
+    def batch_get_item(self, RequestItems: Dict[str, Dict[str, Any]], **kwargs: Any) -> Dict[str, Any]:
+        self._call("BatchGetItem")
+        total = sum(len(request["Keys"]) for request in RequestItems.values())
+        if total > MAX_BATCH_GET_KEYS:
+            raise _client_error("ValidationException", "Too many items requested for the BatchGetItem call", "BatchGetItem")
+
+        responses: Dict[str, List[Dict[str, Any]]] = {}
+        unprocessed: Dict[str, Dict[str, Any]] = {}
+        for name, request in RequestItems.items():
+            table = self.Table(name)
+            for key in request["Keys"]:
+                if self._unprocessed():
+                    unprocessed.setdefault(name, {"Keys": []})["Keys"].append(key)
+                    continue
+                with table._lock:
+                    wire = table._items.get(table._key_of(key))
+                if wire is not None:
+                    item = _project(table._deserialize(wire), request.get("ProjectionExpression"),
+                                    request.get("ExpressionAttributeNames"))
+                    responses.setdefault(name, []).append(item)
+
+        return {"Responses": responses, "UnprocessedKeys": unprocessed}
+
+    def batch_write_item(self, RequestItems: Dict[str, List[Dict[str, Any]]], **kwargs: Any) -> Dict[str, Any]:
+        self._call("BatchWriteItem")
+        total = sum(len(requests) for requests in RequestItems.values())
+        if total > MAX_BATCH_WRITE_REQUESTS:
+            raise _client_error("ValidationException", "Too many items requested for the BatchWriteItem call", "BatchWriteItem")
+
+        unprocessed: Dict[str, List[Dict[str, Any]]] = {}
+        for name, requests in RequestItems.items():
+            table = self.Table(name)
+            for request in requests:
+                if self._unprocessed():
+                    unprocessed.setdefault(name, []).append(request)
+                elif "PutRequest" in request:
+                    table._store(request["PutRequest"]["Item"], "BatchWriteItem")
+                else:
+                    with table._lock:
+                        table._items.pop(table._key_of(request["DeleteRequest"]["Key"]), None)
+
+        return {"UnprocessedItems": unprocessed}
+
+    def _call(self, operation: str) -> None:
+        """Count a call and apply the injected latency."""
+        self.calls[operation] = self.calls.get(operation, 0) + 1
+        if self.latency:
+            time.sleep(self.latency)
+
+    def _unprocessed(self) -> bool:
+        return self.unprocessed_rate > 0 and self._random.random() < self.unprocessed_rate
+
+
+def make_burn_plans_resource(latency: float = 0.0, unprocessed_rate: float = 0.0) -> FakeDynamoDBResource:
+    """Create a fake resource with the burn-plans table and its recent-by-day index.
+
+    Args:
+        latency: Seconds added to every call
+        unprocessed_rate: Fraction of batch keys returned as unprocessed
+
+    Returns:
+        Fake DynamoDB resource
+    """
+    resource = FakeDynamoDBResource(latency=latency, unprocessed_rate=unprocessed_rate, seed=0)
+    resource.create_table(
+        "burn-plans", "id", "timestamp",
+        indexes={"recent-by-day": ("created_day", "timestamp")}
+    )
+    return resource
+
+
+@contextlib.contextmanager
+def use_fake_dynamodb(resource: FakeDynamoDBResource) -> Iterator[FakeDynamoDBResource]:
+    """Route DynamoDBService's table and batch calls to a fake resource.
+
+    Args:
+        resource: Fake resource to use
+
+    Yields:
+        The fake resource
+    """
+    from services import dynamodb_service
+
+    original = dynamodb_service.get_resource
+    dynamodb_service.get_resource = lambda *args, **kwargs: resource
+    try:
+        yield resource
+    finally:
+        dynamodb_service.get_resource = original
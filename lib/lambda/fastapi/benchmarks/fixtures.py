@@ -0,0 +1,148 @@
+"""Shared fixtures for the offline FastAPI Lambda benchmarks.
+
+Benchmarks run against stand-ins for AgentCore so they need no AWS account.
+Run them from ``lib/lambda/fastapi`` (e.g. ``python benchmarks/bench_async_invocation.py``).
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict
+
+# Make the Lambda modules (models, services, utils, ...) importable
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# Keep per-invocation log lines out of benchmark output
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+BENCH_AGENT_RUNTIME_ARN = "arn:aws:bedrock-agentcore:us-east-1:000000000000:runtime/bench-agent"
+
+BENCH_CONFIG = {
+    "amount": "$5000",
+    "timeline": 30,
+    "stupidity": "Very stupid",
+    "architecture": "mixed",
+    "burning_style": "horizontal"
+}
+
+
+def sample_burn_plan_dict(num_services: int = 8, amount: float = 5000.0) -> Dict[str, Any]:
+    """Build a realistic agent burn plan payload whose costs sum to amount.
+
+    Args:
+        num_services: Number of services in the plan
+        amount: Total plan amount in dollars
+
+    Returns:
+        Burn plan dictionary as returned by the agent under 'analysis'
+    """
+    per_service = round(amount / num_services, 2)
+    services = [
+        {
+            "service_name": f"EC2-{i}",
+            "instance_type": "r7g.16xlarge",
+            "quantity": 2 + i,
+            "start_day": 0,
+            "end_day": -1,
+            "duration_used": "30 days",
+            "unit_cost": 3.23,
+            "total_cost": per_service,
+            "usage_pattern": "Running 24/7 with 2% CPU utilization",
+            "waste_factor": "Over-provisioned for a cron job that runs once a day",
+            "roast": "You've built a 747 to deliver a pizza, and then left the engines idling."
+        }
+        for i in range(num_services)
+    ]
+    return {
+        "total_amount": f"${amount:,.0f}",
+        "timeline_days": 30,
+        "efficiency_level": "Very stupid",
+        "architecture_type": "mixed",
+        "burning_style": "horizontal",
+        "services_deployed": services,
+        "total_calculated_cost": round(per_service * num_services, 2),
+        "deployment_scenario": "A startup followed a multi-region reference architecture for a todo app. " * 10,
+        "key_mistakes": ["Multi-region for a blog", "No autoscaling", "Forgot the dev stack"],
+        "recommendations": ["Use Lambda", "Turn things off", "Read the pricing page"],
+        "roast": "Congratulations, you've invented the world's most expensive filing cabinet."
+    }
+
+
+class _FakeExceptions:
+    """Exception classes exposed on ``client.exceptions`` like a boto3 client."""
+
+    class ThrottlingException(Exception):
+        pass
+
+    class InternalServerException(Exception):
+        pass
+
+    class AccessDeniedException(Exception):
+        pass
+
+    class UnauthorizedException(Exception):
+        pass
+
+    class ResourceNotFoundException(Exception):
+        pass
+
+    class InvalidInputException(Exception):
+        pass
+
+    class ValidationException(Exception):
+        pass
+
+
+class FakeAgentRuntimeClient:
+    """Stand-in for the boto3 bedrock-agentcore client with fixed latency."""
+
+    exceptions = _FakeExceptions
+
+    def __init__(self, latency: float = 0.5, num_services: int = 8):
+        """Initialize fake runtime client.
+
+        Args:
+            latency: Seconds each invoke_agent_runtime call blocks for
+            num_services: Number of services in the returned plan
+        """
+        self.latency = latency
+        self.calls = 0
+        self._body = json.dumps({
+            "status": "success",
+            "analysis": sample_burn_plan_dict(num_services)
+        }).encode()
+
+    def invoke_agent_runtime(self, **kwargs: Any) -> Dict[str, Any]:
+        """Block for the configured latency and return a canned response."""
+        from botocore.response import StreamingBody
+
+        self.calls += 1
+        time.sleep(self.latency)
+        return {
+            "response": StreamingBody(io.BytesIO(self._body), len(self._body)),
+            "contentType": "application/json"
+        }
+
+
+def make_agentcore_client(latency: float = 0.5, num_services: int = 8):
+    """Create an AgentCoreClient wired to a FakeAgentRuntimeClient.
+
+    Args:
+        latency: Seconds each agent invocation blocks for
+        num_services: Number of services in the returned plan
+
+    Returns:
+        AgentCoreClient instance
+    """
+    from utils.agentcore_client import AgentCoreClient
+
+    client = AgentCoreClient(agent_runtime_arn=BENCH_AGENT_RUNTIME_ARN, region="us-east-1")
+    client.client = FakeAgentRuntimeClient(latency=latency, num_services=num_services)
+    # Deadline-narrowed attempts would otherwise use real pooled clients
+    client._client_for_attempt = lambda read_timeout: client.client
+    return client
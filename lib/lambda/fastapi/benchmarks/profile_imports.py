@@ -0,0 +1,144 @@
+"""Profile cold-start import cost of the Lambda entry point.
+
+Imports ``main`` in fresh interpreters with ``-X importtime`` and reports the
+total cold import time plus the most expensive modules and top-level packages.
+
+With ``--check`` it doubles as a regression test: it exits non-zero when the
+median cold import exceeds the budget, or when a module that should only load
+on first use (boto3, botocore, ...) is imported at cold start.
+
+Usage:
+    python benchmarks/profile_imports.py [--module main] [--runs 5] [--top 15]
+    python benchmarks/profile_imports.py --check [--budget-ms 800]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Cold import budget for `import main`, in milliseconds
+DEFAULT_BUDGET_MS = float(os.environ.get("COLD_IMPORT_BUDGET_MS", "800"))
+# Packages that must load on first use, never at cold start
+LAZY_PACKAGES = ("boto3", "botocore", "s3transfer")
+
+_LINE_PATTERN = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+def profile_once(module: str) -> List[Tuple[str, int, int]]:
+    """Import a module in a fresh interpreter.
+
+    Args:
+        module: Module to import (e.g., 'main')
+
+    Returns:
+        (module name, self microseconds, cumulative microseconds) per imported module
+    """
+    env = {**os.environ, "PYTHONDONTWRITEBYTECODE": "1"}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=APP_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True
+    )
+
+    entries = []
+    for line in result.stderr.splitlines():
+        match = _LINE_PATTERN.match(line)
+        if match:
+            entries.append((match.group(4), int(match.group(1)), int(match.group(2))))
+    return entries
+
+
+def summarize(runs: List[List[Tuple[str, int, int]]], module: str) -> Dict[str, object]:
+    """Aggregate several profiling runs.
+
+    Args:
+        runs: Output of profile_once per run
+        module: Profiled module
+
+    Returns:
+        Median total, per-module self/cumulative medians and per-package self medians (ms)
+    """
+    totals = []
+    self_times: Dict[str, List[int]] = defaultdict(list)
+    cumulative_times: Dict[str, List[int]] = defaultdict(list)
+    package_times: Dict[str, List[int]] = defaultdict(list)
+
+    for entries in runs:
+        packages: Dict[str, int] = defaultdict(int)
+        for name, self_us, cumulative_us in entries:
+            self_times[name].append(self_us)
+            cumulative_times[name].append(cumulative_us)
+            packages[name.split(".")[0]] += self_us
+            if name == module:
+                totals.append(cumulative_us)
+        for package, self_us in packages.items():
+            package_times[package].append(self_us)
+
+    def median_ms(values: List[int]) -> float:
+        return statistics.median(values) / 1000.0
+
+    return {
+        "total_ms": median_ms(totals),
+        "modules": {name: (median_ms(self_times[name]), median_ms(cumulative_times[name])) for name in self_times},
+        "packages": {name: median_ms(values) for name, values in package_times.items()},
+    }
+
+
+def main() -> None:
+    """Profile the entry point and optionally enforce the cold import budget."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--module", default="main", help="Module to import cold")
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters to profile (median is reported)")
+    parser.add_argument("--top", type=int, default=15, help="Modules and packages to list")
+    parser.add_argument("--check", action="store_true", help="Fail if over budget or a lazy package is imported")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS, help="Cold import budget in ms")
+    args = parser.parse_args()
+
+    runs = [profile_once(args.module) for _ in range(args.runs)]
+    summary = summarize(runs, args.module)
+    modules = summary["modules"]
+    packages = summary["packages"]
+
+    print(f"Cold import of '{args.module}': {summary['total_ms']:.1f} ms (median of {args.runs} runs)")
+
+    print(f"\nTop {args.top} packages by self time:")
+    for name, self_ms in sorted(packages.items(), key=lambda item: item[1], reverse=True)[:args.top]:
+        print(f"  {self_ms:8.1f} ms  {name}")
+
+    print(f"\nTop {args.top} modules by cumulative time:")
+    print(f"  {'self':>8}    {'cumulative':>10}  module")
+    for name, (self_ms, cumulative_ms) in sorted(modules.items(), key=lambda item: item[1][1], reverse=True)[:args.top]:
+        print(f"  {self_ms:8.1f} ms {cumulative_ms:10.1f} ms  {name}")
+
+    if not args.check:
+        return
+
+    failures = []
+    if summary["total_ms"] > args.budget_ms:
+        failures.append(f"cold import took {summary['total_ms']:.1f} ms, budget is {args.budget_ms:.0f} ms")
+    eager = sorted(name for name in packages if name in LAZY_PACKAGES)
+    if eager:
+        failures.append(f"imported at cold start but should load on first use: {', '.join(eager)}")
+
+    print()
+    if failures:
+        for failure in failures:
+            print(f"FAIL: {failure}")
+        sys.exit(1)
+    print(f"OK: within {args.budget_ms:.0f} ms budget, no eager {'/'.join(LAZY_PACKAGES)} imports")
+
+
+if __name__ == "__main__":
+    main()
@@ -64,19 +64,92 @@ class BurnPlanResponse(BaseModel):
     """Response model for burn plan generation."""
 
     analysis: BurnPlan = Field(description="Generated burn plan analysis")
+    session_id: Optional[str] = Field(default=None, description="Session ID the burn plan is stored under")
     status: str = Field(default="success", description="Response status")
 
 
+class BurnPlanBatchGetRequest(BaseModel):
+    """Request model for fetching several stored burn plans."""
+
+    session_ids: List[str] = Field(min_length=1, max_length=100, description="Session IDs to fetch (up to 100)")
+
+
+class BurnPlanBatchGetResponse(BaseModel):
+    """Response model for fetching several stored burn plans."""
+
+    items: List[BurnPlanResponse] = Field(description="Plans found, in request order")
+    missing: List[str] = Field(default_factory=list, description="Session IDs with no stored plan")
+    unprocessed: List[str] = Field(
+        default_factory=list, description="Session IDs not read because of throttling (safe to request again)"
+    )
+
+
+class BurnPlanSummary(BaseModel):
+    """Compact listing entry for a stored burn plan."""
+
+    id: str = Field(description="Session ID")
+    timestamp: int = Field(description="Creation time (epoch milliseconds)")
+    total_amount: Optional[str] = Field(default=None, description="Total spending amount")
+    timeline_days: Optional[int] = Field(default=None, description="Timeline in days")
+    efficiency_level: Optional[str] = Field(default=None, description="Efficiency level")
+    architecture_type: Optional[str] = Field(default=None, description="Architecture type")
+    total_calculated_cost: Optional[float] = Field(default=None, description="Sum of all service costs")
+    service_count: Optional[int] = Field(default=None, description="Number of services deployed")
+    scenario_preview: Optional[str] = Field(default=None, description="Start of the deployment scenario")
+
+
+class BurnPlanSummaryPage(BaseModel):
+    """Page of burn plan summaries."""
+
+    items: List[BurnPlanSummary] = Field(description="Summaries, newest first")
+    next_cursor: Optional[str] = Field(default=None, description="Cursor for the next page (absent on the last page)")
+
+
+class BurnPlanJob(BaseModel):
+    """Asynchronous burn plan generation job."""
+
+    job_id: str = Field(description="Job ID to poll")
+    status: Literal["pending", "running", "succeeded", "failed"] = Field(
+        default="pending", description="Job status"
+    )
+    config: BurnConfig = Field(description="Burn configuration being generated")
+    created_at: int = Field(description="Creation time (epoch milliseconds)")
+    updated_at: int = Field(description="Last status change (epoch milliseconds)")
+    session_id: Optional[str] = Field(default=None, description="Session ID the burn plan is stored under once succeeded")
+    analysis: Optional[BurnPlan] = Field(default=None, description="Generated burn plan once succeeded")
+    error: Optional[str] = Field(default=None, description="Error message if the job failed")
+    error_status_code: Optional[int] = Field(
+        default=None, description="Status code the synchronous route would have returned for the error"
+    )
+
+
 class RoastRequest(BaseModel):
     """Request model for roast generation."""
 
     session_id: str = Field(description="Session ID to roast")
+    premium: bool = Field(
+        default=False, description="Have the agent write the roast instead of the local template engine"
+    )
+
+
+class RoastEquivalent(BaseModel):
+    """How many of an everyday item the money burned would have bought."""
+
+    item: str = Field(description="Everyday item (e.g., 'burritos')")
+    count: float = Field(description="Number of items")
 
 
 class RoastResponse(BaseModel):
     """Response model for roast generation."""
 
     roast_text: str = Field(description="Generated roast commentary")
+    session_id: Optional[str] = Field(default=None, description="Session ID that was roasted")
+    source: Literal["template", "agent"] = Field(
+        default="template", description="Whether the roast came from the local templates or the agent"
+    )
+    equivalents: List[RoastEquivalent] = Field(
+        default_factory=list, description="Everyday-item equivalents of the total spend"
+    )
 
 
 class HealthResponse(BaseModel):
@@ -2,28 +2,96 @@
 
 from __future__ import annotations
 
-import uuid
-from typing import Dict, Any, List
-
-from fastapi import APIRouter, HTTPException, Depends, status
-
-from models import BurnPlanRequest, BurnPlanResponse, BurnPlan
-from services.strands_service import StrandsService
+import json
+from functools import lru_cache
+from typing import AsyncIterator, Dict, Any, List, Literal, Optional
+
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Depends, Query, Request, status
+from fastapi.concurrency import iterate_in_threadpool, run_in_threadpool
+from fastapi.responses import JSONResponse, StreamingResponse
+
+from models import (
+    BurnPlanRequest,
+    BurnPlanResponse,
+    BurnPlan,
+    BurnPlanBatchGetRequest,
+    BurnPlanBatchGetResponse,
+    BurnPlanJob,
+    BurnPlanSummaryPage
+)
+from services.strands_service import StrandsService, AsyncStrandsService
 from services.dynamodb_service import DynamoDBService
+from services.burn_plan_cache import BurnPlanCache
+from services.single_flight import COALESCING_ENABLED, SingleFlight
+from services.shared_flight import SharedFlight
+from services.burn_plan_jobs import BurnPlanJobService, BurnPlanJobWorker, JobStore
+from services.write_behind import WriteBehindPersister
+from utils.deadline import Deadline
+from utils.session_ids import new_session_id
 from utils.agentcore_client import (
     AgentCoreClient,
+    AsyncAgentCoreClient,
     AgentCoreError,
     AgentTimeoutError,
-    AgentRateLimitError
+    AgentRateLimitError,
+    http_status_for_error
 )
 
 router = APIRouter(prefix="/burn-plan", tags=["burn-plan"])
+# Included by the app only where responses can stream (see BURN_PLAN_STREAM_ENABLED)
+stream_router = APIRouter(prefix="/burn-plan", tags=["burn-plan"])
+
+
+@lru_cache(maxsize=1)
+def _shared_agentcore_client() -> AgentCoreClient:
+    """Build the AgentCore client once per process (reused by warm invocations)."""
+    return AgentCoreClient()
+
+
+@lru_cache(maxsize=1)
+def _shared_dynamodb_service() -> DynamoDBService:
+    """Build the DynamoDB service once per process (reused by warm invocations)."""
+    return DynamoDBService()
+
+
+@lru_cache(maxsize=1)
+def get_burn_plan_cache() -> BurnPlanCache:
+    """Dependency to get the process-wide burn plan cache."""
+    return BurnPlanCache.from_env()
+
+
+@lru_cache(maxsize=1)
+def get_burn_plan_flights() -> Optional[SingleFlight]:
+    """Dependency to get the process-wide burn plan single-flight group (None if coalescing is off)."""
+    return SingleFlight() if COALESCING_ENABLED else None
+
+
+@lru_cache(maxsize=1)
+def get_burn_plan_shared_flights() -> Optional[SharedFlight]:
+    """Dependency to get the cross-container burn plan flight group (None without a shared cache table)."""
+    table_name = get_burn_plan_cache().table_name
+    return SharedFlight(table_name) if COALESCING_ENABLED and table_name else None
+
+
+def _build_job_worker(store: JobStore) -> BurnPlanJobWorker:
+    """Build a worker sharing this process's clients (in-process job queue only)."""
+    return BurnPlanJobWorker(
+        store,
+        StrandsService(_shared_agentcore_client(), cache=get_burn_plan_cache()),
+        _shared_dynamodb_service()
+    )
+
+
+@lru_cache(maxsize=1)
+def get_burn_plan_jobs() -> BurnPlanJobService:
+    """Dependency to get the process-wide burn plan job service."""
+    return BurnPlanJobService.from_env(_build_job_worker)
 
 
 def get_agentcore_client() -> AgentCoreClient:
     """Dependency to get AgentCore client instance."""
     try:
-        return AgentCoreClient()
+        return _shared_agentcore_client()
     except AgentCoreError as e:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
@@ -32,49 +100,112 @@ def get_agentcore_client() -> AgentCoreClient:
 
 
 def get_strands_service(
-    client: AgentCoreClient = Depends(get_agentcore_client)
+    client: AgentCoreClient = Depends(get_agentcore_client),
+    cache: BurnPlanCache = Depends(get_burn_plan_cache)
 ) -> StrandsService:
     """Dependency to get Strands service instance."""
-    return StrandsService(client)
+    return StrandsService(client, cache=cache)
+
+
+def get_async_strands_service(
+    client: AgentCoreClient = Depends(get_agentcore_client),
+    cache: BurnPlanCache = Depends(get_burn_plan_cache),
+    flights: Optional[SingleFlight] = Depends(get_burn_plan_flights),
+    shared_flights: Optional[SharedFlight] = Depends(get_burn_plan_shared_flights)
+) -> AsyncStrandsService:
+    """Dependency to get a Strands service that does not block the event loop."""
+    return AsyncStrandsService(
+        AsyncAgentCoreClient(client),
+        cache=cache,
+        flights=flights,
+        shared_flights=shared_flights
+    )
+
+
+def get_request_deadline(request: Request) -> Deadline:
+    """Dependency to get the deadline for the current request.
+
+    Bounded by the Lambda invocation's remaining time when running under
+    Mangum, which exposes the Lambda context as scope["aws.context"].
+    """
+    return Deadline.for_request(request.scope.get("aws.context"))
 
 
 def get_dynamodb_service() -> DynamoDBService:
     """Dependency to get DynamoDB service instance."""
-    return DynamoDBService()
+    return _shared_dynamodb_service()
+
 
+@lru_cache(maxsize=1)
+def get_burn_plan_writer() -> WriteBehindPersister:
+    """Dependency to get the process-wide burn plan writer (BURN_PLAN_WRITE_MODE)."""
+    return WriteBehindPersister.from_env(_shared_dynamodb_service())
 
-@router.post("", response_model=BurnPlanResponse, status_code=status.HTTP_201_CREATED)
+
+@router.post(
+    "",
+    response_model=BurnPlanResponse,
+    status_code=status.HTTP_201_CREATED,
+    responses={status.HTTP_202_ACCEPTED: {"model": BurnPlanJob, "description": "Job queued (mode=async)"}}
+)
 async def create_burn_plan(
     request: BurnPlanRequest,
-    strands_service: StrandsService = Depends(get_strands_service),
-    dynamodb_service: DynamoDBService = Depends(get_dynamodb_service)
+    background_tasks: BackgroundTasks,
+    mode: Literal["sync", "async"] = Query(
+        default="sync",
+        description="sync waits for the plan; async queues a job and returns 202 with its ID"
+    ),
+    strands_service: AsyncStrandsService = Depends(get_async_strands_service),
+    dynamodb_service: DynamoDBService = Depends(get_dynamodb_service),
+    jobs: BurnPlanJobService = Depends(get_burn_plan_jobs),
+    writer: WriteBehindPersister = Depends(get_burn_plan_writer),
+    deadline: Deadline = Depends(get_request_deadline)
 ) -> BurnPlanResponse:
     """Generate a new burn plan.
 
     Args:
         request: Burn plan configuration
+        background_tasks: Tasks run after the response (write-behind storage)
+        mode: Whether to wait for the plan or queue a job for it
         strands_service: Strands service instance
         dynamodb_service: DynamoDB service instance
+        jobs: Burn plan job service instance
+        writer: Burn plan writer (stores before or after responding)
+        deadline: Request deadline bounding agent retries
 
     Returns:
-        Generated burn plan with session ID
+        Generated burn plan with session ID, or the pending job for mode=async
 
     Raises:
-        HTTPException: If burn plan generation fails
+        HTTPException: If burn plan generation (or queueing the job) fails
     """
+    if mode == "async":
+        try:
+            job = await run_in_threadpool(jobs.submit, request.config)
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail=f"Failed to queue burn plan job: {str(e)}"
+            )
+        return JSONResponse(status_code=status.HTTP_202_ACCEPTED, content=job.model_dump(mode="json"))
+
     try:
-        # Generate burn plan via Strands agent
-        burn_plan = strands_service.generate_burn_plan(request.config)
+        # Generate burn plan via Strands agent (offloaded, event loop stays free)
+        burn_plan = await strands_service.generate_burn_plan(request.config, deadline=deadline)
 
         # Generate session ID
-        session_id = str(uuid.uuid4())
+        session_id = new_session_id()
 
-        # Store burn plan in DynamoDB
-        dynamodb_service.store_burn_plan(session_id, burn_plan)
+        # Store burn plan in DynamoDB, now or after the response is sent
+        if writer.background:
+            writer.stage(session_id, burn_plan)
+            background_tasks.add_task(writer.persist, session_id, burn_plan)
+        else:
+            await run_in_threadpool(dynamodb_service.store_burn_plan, session_id, burn_plan)
 
         return BurnPlanResponse(
             session_id=session_id,
-            burn_plan=burn_plan
+            analysis=burn_plan
         )
 
     except AgentTimeoutError as e:
@@ -107,6 +238,147 @@ async def create_burn_plan(
         )
 
 
+def _sse_event(event: str, data: Any) -> str:
+    """Format a Server-Sent Events message."""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+@stream_router.post("/stream")
+async def stream_burn_plan(
+    request: BurnPlanRequest,
+    background_tasks: BackgroundTasks,
+    deadline: Deadline = Depends(get_request_deadline),
+    strands_service: StrandsService = Depends(get_strands_service),
+    dynamodb_service: DynamoDBService = Depends(get_dynamodb_service),
+    writer: WriteBehindPersister = Depends(get_burn_plan_writer)
+) -> StreamingResponse:
+    """Generate a new burn plan, streamed as Server-Sent Events.
+
+    Events, in order:
+        service: one per ServiceCost, as soon as the agent has produced it
+        narrative: deployment_scenario, key_mistakes, recommendations, roast
+            and the rest of the validated plan; also services_deployed when
+            the cost solver adjusted the streamed services
+        done: session ID the plan is stored under
+        error: sent instead of the remaining events if generation fails,
+            with the status code the non-streaming route would return
+
+    Args:
+        request: Burn plan configuration
+        background_tasks: Tasks run after the stream ends (write-behind storage)
+        deadline: Request deadline (from the Lambda context when available)
+        strands_service: Strands service instance
+        dynamodb_service: DynamoDB service instance
+        writer: Burn plan writer (stores before or after the done event)
+
+    Returns:
+        text/event-stream response
+    """
+    async def events() -> AsyncIterator[str]:
+        try:
+            burn_plan = None
+            streamed = []
+            stream = iterate_in_threadpool(strands_service.stream_burn_plan(request.config, deadline))
+            async for kind, value in stream:
+                if kind == "service":
+                    streamed.append(value)
+                    yield _sse_event("service", value.model_dump())
+                else:
+                    burn_plan = value
+
+            session_id = new_session_id()
+            if writer.background:
+                # Runs once the stream ends, even if the client disconnects first
+                writer.stage(session_id, burn_plan)
+                background_tasks.add_task(writer.persist, session_id, burn_plan)
+            else:
+                await run_in_threadpool(dynamodb_service.store_burn_plan, session_id, burn_plan)
+
+            # Services the cost solver adjusted replace the streamed ones
+            exclude = {"services_deployed"} if streamed == burn_plan.services_deployed else None
+            yield _sse_event("narrative", burn_plan.model_dump(exclude=exclude))
+            yield _sse_event("done", {"session_id": session_id, "status": "success"})
+
+        except Exception as e:
+            error = {"status_code": http_status_for_error(e), "detail": str(e)}
+            if isinstance(e, AgentRateLimitError) and e.retry_after:
+                error["retry_after"] = e.retry_after
+            yield _sse_event("error", error)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+@router.get("/jobs/{job_id}", response_model=BurnPlanJob, status_code=status.HTTP_200_OK)
+async def get_burn_plan_job(
+    job_id: str,
+    jobs: BurnPlanJobService = Depends(get_burn_plan_jobs)
+) -> BurnPlanJob:
+    """Get the status of a burn plan job, and its result once finished.
+
+    Args:
+        job_id: Job ID returned by POST /burn-plan?mode=async
+        jobs: Burn plan job service instance
+
+    Returns:
+        The job: pending or running, succeeded with session_id and analysis,
+        or failed with error and error_status_code
+
+    Raises:
+        HTTPException: If the job does not exist or cannot be read
+    """
+    try:
+        job = await run_in_threadpool(jobs.get, job_id)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to retrieve burn plan job: {str(e)}"
+        )
+
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Burn plan job {job_id} not found"
+        )
+
+    return job
+
+
+@router.get("/cache/stats", status_code=status.HTTP_200_OK)
+def get_burn_plan_cache_stats(
+    cache: BurnPlanCache = Depends(get_burn_plan_cache),
+    flights: Optional[SingleFlight] = Depends(get_burn_plan_flights),
+    shared_flights: Optional[SharedFlight] = Depends(get_burn_plan_shared_flights),
+    dynamodb_service: DynamoDBService = Depends(get_dynamodb_service),
+    writer: WriteBehindPersister = Depends(get_burn_plan_writer)
+) -> Dict[str, Any]:
+    """Get burn plan cache and request coalescing counters for this process.
+
+    Args:
+        cache: Burn plan cache instance
+        flights: Burn plan single-flight group (None if coalescing is off)
+        shared_flights: Cross-container flight group (None without a shared cache table)
+        dynamodb_service: DynamoDB service instance
+        writer: Burn plan writer
+
+    Returns:
+        Cache counters, hit ratio and configuration, plus coalescing counters
+        (agent executions, requests coalesced onto them, generations in flight;
+        None if coalescing is off) in process and across containers, the
+        stored-session cache counters and write-behind counters
+    """
+    return {
+        **cache.stats(),
+        "coalescing": flights.stats() if flights is not None else None,
+        "shared_coalescing": shared_flights.stats() if shared_flights is not None else None,
+        "sessions": dynamodb_service.session_cache.stats(),
+        "writes": writer.stats()
+    }
+
+
 @router.get("/recent", response_model=List[dict], status_code=status.HTTP_200_OK)
 async def get_recent_burn_plans(
     limit: int = 5,
@@ -131,7 +403,7 @@ async def get_recent_burn_plans(
                 detail="Limit must be between 1 and 20"
             )
 
-        burn_plans = dynamodb_service.get_recent_burn_plans(limit)
+        burn_plans = await run_in_threadpool(dynamodb_service.get_recent_burn_plans, limit)
 
         return burn_plans
 
@@ -143,3 +415,118 @@ async def get_recent_burn_plans(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to retrieve burn plans: {str(e)}"
         )
+
+
+@router.get("", response_model=BurnPlanSummaryPage, status_code=status.HTTP_200_OK)
+async def list_burn_plans(
+    limit: int = Query(default=20, ge=1, le=100, description="Summaries per page"),
+    cursor: Optional[str] = Query(default=None, description="next_cursor from the previous page"),
+    dynamodb_service: DynamoDBService = Depends(get_dynamodb_service)
+) -> BurnPlanSummaryPage:
+    """List stored burn plan summaries, newest first.
+
+    Args:
+        limit: Maximum number of summaries in the page (1-100)
+        cursor: Opaque cursor from the previous page
+        dynamodb_service: DynamoDB service instance
+
+    Returns:
+        Page of summaries and the cursor for the next page
+
+    Raises:
+        HTTPException: If the cursor is invalid or retrieval fails
+    """
+    try:
+        items, next_cursor = await run_in_threadpool(
+            dynamodb_service.list_burn_plan_summaries, limit, cursor
+        )
+
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to retrieve burn plans: {str(e)}"
+        )
+
+    return BurnPlanSummaryPage(items=items, next_cursor=next_cursor)
+
+
+@router.post("/batch-get", response_model=BurnPlanBatchGetResponse, status_code=status.HTTP_200_OK)
+async def batch_get_burn_plans(
+    request: BurnPlanBatchGetRequest,
+    dynamodb_service: DynamoDBService = Depends(get_dynamodb_service)
+) -> BurnPlanBatchGetResponse:
+    """Get up to 100 stored burn plans in one request.
+
+    Args:
+        request: Session IDs to fetch
+        dynamodb_service: DynamoDB service instance
+
+    Returns:
+        Plans found in request order, plus the IDs that are missing or were
+        left unprocessed by throttling
+
+    Raises:
+        HTTPException: If retrieval fails
+    """
+    try:
+        found, missing, unprocessed = await run_in_threadpool(
+            dynamodb_service.batch_get_burn_plans, request.session_ids
+        )
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to retrieve burn plans: {str(e)}"
+        )
+
+    return BurnPlanBatchGetResponse(
+        items=[
+            BurnPlanResponse(session_id=session_id, analysis=found[session_id])
+            for session_id in dict.fromkeys(request.session_ids)
+            if session_id in found
+        ],
+        missing=missing,
+        unprocessed=unprocessed
+    )
+
+
+# Declared last so the catch-all path does not shadow /recent and the other static routes
+@router.get("/{session_id}", response_model=BurnPlanResponse, status_code=status.HTTP_200_OK)
+async def get_burn_plan(
+    session_id: str,
+    dynamodb_service: DynamoDBService = Depends(get_dynamodb_service)
+) -> BurnPlanResponse:
+    """Get a stored burn plan by session ID.
+
+    Args:
+        session_id: Session ID returned when the plan was generated
+        dynamodb_service: DynamoDB service instance
+
+    Returns:
+        The full burn plan with its session ID
+
+    Raises:
+        HTTPException: If the plan does not exist or retrieval fails
+    """
+    try:
+        burn_plan = await run_in_threadpool(dynamodb_service.get_burn_plan, session_id)
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to retrieve burn plan: {str(e)}"
+        )
+
+    if burn_plan is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Burn plan {session_id} not found"
+        )
+
+    return BurnPlanResponse(session_id=session_id, analysis=burn_plan)
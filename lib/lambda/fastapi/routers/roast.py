@@ -3,16 +3,25 @@
 from __future__ import annotations
 
 from fastapi import APIRouter, HTTPException, Depends, status
+from fastapi.concurrency import run_in_threadpool
 
-from models import RoastRequest, RoastResponse, BurnPlan
-from services.strands_service import StrandsService
+from models import RoastRequest, RoastResponse
+from services.dynamodb_service import DynamoDBService
+from services.roast_engine import build_roast, everyday_equivalents
 from utils.agentcore_client import (
-    AgentCoreClient,
     AgentCoreError,
     AgentTimeoutError,
     AgentRateLimitError
 )
-from routers.burn_plan import get_agentcore_client, get_strands_service
+from utils.deadline import Deadline
+from routers.burn_plan import (
+    get_agentcore_client,
+    get_async_strands_service,
+    get_burn_plan_cache,
+    get_burn_plan_flights,
+    get_dynamodb_service,
+    get_request_deadline
+)
 
 router = APIRouter(prefix="/roast", tags=["roast"])
 
@@ -20,38 +29,54 @@ router = APIRouter(prefix="/roast", tags=["roast"])
 @router.post("", response_model=RoastResponse)
 async def generate_roast(
     request: RoastRequest,
-    strands_service: StrandsService = Depends(get_strands_service)
+    dynamodb_service: DynamoDBService = Depends(get_dynamodb_service),
+    deadline: Deadline = Depends(get_request_deadline)
 ) -> RoastResponse:
     """Generate roast commentary for a burn session.
 
+    Roasts come from the local template engine unless the request asks for a
+    premium roast, which invokes the agent.
+
     Args:
         request: Roast request with session ID
-        strands_service: Strands service instance
+        dynamodb_service: DynamoDB service instance
+        deadline: Request deadline bounding agent retries (premium only)
 
     Returns:
         Generated roast commentary
 
     Raises:
-        HTTPException: If roast generation fails
+        HTTPException: If the session does not exist or roast generation fails
     """
     try:
-        # TODO: Retrieve burn plan from DynamoDB using session_id
-        # For now, return a placeholder error
-        raise HTTPException(
-            status_code=status.HTTP_501_NOT_IMPLEMENTED,
-            detail="Session retrieval not yet implemented. Store burn plan in request for now."
+        burn_plan = await run_in_threadpool(dynamodb_service.get_burn_plan, request.session_id)
+        if burn_plan is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Session {request.session_id} not found"
+            )
+
+        if not request.premium:
+            roast = build_roast(burn_plan, request.session_id)
+            return RoastResponse(
+                roast_text=roast.text,
+                session_id=request.session_id,
+                equivalents=roast.equivalents
+            )
+
+        # The AgentCore client is only built for premium roasts, so template
+        # roasts work even where the agent runtime is not configured
+        strands_service = get_async_strands_service(
+            get_agentcore_client(), get_burn_plan_cache(), get_burn_plan_flights()
         )
+        roast_text = await strands_service.generate_roast(burn_plan, deadline=deadline)
 
-        # burn_plan = session_service.get_session(request.session_id)
-        # if not burn_plan:
-        #     raise HTTPException(
-        #         status_code=status.HTTP_404_NOT_FOUND,
-        #         detail=f"Session {request.session_id} not found"
-        #     )
-
-        # roast_text = strands_service.generate_roast(burn_plan)
-
-        # return RoastResponse(roast_text=roast_text)
+        return RoastResponse(
+            roast_text=roast_text,
+            session_id=request.session_id,
+            source="agent",
+            equivalents=everyday_equivalents(burn_plan.total_calculated_cost)
+        )
 
     except AgentTimeoutError as e:
         raise HTTPException(
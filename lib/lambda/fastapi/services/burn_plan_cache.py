@@ -0,0 +1,302 @@
+"""Two-tier cache of generated burn plans keyed on the normalized burn config."""
+
+from __future__ import annotations
+
+import os
+import random
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from models import BurnConfig, BurnPlan
+from utils.aws_clients import get_resource
+from utils.structured_logging import get_logger
+
+logger = get_logger("burn_plan_cache")
+
+CACHE_KEY_VERSION = "v1"
+
+# Conditional shared-tier writes retried after losing a slot to another container
+SHARED_PUT_ATTEMPTS = 3
+
+
+def normalize_config_key(config: BurnConfig) -> str:
+    """Build the cache key for a burn config.
+
+    Amounts that only differ in formatting ("$1,000", "$1000.00") share a key;
+    different currencies do not.
+
+    Args:
+        config: Burn configuration
+
+    Returns:
+        Cache key string
+    """
+    amount = config.amount.strip()
+    match = re.search(r"[\d,]+\.?\d*", amount)
+    if match:
+        currency = amount[:match.start()].strip() or "$"
+        value = float(match.group().replace(",", ""))
+        amount = f"{currency}{value:.2f}"
+
+    return "|".join([
+        CACHE_KEY_VERSION,
+        amount,
+        str(config.timeline),
+        config.stupidity,
+        config.architecture,
+        config.burning_style
+    ])
+
+
+class BurnPlanCache:
+    """In-process LRU of burn plans backed by an optional shared DynamoDB tier.
+
+    Each key holds up to ``variants_per_key`` distinct plans. A key only counts
+    as a hit once all its variant slots are filled; until then lookups miss so
+    that fresh generations add variety, and afterwards a random variant is
+    served. Entries expire after ``ttl_seconds`` in both tiers.
+
+    Shared-tier slots are chosen from the table rather than from the local
+    tier, and claimed with a conditional write, so containers storing plans
+    for the same key fill distinct slots instead of overwriting each other.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        ttl_seconds: int = 3600,
+        variants_per_key: int = 3,
+        table_name: Optional[str] = None
+    ):
+        """Initialize burn plan cache.
+
+        Args:
+            max_entries: Maximum number of config keys held in process
+            ttl_seconds: Seconds a cached plan stays valid
+            variants_per_key: Number of distinct plans kept per config key
+            table_name: DynamoDB table for the shared tier (disabled if omitted)
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.variants_per_key = max(1, variants_per_key)
+        self.table_name = table_name
+        self._entries: "OrderedDict[str, List[Tuple[float, str]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"local_hits": 0, "shared_hits": 0, "misses": 0, "stores": 0, "shared_errors": 0}
+
+    @classmethod
+    def from_env(cls) -> "BurnPlanCache":
+        """Create a cache configured from BURN_PLAN_CACHE_* environment variables."""
+        return cls(
+            max_entries=int(os.environ.get("BURN_PLAN_CACHE_MAX_ENTRIES", "256")),
+            ttl_seconds=int(os.environ.get("BURN_PLAN_CACHE_TTL_SECONDS", "3600")),
+            variants_per_key=int(os.environ.get("BURN_PLAN_CACHE_VARIANTS", "3")),
+            table_name=os.environ.get("BURN_PLAN_CACHE_TABLE_NAME") or None
+        )
+
+    @property
+    def shared_enabled(self) -> bool:
+        """Whether the shared DynamoDB tier is configured."""
+        return bool(self.table_name)
+
+    def get(self, config: BurnConfig) -> Optional[BurnPlan]:
+        """Look up a cached plan, checking the local tier then the shared tier.
+
+        Args:
+            config: Burn configuration
+
+        Returns:
+            A cached burn plan variant, or None on a miss
+        """
+        plan = self.get_local(config)
+        if plan is None and self.shared_enabled:
+            plan = self.get_shared(config)
+        if plan is None:
+            self._count("misses")
+        return plan
+
+    def get_local(self, config: BurnConfig) -> Optional[BurnPlan]:
+        """Look up a plan in the in-process tier only (no miss is counted).
+
+        Args:
+            config: Burn configuration
+
+        Returns:
+            A cached burn plan variant, or None if the key is not fully populated
+        """
+        key = normalize_config_key(config)
+        now = time.time()
+
+        with self._lock:
+            variants = self._entries.get(key)
+            if variants is None:
+                return None
+            variants = [(expires_at, data) for expires_at, data in variants if expires_at > now]
+            if not variants:
+                del self._entries[key]
+                return None
+            self._entries[key] = variants
+            self._entries.move_to_end(key)
+            if len(variants) < self.variants_per_key:
+                return None
+            self._stats["local_hits"] += 1
+            data = random.choice(variants)[1]
+
+        return BurnPlan.model_validate_json(data)
+
+    def get_shared(self, config: BurnConfig) -> Optional[BurnPlan]:
+        """Look up a plan in the shared DynamoDB tier (no miss is counted).
+
+        Shared variants are copied into the local tier. Errors are counted and
+        treated as misses so a cache outage never fails a request.
+
+        Args:
+            config: Burn configuration
+
+        Returns:
+            A cached burn plan variant, or None if the key is not fully populated
+        """
+        key = normalize_config_key(config)
+        now = int(time.time())
+
+        from boto3.dynamodb.conditions import Key
+
+        try:
+            response = self._table().query(KeyConditionExpression=Key("cache_key").eq(key))
+        except Exception as e:
+            self._count("shared_errors")
+            logger.warning("Burn plan cache shared lookup failed", extra={"fields": {"error": str(e)}})
+            return None
+
+        # DynamoDB TTL deletes lazily, so expired items can still be returned
+        variants = [
+            (float(item["expires_at"]), item["plan"])
+            for item in response.get("Items", [])
+            if int(item.get("expires_at", 0)) > now
+        ]
+        if len(variants) < self.variants_per_key:
+            return None
+
+        with self._lock:
+            self._entries[key] = variants[:self.variants_per_key]
+            self._entries.move_to_end(key)
+            self._evict()
+            self._stats["shared_hits"] += 1
+
+        return BurnPlan.model_validate_json(random.choice(variants)[1])
+
+    def put(self, config: BurnConfig, burn_plan: BurnPlan) -> None:
+        """Store a freshly generated plan as a variant for its config.
+
+        Args:
+            config: Burn configuration the plan was generated for
+            burn_plan: Generated burn plan
+        """
+        key = normalize_config_key(config)
+        data = burn_plan.model_dump_json()
+        expires_at = time.time() + self.ttl_seconds
+
+        with self._lock:
+            variants = self._entries.get(key, [])
+            if len(variants) >= self.variants_per_key:
+                # Replace the variant closest to expiry
+                variants.sort()
+                variants = variants[1:]
+            variants.append((expires_at, data))
+            self._entries[key] = variants
+            self._entries.move_to_end(key)
+            self._evict()
+            self._stats["stores"] += 1
+
+        if self.shared_enabled:
+            try:
+                self._put_shared(key, data, int(expires_at))
+            except Exception as e:
+                self._count("shared_errors")
+                logger.warning("Burn plan cache shared store failed", extra={"fields": {"error": str(e)}})
+
+    def _put_shared(self, key: str, data: str, expires_at: int) -> None:
+        """Write a variant to the shared tier in a slot chosen from the table.
+
+        Takes the lowest free (missing or expired) slot, else the variant
+        closest to expiry. The write is conditional on the slot still holding
+        what was read; a container that loses the slot to a concurrent store
+        rereads the slots and tries again.
+
+        Args:
+            key: Cache key
+            data: Serialized burn plan
+            expires_at: Epoch seconds the variant expires at
+        """
+        from boto3.dynamodb.conditions import Attr, Key
+        from botocore.exceptions import ClientError
+
+        table = self._table()
+        for _ in range(SHARED_PUT_ATTEMPTS):
+            response = table.query(
+                KeyConditionExpression=Key("cache_key").eq(key),
+                ProjectionExpression="variant, expires_at"
+            )
+            slots = {int(item["variant"]): int(item.get("expires_at", 0)) for item in response.get("Items", [])}
+            now = int(time.time())
+            free = [slot for slot in range(self.variants_per_key) if slots.get(slot, 0) <= now]
+            slot = free[0] if free else min(slots, key=slots.get)
+
+            if slot in slots:
+                condition = Attr("expires_at").eq(slots[slot])
+            else:
+                condition = Attr("cache_key").not_exists()
+            try:
+                table.put_item(
+                    Item={"cache_key": key, "variant": slot, "plan": data, "expires_at": expires_at},
+                    ConditionExpression=condition
+                )
+                return
+            except ClientError as e:
+                if e.response.get("Error", {}).get("Code") != "ConditionalCheckFailedException":
+                    raise
+
+        logger.info("Burn plan cache shared store skipped, slots kept changing", extra={"fields": {"key": key}})
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and sizing for tuning.
+
+        Returns:
+            Dictionary of counters, hit ratio and current configuration
+        """
+        with self._lock:
+            stats: Dict[str, Any] = dict(self._stats)
+            stats["local_entries"] = len(self._entries)
+
+        hits = stats["local_hits"] + stats["shared_hits"]
+        lookups = hits + stats["misses"]
+        stats["hit_ratio"] = round(hits / lookups, 4) if lookups else 0.0
+        stats["max_entries"] = self.max_entries
+        stats["ttl_seconds"] = self.ttl_seconds
+        stats["variants_per_key"] = self.variants_per_key
+        stats["shared_enabled"] = self.shared_enabled
+        return stats
+
+    def clear(self) -> None:
+        """Drop all local entries and reset counters."""
+        with self._lock:
+            self._entries.clear()
+            for name in self._stats:
+                self._stats[name] = 0
+
+    def _count(self, name: str) -> None:
+        """Increment a stats counter."""
+        with self._lock:
+            self._stats[name] += 1
+
+    def _evict(self) -> None:
+        """Drop least recently used keys beyond max_entries (caller holds the lock)."""
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _table(self):
+        """Shared tier table bound to this thread's pooled DynamoDB resource."""
+        return get_resource("dynamodb").Table(self.table_name)
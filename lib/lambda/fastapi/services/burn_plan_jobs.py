@@ -0,0 +1,413 @@
+"""Asynchronous burn plan jobs: pluggable job stores, queues and the worker.
+
+``POST /burn-plan?mode=async`` records a pending job and enqueues its ID; a
+worker picks it up, generates and stores the plan, and records the outcome on
+the job for ``GET /burn-plan/jobs/{id}`` to report. In AWS the queue is SQS and
+the worker is a separate Lambda (``worker.py``), so the API Lambda returns as
+soon as the job is queued. Locally, an in-process or spool-directory queue and
+a memory or file store stand in for SQS and DynamoDB.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
+
+from models import BurnConfig, BurnPlanJob
+from services.dynamodb_service import DynamoDBService
+from services.strands_service import StrandsService
+from utils.agentcore_client import http_status_for_error
+from utils.aws_clients import get_client, get_resource
+from utils.deadline import Deadline
+from utils.session_ids import new_session_id
+from utils.structured_logging import get_logger
+
+logger = get_logger("burn_plan_jobs")
+
+# Time a worker gives one generation; the worker Lambda's timeout caps it further
+BURN_PLAN_JOB_BUDGET_SECONDS = float(os.environ.get("BURN_PLAN_JOB_BUDGET_SECONDS", "110"))
+# How long job records are kept (DynamoDB TTL)
+BURN_PLAN_JOB_TTL_SECONDS = int(os.environ.get("BURN_PLAN_JOB_TTL_SECONDS", "86400"))
+
+TERMINAL_STATUSES = ("succeeded", "failed")
+
+
+def _now_ms() -> int:
+    """Current time in epoch milliseconds."""
+    return int(time.time() * 1000)
+
+
+def _write_atomic(path: str, data: str) -> None:
+    """Write a file so concurrent readers never see a partial document."""
+    tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+class JobStore(ABC):
+    """Storage for burn plan job records."""
+
+    @abstractmethod
+    def save(self, job: BurnPlanJob) -> None:
+        """Create or replace a job record.
+
+        Args:
+            job: Job to store
+        """
+
+    @abstractmethod
+    def get(self, job_id: str) -> Optional[BurnPlanJob]:
+        """Load a job record.
+
+        Args:
+            job_id: Job ID
+
+        Returns:
+            The job, or None if it does not exist (or has expired)
+        """
+
+
+class InMemoryJobStore(JobStore):
+    """Job store held in this process (local development and tests)."""
+
+    def __init__(self):
+        """Initialize in-memory job store."""
+        self._jobs: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def save(self, job: BurnPlanJob) -> None:
+        data = job.model_dump_json()
+        with self._lock:
+            self._jobs[job.job_id] = data
+
+    def get(self, job_id: str) -> Optional[BurnPlanJob]:
+        with self._lock:
+            data = self._jobs.get(job_id)
+        return BurnPlanJob.model_validate_json(data) if data is not None else None
+
+
+class LocalFileJobStore(JobStore):
+    """Job store with one JSON file per job, shared by processes on one machine."""
+
+    def __init__(self, directory: str):
+        """Initialize file job store.
+
+        Args:
+            directory: Directory holding the job files (created if missing)
+        """
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def save(self, job: BurnPlanJob) -> None:
+        _write_atomic(self._path(job.job_id), job.model_dump_json())
+
+    def get(self, job_id: str) -> Optional[BurnPlanJob]:
+        try:
+            with open(self._path(job_id), encoding="utf-8") as f:
+                return BurnPlanJob.model_validate_json(f.read())
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def _path(self, job_id: str) -> str:
+        """File path for a job (raises ValueError unless job_id is a UUID)."""
+        return os.path.join(self.directory, f"{uuid.UUID(job_id)}.json")
+
+
+class DynamoDBJobStore(JobStore):
+    """Job store backed by a DynamoDB table keyed on job_id, expiring via TTL."""
+
+    def __init__(self, table_name: str, ttl_seconds: int = BURN_PLAN_JOB_TTL_SECONDS):
+        """Initialize DynamoDB job store.
+
+        Args:
+            table_name: Jobs table name
+            ttl_seconds: Seconds a job record is kept after its last update
+        """
+        self.table_name = table_name
+        self.ttl_seconds = ttl_seconds
+
+    def save(self, job: BurnPlanJob) -> None:
+        # The job is stored as one JSON attribute so plans need no Decimal conversion
+        self._table().put_item(Item={
+            "job_id": job.job_id,
+            "status": job.status,
+            "job": job.model_dump_json(),
+            "expires_at": int(time.time()) + self.ttl_seconds
+        })
+
+    def get(self, job_id: str) -> Optional[BurnPlanJob]:
+        item = self._table().get_item(Key={"job_id": job_id}, ConsistentRead=True).get("Item")
+        # DynamoDB TTL deletes lazily, so expired items can still be returned
+        if item is None or int(item.get("expires_at", 0)) <= int(time.time()):
+            return None
+        return BurnPlanJob.model_validate_json(item["job"])
+
+    def _table(self):
+        """Jobs table bound to this thread's pooled DynamoDB resource."""
+        return get_resource("dynamodb").Table(self.table_name)
+
+
+class JobQueue(ABC):
+    """Delivery of job IDs to a worker."""
+
+    @abstractmethod
+    def enqueue(self, job_id: str) -> None:
+        """Hand a job to the worker.
+
+        Args:
+            job_id: ID of a job already saved in the job store
+        """
+
+
+class InProcessJobQueue(JobQueue):
+    """Run jobs on a thread pool in this process (local development and tests).
+
+    Under Lambda the execution environment is frozen once the response is
+    sent, so this queue is only suitable for long-lived servers.
+    """
+
+    def __init__(self, worker_factory: Callable[[], "BurnPlanJobWorker"], max_workers: int = 4):
+        """Initialize in-process queue.
+
+        Args:
+            worker_factory: Builds the worker on first use
+            max_workers: Jobs processed concurrently
+        """
+        self._worker_factory = worker_factory
+        self._worker: Optional[BurnPlanJobWorker] = None
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="burn-plan-job")
+        self._futures: List[Future] = []
+        self._lock = threading.Lock()
+
+    def enqueue(self, job_id: str) -> None:
+        with self._lock:
+            if self._worker is None:
+                self._worker = self._worker_factory()
+            self._futures = [f for f in self._futures if not f.done()]
+            self._futures.append(self._executor.submit(self._worker.process, job_id))
+
+    def join(self, timeout: Optional[float] = None) -> None:
+        """Wait for every job enqueued so far to finish.
+
+        Args:
+            timeout: Seconds to wait per job (no limit if omitted)
+        """
+        with self._lock:
+            futures = list(self._futures)
+        for future in futures:
+            future.result(timeout=timeout)
+
+
+class LocalFileJobQueue(JobQueue):
+    """Spool-directory queue drained by ``python worker.py --spool DIR``."""
+
+    def __init__(self, directory: str):
+        """Initialize spool-directory queue.
+
+        Args:
+            directory: Spool directory for queued messages (created if missing)
+        """
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def enqueue(self, job_id: str) -> None:
+        # Millisecond prefix keeps the spool in arrival order when listed
+        name = f"{_now_ms():013d}-{uuid.UUID(job_id)}.msg"
+        _write_atomic(os.path.join(self.directory, name), json.dumps({"job_id": job_id}))
+
+    def drain(self, worker: "BurnPlanJobWorker") -> int:
+        """Process every queued message, oldest first.
+
+        Args:
+            worker: Worker to run the jobs
+
+        Returns:
+            Number of messages processed
+        """
+        processed = 0
+        for name in sorted(os.listdir(self.directory)):
+            if not name.endswith(".msg"):
+                continue
+            path = os.path.join(self.directory, name)
+            with open(path, encoding="utf-8") as f:
+                job_id = json.load(f)["job_id"]
+            worker.process(job_id)
+            os.remove(path)
+            processed += 1
+        return processed
+
+
+class SQSJobQueue(JobQueue):
+    """Queue jobs on SQS for the worker Lambda."""
+
+    def __init__(self, queue_url: str):
+        """Initialize SQS queue.
+
+        Args:
+            queue_url: URL of the burn plan job queue
+        """
+        self.queue_url = queue_url
+
+    def enqueue(self, job_id: str) -> None:
+        get_client("sqs").send_message(QueueUrl=self.queue_url, MessageBody=json.dumps({"job_id": job_id}))
+
+
+class BurnPlanJobWorker:
+    """Generate and store the burn plan for a queued job, recording the outcome."""
+
+    def __init__(self, store: JobStore, strands_service: StrandsService, dynamodb_service: DynamoDBService):
+        """Initialize job worker.
+
+        Args:
+            store: Job store the jobs are read from and updated in
+            strands_service: Service generating the burn plans
+            dynamodb_service: Service storing finished burn plans
+        """
+        self.store = store
+        self.strands_service = strands_service
+        self.dynamodb_service = dynamodb_service
+
+    def process(self, job_id: str, deadline: Optional[Deadline] = None) -> Optional[BurnPlanJob]:
+        """Run a job to completion.
+
+        Generation errors are recorded on the job rather than raised, so a
+        failed job is not redelivered. Jobs that already finished are left
+        untouched, which makes redelivered messages harmless.
+
+        Args:
+            job_id: Job ID
+            deadline: Deadline for the generation (defaults to BURN_PLAN_JOB_BUDGET_SECONDS)
+
+        Returns:
+            The job in its final state, or None if it does not exist
+        """
+        job = self.store.get(job_id)
+        if job is None:
+            logger.warning("Burn plan job not found", extra={"fields": {"job_id": job_id}})
+            return None
+        if job.status in TERMINAL_STATUSES:
+            return job
+
+        job.status = "running"
+        job.updated_at = _now_ms()
+        self.store.save(job)
+
+        started = time.monotonic()
+        try:
+            burn_plan = self.strands_service.generate_burn_plan(
+                job.config,
+                deadline=deadline or Deadline.after(BURN_PLAN_JOB_BUDGET_SECONDS)
+            )
+            session_id = new_session_id()
+            self.dynamodb_service.store_burn_plan(session_id, burn_plan)
+            job.status = "succeeded"
+            job.session_id = session_id
+            job.analysis = burn_plan
+
+        except Exception as e:
+            job.status = "failed"
+            job.error = str(e)
+            job.error_status_code = http_status_for_error(e)
+
+        job.updated_at = _now_ms()
+        self.store.save(job)
+
+        logger.info("Burn plan job finished", extra={"fields": {
+            "job_id": job_id,
+            "status": job.status,
+            "error_status_code": job.error_status_code,
+            "elapsed": round(time.monotonic() - started, 3)
+        }})
+        return job
+
+
+class BurnPlanJobService:
+    """Submit burn plan jobs and look up their status."""
+
+    def __init__(self, store: JobStore, queue: JobQueue):
+        """Initialize job service.
+
+        Args:
+            store: Job store
+            queue: Queue delivering jobs to the worker
+        """
+        self.store = store
+        self.queue = queue
+
+    @classmethod
+    def from_env(cls, worker_factory: Callable[[JobStore], BurnPlanJobWorker]) -> "BurnPlanJobService":
+        """Create a job service configured from BURN_PLAN_JOB_* environment variables.
+
+        Args:
+            worker_factory: Builds a worker for a store (used by the in-process queue only)
+
+        Returns:
+            Configured job service
+        """
+        store = create_job_store()
+        queue_url = os.environ.get("BURN_PLAN_JOB_QUEUE_URL")
+        kind = os.environ.get("BURN_PLAN_JOB_QUEUE") or ("sqs" if queue_url else "inprocess")
+
+        if kind == "sqs":
+            queue: JobQueue = SQSJobQueue(queue_url or "")
+        elif kind == "file":
+            queue = LocalFileJobQueue(os.environ.get("BURN_PLAN_JOB_SPOOL_DIR", "/tmp/burn-plan-jobs/spool"))
+        elif kind == "inprocess":
+            queue = InProcessJobQueue(lambda: worker_factory(store))
+        else:
+            raise ValueError(f"Unknown BURN_PLAN_JOB_QUEUE: {kind}")
+
+        return cls(store, queue)
+
+    def submit(self, config: BurnConfig) -> BurnPlanJob:
+        """Record a pending job and queue it.
+
+        Args:
+            config: Burn configuration to generate
+
+        Returns:
+            The pending job
+        """
+        now = _now_ms()
+        job = BurnPlanJob(job_id=str(uuid.uuid4()), config=config, created_at=now, updated_at=now)
+        self.store.save(job)
+        self.queue.enqueue(job.job_id)
+        return job
+
+    def get(self, job_id: str) -> Optional[BurnPlanJob]:
+        """Look up a job.
+
+        Args:
+            job_id: Job ID
+
+        Returns:
+            The job, or None if it does not exist
+        """
+        return self.store.get(job_id)
+
+
+def create_job_store() -> JobStore:
+    """Create the job store selected by BURN_PLAN_JOB_STORE.
+
+    Defaults to DynamoDB when BURN_PLAN_JOBS_TABLE_NAME is set, otherwise memory.
+
+    Returns:
+        Configured job store
+    """
+    table_name = os.environ.get("BURN_PLAN_JOBS_TABLE_NAME")
+    kind = os.environ.get("BURN_PLAN_JOB_STORE") or ("dynamodb" if table_name else "memory")
+
+    if kind == "dynamodb":
+        return DynamoDBJobStore(table_name or "burn-plan-jobs")
+    if kind == "file":
+        return LocalFileJobStore(os.environ.get("BURN_PLAN_JOB_DIR", "/tmp/burn-plan-jobs/jobs"))
+    if kind == "memory":
+        return InMemoryJobStore()
+    raise ValueError(f"Unknown BURN_PLAN_JOB_STORE: {kind}")
@@ -0,0 +1,205 @@
+"""Deterministic cost solver that makes a generated plan add up to the requested amount.
+
+Model arithmetic is unreliable: the services a plan proposes rarely sum to the
+requested amount, and ``total_calculated_cost`` often disagrees with both.
+Instead of rejecting such plans, the solver keeps each service's implied rate
+(cost per unit per day) and rescales the plan to the target:
+
+1. each service's quantity is scaled by target / current total, bounded to
+   ``max_scale`` times (or 1/``max_scale`` of) the proposed quantity;
+2. its active days are then stretched or shrunk within the timeline to cover
+   what the bounded quantity could not;
+3. the small remainder left by whole quantities and days is spread over the
+   per-service ``total_cost`` values, rounded to cents, so they sum exactly to
+   the target, and ``total_calculated_cost`` is set to that sum.
+
+The spread changes each service's implied rate, so it is only applied while
+the remainder is within ``spread_tolerance`` of the target. A plan the bounds
+cannot bring that close (say, one generated for $5,000 but requested for
+$2,500,000) raises CostSolverError instead of being inflated to the target
+with rates that no longer match its ``unit_cost``.
+
+Pure arithmetic over a handful of services: microseconds per plan.
+"""
+
+from __future__ import annotations
+
+import math
+import os
+import re
+from typing import List, NamedTuple, Optional, Tuple
+
+from models import BurnPlan, ServiceCost
+
+# "solve" adjusts plans to the requested amount; "validate" keeps the legacy
+# behavior of rejecting plans more than COST_TOLERANCE off
+BURN_PLAN_COST_MODE = os.environ.get("BURN_PLAN_COST_MODE", "solve")
+# Bound on how far the solver may scale a service's proposed quantity
+BURN_PLAN_COST_MAX_SCALE = float(os.environ.get("BURN_PLAN_COST_MAX_SCALE", "10"))
+# Largest remainder, relative to the target, the solver spreads over service costs
+BURN_PLAN_COST_SPREAD_TOLERANCE = float(os.environ.get("BURN_PLAN_COST_SPREAD_TOLERANCE", "0.05"))
+# Relative tolerance in "validate" mode
+COST_TOLERANCE = 0.10
+
+_AMOUNT_PATTERN = re.compile(r"[\d,]+\.?\d*")
+
+
+class CostSolverError(ValueError):
+    """Plan cannot be brought to the target within the solver's bounds."""
+
+
+class SolvedPlan(NamedTuple):
+    """Result of solving a plan's costs."""
+
+    plan: BurnPlan
+    adjusted: bool
+    original_cost: float
+
+
+class _Window(NamedTuple):
+    start: int
+    end: int
+
+
+def parse_amount(amount: str) -> Optional[float]:
+    """Extract the numeric value of an amount string.
+
+    Args:
+        amount: Amount string (e.g., "$1,000", "₹50000")
+
+    Returns:
+        Amount value, or None if the string has no number
+    """
+    match = _AMOUNT_PATTERN.search(amount)
+    if not match:
+        return None
+    try:
+        return float(match.group().replace(",", ""))
+    except ValueError:
+        return None
+
+
+def _window(service: ServiceCost, timeline: int) -> _Window:
+    """Active [start, end) days of a service, clamped to the timeline."""
+    start = min(max(service.start_day, 0), timeline - 1)
+    end = timeline if service.end_day < 0 or service.end_day > timeline else service.end_day
+    return _Window(start, max(end, start + 1))
+
+
+def _cents(values: List[float], target: float) -> List[float]:
+    """Round values to cents so that they sum exactly to the target (rounded to cents)."""
+    target_cents = round(target * 100)
+    cents = [round(value * 100) for value in values]
+    # The rounding remainder goes to the largest value, where it matters least
+    largest = max(range(len(cents)), key=cents.__getitem__)
+    cents[largest] += target_cents - sum(cents)
+    return [value / 100 for value in cents]
+
+
+def _fit(quantity: int, unit_days: float, min_quantity: int, max_quantity: int, timeline: int) -> Tuple[int, int]:
+    """Bounded quantity and the active days that bring it closest to the unit-days."""
+    quantity = min(max(quantity, min_quantity), max_quantity)
+    return quantity, min(max(round(unit_days / quantity), 1), timeline)
+
+
+def solve_plan_costs(
+    plan: BurnPlan,
+    target: float,
+    max_scale: float = BURN_PLAN_COST_MAX_SCALE,
+    spread_tolerance: float = BURN_PLAN_COST_SPREAD_TOLERANCE
+) -> SolvedPlan:
+    """Adjust a plan's services so their costs sum exactly to the target.
+
+    Args:
+        plan: Burn plan as generated by the agent
+        target: Requested amount
+        max_scale: Bound on the quantity scale factor per service
+        spread_tolerance: Largest remainder, relative to the target, spread
+            over the service costs after quantities and days are solved
+
+    Returns:
+        Solved plan (the input plan itself when it already matches), whether
+        it was adjusted, and the services' original total
+
+    Raises:
+        ValueError: If the plan has no services or the target is not positive
+        CostSolverError: If bounded quantities and days leave a remainder
+            larger than spread_tolerance
+    """
+    services = plan.services_deployed
+    if not services:
+        raise ValueError("Burn plan has no services to cost")
+    if target <= 0:
+        raise ValueError(f"Requested amount must be positive, got {target}")
+
+    costs = [max(service.total_cost, 0.0) for service in services]
+    original_cost = sum(costs)
+    target_cents = round(target * 100)
+    if round(original_cost * 100) == target_cents and round(plan.total_calculated_cost * 100) == target_cents:
+        return SolvedPlan(plan, False, original_cost)
+
+    timeline = max(plan.timeline_days, 1)
+    if original_cost <= 0:
+        # Nothing to scale from: split the target evenly
+        costs = [target / len(services)] * len(services)
+        factor = 1.0
+    else:
+        factor = target / original_cost
+
+    solved_costs: List[float] = []
+    updates: List[dict] = []
+    for service, cost in zip(services, costs):
+        window = _window(service, timeline)
+        quantity = max(service.quantity, 1)
+        days = window.end - window.start
+        desired = cost * factor
+        rate = cost / (quantity * days)
+        if rate <= 0:
+            solved_costs.append(0.0)
+            updates.append({})
+            continue
+
+        # Quantity first, within bounds of the proposed quantity
+        unit_days = desired / rate
+        min_quantity, max_quantity = max(1, math.floor(quantity / max_scale)), math.ceil(quantity * max_scale)
+        fits = [_fit(round(unit_days / days), unit_days, min_quantity, max_quantity, timeline)]
+        # Days pinned to the timeline (or to a single day) cannot cover what
+        # rounding the quantity left: try rounding it the other way
+        new_quantity, new_days = fits[0]
+        if new_days == timeline and new_quantity * new_days < unit_days:
+            fits.append(_fit(math.ceil(unit_days / timeline), unit_days, min_quantity, max_quantity, timeline))
+        elif new_days == 1 and new_quantity > unit_days:
+            fits.append(_fit(math.floor(unit_days), unit_days, min_quantity, max_quantity, timeline))
+        new_quantity, new_days = min(fits, key=lambda fit: abs(fit[0] * fit[1] - unit_days))
+        start = min(window.start, timeline - new_days)
+        end = start + new_days
+
+        update: dict = {"quantity": new_quantity}
+        if (start, end) != window:
+            update["start_day"] = start
+            update["end_day"] = -1 if end == timeline and service.end_day < 0 else end
+            update["duration_used"] = f"{new_days} day" if new_days == 1 else f"{new_days} days"
+        solved_costs.append(rate * new_quantity * new_days)
+        updates.append(update)
+
+    # Whole quantities and days leave a remainder; spread it proportionally
+    solved_total = sum(solved_costs)
+    if solved_total > 0:
+        if abs(solved_total - target) > target * spread_tolerance:
+            raise CostSolverError(
+                f"Services total {original_cost:.2f} cannot reach {target:.2f} within bounds "
+                f"(closest {solved_total:.2f})"
+            )
+        solved_costs = [cost * target / solved_total for cost in solved_costs]
+    else:
+        solved_costs = [target / len(services)] * len(services)
+
+    solved_services = [
+        service.model_copy(update={**update, "total_cost": total_cost})
+        for service, update, total_cost in zip(services, updates, _cents(solved_costs, target))
+    ]
+    solved = plan.model_copy(update={
+        "services_deployed": solved_services,
+        "total_calculated_cost": target_cents / 100
+    })
+    return SolvedPlan(solved, True, original_cost)
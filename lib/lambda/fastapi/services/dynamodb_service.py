@@ -2,15 +2,120 @@
 
 from __future__ import annotations
 
+import base64
+import binascii
+import heapq
+import json
 import os
+import random
+import threading
 import time
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
 from decimal import Decimal
 
-import boto3
-from boto3.dynamodb.conditions import Key
-
 from models import BurnPlan
+from utils.aws_clients import get_client, get_resource
+from utils.burn_plan_codec import FORMAT_VERSION, decode_burn_plan, encode_burn_plan, project_scalars
+from utils.session_ids import session_timestamp
+from utils.structured_logging import get_logger
+from utils.ttl_cache import TTLCache
+
+logger = get_logger("dynamodb")
+
+# GSI partitioning plans by UTC creation day, sorted by timestamp
+RECENT_INDEX_NAME = os.environ.get("BURN_PLANS_RECENT_INDEX_NAME", "recent-by-day")
+RECENT_SHARD_ATTRIBUTE = "created_day"
+# Partition of the burn plans table listing the days that hold plans (see
+# DynamoDBService._record_plan_day); not a valid session ID
+PLAN_DAYS_ID = "#plan-days"
+# Scan the table when the recent index returns nothing. Reads the whole table per
+# request, so only for the rollout window before created_day is backfilled
+RECENT_SCAN_FALLBACK = os.environ.get("BURN_PLANS_RECENT_SCAN_FALLBACK", "false").lower() == "true"
+# Encoded plans larger than this go to S3 instead of the item (DynamoDB items cap at 400 KB)
+OVERFLOW_THRESHOLD_BYTES = int(os.environ.get("BURN_PLAN_OVERFLOW_THRESHOLD_BYTES", "300000"))
+
+# Keys per BatchGetItem request (API maximum is 100); chunks are fetched in parallel
+BATCH_GET_CHUNK_SIZE = int(os.environ.get("BURN_PLANS_BATCH_GET_CHUNK_SIZE", "25"))
+# Parallel DynamoDB reads per process for batch lookups
+BATCH_GET_MAX_WORKERS = int(os.environ.get("BURN_PLANS_BATCH_GET_MAX_WORKERS", "8"))
+# BatchGetItem calls per chunk before remaining UnprocessedKeys are reported back
+BATCH_GET_MAX_ATTEMPTS = 5
+
+# In-process read-through cache of stored plans by session ID (stored plans never change)
+SESSION_CACHE_MAX_ENTRIES = int(os.environ.get("BURN_PLAN_SESSION_CACHE_MAX_ENTRIES", "512"))
+SESSION_CACHE_TTL_SECONDS = float(os.environ.get("BURN_PLAN_SESSION_CACHE_TTL_SECONDS", "300"))
+# Staged (write-behind) plans held per process; the oldest are dropped beyond this
+PENDING_MAX_ENTRIES = int(os.environ.get("BURN_PLAN_PENDING_MAX_ENTRIES", "1024"))
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Return the process-wide pool for parallel batch reads."""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=BATCH_GET_MAX_WORKERS,
+                    thread_name_prefix="dynamodb-batch"
+                )
+    return _executor
+
+
+def recent_shard(timestamp_ms: int) -> str:
+    """Day bucket (UTC, YYYY-MM-DD) a plan created at timestamp_ms is indexed under."""
+    return datetime.fromtimestamp(timestamp_ms / 1000, tz=timezone.utc).strftime("%Y-%m-%d")
+
+
+def _day_start_ms(day: str) -> int:
+    """Start of a UTC day (YYYY-MM-DD) in milliseconds."""
+    return int(datetime.strptime(day, "%Y-%m-%d").replace(tzinfo=timezone.utc).timestamp() * 1000)
+
+# Attributes read for plan summaries (projected scalars written by the storage codec)
+SUMMARY_ATTRIBUTES = (
+    "id",
+    "timestamp",
+    "total_amount",
+    "timeline_days",
+    "efficiency_level",
+    "architecture_type",
+    "total_calculated_cost",
+    "service_count",
+    "scenario_preview",
+)
+
+
+def _encode_cursor(day: str, start_key: Optional[Dict[str, Any]]) -> str:
+    """Build an opaque listing cursor from a day bucket and a LastEvaluatedKey."""
+    state: Dict[str, Any] = {"d": day}
+    if start_key:
+        state["k"] = {
+            name: int(value) if isinstance(value, Decimal) else value
+            for name, value in start_key.items()
+        }
+    return base64.urlsafe_b64encode(json.dumps(state, separators=(",", ":")).encode()).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> Tuple[str, Optional[Dict[str, Any]]]:
+    """Parse a listing cursor into its day bucket and ExclusiveStartKey.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        state = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        day = state["d"]
+        datetime.strptime(day, "%Y-%m-%d")
+        start_key = state.get("k")
+        if start_key is not None and set(start_key) != {"id", "timestamp", RECENT_SHARD_ATTRIBUTE}:
+            raise ValueError("unexpected key attributes")
+    except (binascii.Error, UnicodeDecodeError, TypeError, KeyError, ValueError) as e:
+        raise ValueError(f"Invalid cursor: {e}")
+    return day, start_key
 
 
 class DynamoDBService:
@@ -19,70 +124,468 @@ class DynamoDBService:
     def __init__(self):
         """Initialize DynamoDB service."""
         self.table_name = os.environ.get("BURN_PLANS_TABLE_NAME", "burn-plans")
-        self.dynamodb = boto3.resource("dynamodb")
-        self.table = self.dynamodb.Table(self.table_name)
+        self.overflow_bucket = os.environ.get("BURN_PLANS_OVERFLOW_BUCKET") or None
+        self.overflow_threshold = OVERFLOW_THRESHOLD_BYTES
+        self.session_cache: TTLCache[BurnPlan] = TTLCache(SESSION_CACHE_MAX_ENTRIES, SESSION_CACHE_TTL_SECONDS)
+        # Plans handed out before they were stored (write-behind), in staging order;
+        # dropped once stored or dead-lettered, and bounded by PENDING_MAX_ENTRIES
+        self._pending: Dict[str, BurnPlan] = {}
+        self.pending_max_entries = PENDING_MAX_ENTRIES
+        self._pending_lock = threading.Lock()
+        # Days already recorded in the day index by this process
+        self._plan_days: set = set()
+
+    @property
+    def table(self):
+        """Burn plans table bound to this thread's pooled DynamoDB resource."""
+        return get_resource("dynamodb").Table(self.table_name)
 
     def store_burn_plan(self, session_id: str, burn_plan: BurnPlan) -> None:
         """Store a burn plan in DynamoDB.
 
+        The plan is stored as one compressed attribute (see utils.burn_plan_codec)
+        next to a few projected scalars, or in S3 if it is over the overflow
+        threshold.
+
         Args:
             session_id: Unique session identifier
             burn_plan: Burn plan to store
+
+        Raises:
+            ValueError: If the plan needs S3 overflow but no bucket is configured
         """
-        timestamp = int(time.time() * 1000)  # milliseconds
-
-        # Convert BurnPlan to dict and handle float to Decimal conversion
-        burn_plan_dict = burn_plan.model_dump()
-        
-        # Log if pdf_invoice is present
-        print(f"Storing burn plan with pdf_invoice: {burn_plan_dict.get('pdf_invoice') is not None}")
-        if burn_plan_dict.get('pdf_invoice'):
-            print(f"PDF invoice in storage: {burn_plan_dict['pdf_invoice']}")
-        
-        item = {
+        # Time-ordered session IDs carry the timestamp, so the key is derivable from the ID
+        timestamp = session_timestamp(session_id) or int(time.time() * 1000)  # milliseconds
+        encoded = encode_burn_plan(burn_plan)
+
+        item: Dict[str, Any] = {
             "id": session_id,
             "timestamp": timestamp,
-            "burn_plan": self._convert_floats_to_decimals(burn_plan_dict)
+            RECENT_SHARD_ATTRIBUTE: recent_shard(timestamp),
+            **project_scalars(burn_plan),
+            "plan_format": FORMAT_VERSION,
+            "plan_encoding": encoded.encoding
         }
 
+        if len(encoded.data) > self.overflow_threshold:
+            if not self.overflow_bucket:
+                raise ValueError(
+                    f"Encoded burn plan is {len(encoded.data)} bytes, over the "
+                    f"{self.overflow_threshold} byte limit, and BURN_PLANS_OVERFLOW_BUCKET is not set"
+                )
+            item["plan_s3_key"] = f"burn-plans/{session_id}/{timestamp}"
+            get_client("s3").put_object(
+                Bucket=self.overflow_bucket,
+                Key=item["plan_s3_key"],
+                Body=encoded.data,
+                ContentType="application/octet-stream",
+                Metadata={"plan-encoding": encoded.encoding}
+            )
+        else:
+            item["plan"] = encoded.data
+
+        logger.debug("Storing burn plan", extra={"fields": {
+            "session": session_id,
+            "encoded_bytes": len(encoded.data),
+            "encoding": encoded.encoding,
+            "overflow": "plan_s3_key" in item
+        }})
+
+        # Day first: a plan in the recent index is always reachable through the day index
+        self._record_plan_day(item[RECENT_SHARD_ATTRIBUTE])
         self.table.put_item(Item=item)
+        # Write-through: the generating client typically polls the session next
+        self.session_cache.put(session_id, burn_plan)
+        with self._pending_lock:
+            self._pending.pop(session_id, None)
+
+    def stage_burn_plan(self, session_id: str, burn_plan: BurnPlan) -> None:
+        """Make a plan readable by session ID before it is stored.
+
+        Used for write-behind persistence: the plan is served from memory by
+        get_burn_plan and batch_get_burn_plans until store_burn_plan succeeds
+        or it is unstaged. Beyond pending_max_entries the oldest staged plans
+        are dropped (they stay in the session cache until it evicts them).
+
+        Args:
+            session_id: Unique session identifier
+            burn_plan: Burn plan about to be stored
+        """
+        with self._pending_lock:
+            self._pending[session_id] = burn_plan
+            while len(self._pending) > self.pending_max_entries:
+                dropped = next(iter(self._pending))
+                del self._pending[dropped]
+                logger.warning("Staged burn plan dropped, too many pending writes", extra={"fields": {
+                    "session": dropped,
+                    "max_pending": self.pending_max_entries
+                }})
+        self.session_cache.put(session_id, burn_plan)
+
+    def unstage_burn_plan(self, session_id: str) -> None:
+        """Stop serving a staged plan from memory (e.g. once it is dead-lettered).
+
+        Args:
+            session_id: Session identifier
+        """
+        with self._pending_lock:
+            self._pending.pop(session_id, None)
+
+    @property
+    def pending_count(self) -> int:
+        """Number of staged plans not yet stored."""
+        with self._pending_lock:
+            return len(self._pending)
+
+    def _local_burn_plan(self, session_id: str) -> Optional[BurnPlan]:
+        """Look up a plan in memory: staged plans first, then the session cache."""
+        with self._pending_lock:
+            burn_plan = self._pending.get(session_id)
+        return burn_plan if burn_plan is not None else self.session_cache.get(session_id)
 
     def get_recent_burn_plans(self, limit: int = 5) -> List[dict]:
         """Get the most recent burn plans.
 
+        Queries the day-bucketed recent index newest day first, each bucket
+        newest plan first, skipping days without plans through the day index
+        (see _plan_days_before), so only the returned plans are read regardless
+        of table size or gaps between plans. If the index returns no plans and
+        RECENT_SCAN_FALLBACK is set (while created_day is being backfilled),
+        the table is scanned instead.
+
         Args:
             limit: Maximum number of burn plans to retrieve
 
         Returns:
-            List of burn plans with session IDs and timestamps
+            List of burn plans with session IDs and timestamps, newest first
+        """
+        from boto3.dynamodb.conditions import Key
+
+        items: List[dict] = []
+        day = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+        days: List[str] = []
+
+        while True:
+            response = self.table.query(
+                IndexName=RECENT_INDEX_NAME,
+                KeyConditionExpression=Key(RECENT_SHARD_ATTRIBUTE).eq(day),
+                ScanIndexForward=False,
+                Limit=limit - len(items)
+            )
+            # Buckets are disjoint and visited newest first, so appending keeps the order
+            items.extend(response.get("Items", []))
+            if len(items) >= limit:
+                break
+            # Every older day holds at least one plan, so this many days fill the limit
+            days = days or self._plan_days_before(day, limit - len(items))
+            if not days:
+                break
+            day = days.pop(0)
+
+        if not items and RECENT_SCAN_FALLBACK:
+            items = self._scan_newest(limit)
+
+        return [
+            {
+                "id": item["id"],
+                "timestamp": int(item["timestamp"]),
+                "burn_plan": self._decode_item(item).model_dump()
+            }
+            for item in items
+        ]
+
+    def list_burn_plan_summaries(
+        self,
+        limit: int = 20,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[dict], Optional[str]]:
+        """List plan summaries newest first, a page at a time.
+
+        Reads only the projected summary attributes from the recent index, so
+        a page costs a fraction of the read capacity of full plans. Days
+        without plans are skipped through the day index, and the listing ends
+        at the oldest day with plans. Plans stored before the storage codec
+        only have id and timestamp. If the index returns no plans and
+        RECENT_SCAN_FALLBACK is set (while created_day is being backfilled),
+        the first page comes from a table scan and has no next page.
+
+        Args:
+            limit: Maximum number of summaries in the page
+            cursor: Cursor returned with the previous page (first page if omitted)
+
+        Returns:
+            Summaries, and the cursor for the next page (None after the last page)
+
+        Raises:
+            ValueError: If the cursor is malformed
         """
-        # Scan the table and sort by timestamp (not ideal for large tables)
-        # For production, consider using a GSI with a constant partition key
-        response = self.table.scan(
-            Limit=limit * 2  # Get more to ensure we have enough after sorting
+        from boto3.dynamodb.conditions import Key
+
+        if cursor:
+            day, start_key = _decode_cursor(cursor)
+        else:
+            day, start_key = datetime.now(timezone.utc).strftime("%Y-%m-%d"), None
+
+        names = {f"#a{i}": name for i, name in enumerate(SUMMARY_ATTRIBUTES)}
+        items: List[dict] = []
+        days: List[str] = []
+
+        while True:
+            query = {
+                "IndexName": RECENT_INDEX_NAME,
+                "KeyConditionExpression": Key(RECENT_SHARD_ATTRIBUTE).eq(day),
+                "ScanIndexForward": False,
+                "Limit": limit - len(items),
+                "ProjectionExpression": ", ".join(names),
+                "ExpressionAttributeNames": names
+            }
+            if start_key:
+                query["ExclusiveStartKey"] = start_key
+
+            response = self.table.query(**query)
+            items.extend(response.get("Items", []))
+
+            start_key = response.get("LastEvaluatedKey")
+            if start_key is None:
+                # Bucket exhausted: continue with the next older day that has plans.
+                # One more day than the page still needs, so a full page knows
+                # whether anything follows it
+                days = days or self._plan_days_before(day, limit - len(items) + 1)
+                if not days:
+                    if not items and not cursor and RECENT_SCAN_FALLBACK:
+                        items = self._scan_newest(
+                            limit,
+                            ProjectionExpression=", ".join(names),
+                            ExpressionAttributeNames=names
+                        )
+                    return [self._summary_from_item(item) for item in items], None
+                day = days.pop(0)
+
+            if len(items) >= limit:
+                return [self._summary_from_item(item) for item in items], _encode_cursor(day, start_key)
+
+    def _record_plan_day(self, day: str) -> None:
+        """Add a day to the day index, once per process and day.
+
+        The day index lists the days that hold plans, one item per day under
+        the PLAN_DAYS_ID partition of the table (keyed by the day's start in
+        milliseconds). Such items carry no created_day, so the recent index
+        never sees them. Listings walk it to skip days without plans and to
+        know where the oldest plans are, rather than guessing from gaps.
+
+        Args:
+            day: UTC day (YYYY-MM-DD) a plan is about to be stored under
+        """
+        if day in self._plan_days:
+            return
+        self.table.put_item(Item={"id": PLAN_DAYS_ID, "timestamp": _day_start_ms(day)})
+        self._plan_days.add(day)
+
+    def _plan_days_before(self, day: str, count: int) -> List[str]:
+        """Up to count days with plans before day, newest first, from the day index.
+
+        Args:
+            day: UTC day (YYYY-MM-DD), exclusive
+            count: Maximum number of days to return
+
+        Returns:
+            Days (YYYY-MM-DD), newest first; empty once day is the oldest
+        """
+        from boto3.dynamodb.conditions import Key
+
+        response = self.table.query(
+            KeyConditionExpression=Key("id").eq(PLAN_DAYS_ID) & Key("timestamp").lt(_day_start_ms(day)),
+            ScanIndexForward=False,
+            Limit=count
         )
+        return [recent_shard(int(item["timestamp"])) for item in response.get("Items", [])]
+
+    def _scan_newest(self, limit: int, **scan_kwargs: Any) -> List[dict]:
+        """Newest items by a full table scan, for plans the recent index does not hold.
+
+        Reads the whole table, so it is only a stopgap until created_day is
+        backfilled (see backfill_recent_index.py).
+
+        Args:
+            limit: Maximum number of items to return
+            **scan_kwargs: Extra Scan parameters (projection)
+
+        Returns:
+            Up to limit items, newest first
+        """
+        logger.warning("Recent index returned no plans, scanning the table", extra={"fields": {
+            "index": RECENT_INDEX_NAME,
+            "table": self.table_name
+        }})
+        items: List[dict] = []
+        while True:
+            response = self.table.scan(**scan_kwargs)
+            page = [item for item in response.get("Items", []) if item["id"] != PLAN_DAYS_ID]
+            items = heapq.nlargest(limit, items + page, key=lambda item: int(item["timestamp"]))
+            start_key = response.get("LastEvaluatedKey")
+            if not start_key:
+                return items
+            scan_kwargs["ExclusiveStartKey"] = start_key
+
+    def get_burn_plan(self, session_id: str) -> Optional[BurnPlan]:
+        """Get a stored burn plan by session ID.
+
+        Reads through the in-process session cache, so repeated lookups of a
+        hot session (roasts, status polling) are served from memory. Misses
+        are not cached, so a plan is found as soon as it is stored. Staged
+        plans (see stage_burn_plan) are found before they are stored.
+
+        Args:
+            session_id: Session identifier
+
+        Returns:
+            The burn plan, or None if no plan is stored under the session ID
+        """
+        burn_plan = self._local_burn_plan(session_id)
+        if burn_plan is None:
+            burn_plan = self._load_burn_plan(session_id)
+            if burn_plan is not None:
+                self.session_cache.put(session_id, burn_plan)
+        return burn_plan
+
+    def _load_burn_plan(self, session_id: str) -> Optional[BurnPlan]:
+        """Read a stored burn plan from the table, bypassing the session cache."""
+        if session_id == PLAN_DAYS_ID:
+            return None
+        timestamp = session_timestamp(session_id)
+        if timestamp is not None:
+            item = self.table.get_item(Key={"id": session_id, "timestamp": timestamp}).get("Item")
+            return self._decode_item(item) if item else None
+
+        # Sessions from before time-ordered IDs: the newest item under the ID
+        from boto3.dynamodb.conditions import Key
 
+        response = self.table.query(
+            KeyConditionExpression=Key("id").eq(session_id),
+            ScanIndexForward=False,
+            Limit=1
+        )
         items = response.get("Items", [])
+        return self._decode_item(items[0]) if items else None
+
+    def batch_get_burn_plans(self, session_ids: List[str]) -> Tuple[Dict[str, BurnPlan], List[str], List[str]]:
+        """Get several stored burn plans in one round of parallel reads.
+
+        Plans are fetched with BatchGetItem in chunks of BATCH_GET_CHUNK_SIZE
+        keys, run in parallel, retrying UnprocessedKeys with jittered backoff.
+        Sessions whose ID does not carry a timestamp are looked up individually,
+        also in parallel. Staged sessions and sessions in the session cache are
+        not read at all, and fetched plans are added to the cache.
+
+        Args:
+            session_ids: Session identifiers (duplicates are ignored)
+
+        Returns:
+            Plans found by session ID, IDs with no stored plan, and IDs still
+            unprocessed after retries (throttling; safe to request again)
+        """
+        session_ids = list(dict.fromkeys(session_ids))
+        found: Dict[str, BurnPlan] = {}
+        keys = []
+        legacy_ids = []
+        for session_id in session_ids:
+            cached = self._local_burn_plan(session_id)
+            if cached is not None:
+                found[session_id] = cached
+                continue
+            timestamp = session_timestamp(session_id)
+            if timestamp is None:
+                legacy_ids.append(session_id)
+            else:
+                keys.append({"id": session_id, "timestamp": timestamp})
+
+        executor = _get_executor()
+        chunk_futures = [
+            executor.submit(self._batch_get_chunk, keys[i:i + BATCH_GET_CHUNK_SIZE])
+            for i in range(0, len(keys), BATCH_GET_CHUNK_SIZE)
+        ]
+        legacy_futures = {session_id: executor.submit(self._load_burn_plan, session_id) for session_id in legacy_ids}
 
-        # Sort by timestamp descending
-        items.sort(key=lambda x: x.get("timestamp", 0), reverse=True)
+        unprocessed: List[str] = []
+        for future in chunk_futures:
+            items, unprocessed_keys = future.result()
+            for item in items:
+                found[item["id"]] = self._decode_item(item)
+                self.session_cache.put(item["id"], found[item["id"]])
+            unprocessed.extend(key["id"] for key in unprocessed_keys)
+        for session_id, future in legacy_futures.items():
+            burn_plan = future.result()
+            if burn_plan is not None:
+                found[session_id] = burn_plan
+                self.session_cache.put(session_id, burn_plan)
 
-        # Take only the requested limit
-        recent_items = items[:limit]
+        unprocessed_ids = set(unprocessed)
+        missing = [sid for sid in session_ids if sid not in found and sid not in unprocessed_ids]
+        logger.debug("Batch get burn plans", extra={"fields": {
+            "requested": len(session_ids),
+            "found": len(found),
+            "cached": len(session_ids) - len(keys) - len(legacy_ids),
+            "missing": len(missing),
+            "unprocessed": len(unprocessed),
+            "chunks": len(chunk_futures),
+            "legacy_lookups": len(legacy_ids)
+        }})
+        return found, missing, unprocessed
 
-        # Convert Decimals back to floats for JSON serialization
-        return [self._convert_decimals_to_floats(item) for item in recent_items]
+    def _batch_get_chunk(self, keys: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """Run BatchGetItem for one chunk of keys, retrying unprocessed keys.
+
+        Args:
+            keys: Primary keys (at most 100)
+
+        Returns:
+            Items found, and keys still unprocessed after BATCH_GET_MAX_ATTEMPTS calls
+        """
+        dynamodb = get_resource("dynamodb")
+        request = {self.table_name: {"Keys": keys}}
+        items: List[Dict[str, Any]] = []
+
+        for attempt in range(BATCH_GET_MAX_ATTEMPTS):
+            response = dynamodb.batch_get_item(RequestItems=request)
+            items.extend(response.get("Responses", {}).get(self.table_name, []))
+            request = response.get("UnprocessedKeys") or {}
+            if not request:
+                return items, []
+            if attempt < BATCH_GET_MAX_ATTEMPTS - 1:
+                # Full jitter; unprocessed keys mean the table is throttling
+                time.sleep(random.uniform(0, min(1.0, 0.05 * 2 ** attempt)))
+
+        return items, request.get(self.table_name, {}).get("Keys", [])
 
     @staticmethod
-    def _convert_floats_to_decimals(obj):
-        """Recursively convert floats to Decimals for DynamoDB."""
-        if isinstance(obj, float):
-            return Decimal(str(obj))
-        elif isinstance(obj, dict):
-            return {k: DynamoDBService._convert_floats_to_decimals(v) for k, v in obj.items()}
-        elif isinstance(obj, list):
-            return [DynamoDBService._convert_floats_to_decimals(item) for item in obj]
-        return obj
+    def _summary_from_item(item: Dict[str, Any]) -> dict:
+        """Convert a projected summary item to JSON-ready types."""
+        summary = DynamoDBService._convert_decimals_to_floats(item)
+        for name in ("timestamp", "timeline_days", "service_count"):
+            if name in summary:
+                summary[name] = int(summary[name])
+        return summary
+
+    def _decode_item(self, item: Dict[str, Any]) -> BurnPlan:
+        """Decode the burn plan stored in a table item.
+
+        Args:
+            item: Table item in any stored format
+
+        Returns:
+            Stored burn plan
+        """
+        # Items written before the storage codec hold the plan as a nested map
+        if "plan_format" not in item:
+            return BurnPlan.model_validate(self._convert_decimals_to_floats(item["burn_plan"]))
+
+        data: Optional[Any] = item.get("plan")
+        if data is None:
+            response = get_client("s3").get_object(Bucket=self.overflow_bucket, Key=item["plan_s3_key"])
+            data = response["Body"].read()
+
+        # boto3 wraps binary attributes in boto3.dynamodb.types.Binary
+        return decode_burn_plan(getattr(data, "value", data), item["plan_encoding"])
 
     @staticmethod
     def _convert_decimals_to_floats(obj):
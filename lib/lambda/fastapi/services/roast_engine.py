@@ -0,0 +1,182 @@
+"""Local roast engine: template roasts built from a stored burn plan, no LLM call.
+
+A roast is assembled from a few template lines chosen deterministically per
+session, filled in with the plan's own numbers and with everyday-item
+equivalents (burritos, coffees, months of Netflix, ...) of the total spend,
+the priciest service and the most wasteful one. The item table stores items
+per dollar up front, so an equivalent is a single multiplication and a roast
+takes microseconds.
+"""
+
+from __future__ import annotations
+
+import zlib
+from typing import List, NamedTuple, Optional, Sequence
+
+from models import BurnPlan, RoastEquivalent, ServiceCost
+
+
+class EverydayItem(NamedTuple):
+    """An everyday purchase and how many of it one dollar buys."""
+
+    singular: str
+    plural: str
+    per_dollar: float
+
+
+def _item(singular: str, plural: str, price: float) -> EverydayItem:
+    return EverydayItem(singular, plural, 1.0 / price)
+
+
+# Typical US prices, rounded; only the order of magnitude matters for a roast
+EVERYDAY_ITEMS: Sequence[EverydayItem] = (
+    _item("burrito", "burritos", 11.50),
+    _item("coffee", "coffees", 5.50),
+    _item("month of Netflix", "months of Netflix", 15.49),
+    _item("avocado toast", "avocado toasts", 13.00),
+    _item("pizza", "pizzas", 18.00),
+    _item("movie ticket", "movie tickets", 11.75),
+    _item("rubber duck", "rubber ducks", 4.00),
+    _item("mechanical keyboard", "mechanical keyboards", 120.00),
+)
+
+OPENERS = {
+    "Mildly dumb": (
+        "Congratulations, you found a way to waste money that almost looks like a strategy.",
+        "Mildly dumb is a generous description, but we'll allow it.",
+    ),
+    "Moderately stupid": (
+        "This architecture review is going to need a stiff drink.",
+        "Somewhere, a FinOps engineer just felt a disturbance in the force.",
+    ),
+    "Very stupid": (
+        "AWS should send you a fruit basket. A big one.",
+        "Your cloud bill now has its own gravitational field.",
+    ),
+    "Brain damage": (
+        "Jeff Bezos would like to thank you personally for funding his next rocket.",
+        "This isn't a burn plan, it's a donation with extra steps.",
+    ),
+}
+DEFAULT_OPENERS = (
+    "Let's take a moment to admire how much money just left the building.",
+    "Bold. Expensive. Deeply questionable.",
+)
+
+TOTAL_LINES = (
+    "You burned ${cost} over {days} days. That's {equivalent}.",
+    "${cost} in {days} days, or roughly {equivalent}. Hope it was worth it.",
+)
+TOP_SERVICE_LINES = (
+    "{service} alone ate ${cost} ({share}% of the damage), a cool {equivalent}.",
+    "The MVP of waste is {service}: ${cost}, which is {equivalent} down the drain.",
+)
+WASTE_LINES = (
+    "Special mention to {service} for \"{waste}\".",
+    "{service}'s excuse? \"{waste}\". Bold.",
+)
+MISTAKE_LINES = (
+    "Biggest facepalm: {mistake}.",
+    "The incident review will open with: {mistake}.",
+)
+CLOSERS = (
+    "Cost Explorer is going to need therapy.",
+    "Maybe set up a billing alarm next time. Or at all.",
+    "Your finance team has been notified. They are not laughing.",
+)
+
+
+class LocalRoast(NamedTuple):
+    """A roast built by the local engine."""
+
+    text: str
+    equivalents: List[RoastEquivalent]
+
+
+def _pick(options: Sequence[str], seed: int, salt: int) -> str:
+    """Choose an option deterministically for a seed."""
+    return options[(seed + salt * 7919) % len(options)]
+
+
+def _money(amount: float) -> str:
+    return f"{amount:,.0f}" if amount >= 100 else f"{amount:,.2f}"
+
+
+def _count(count: float) -> str:
+    if count >= 100:
+        return f"{count:,.0f}"
+    if count >= 10:
+        return f"{count:.0f}"
+    return f"{count:.1f}".rstrip("0").rstrip(".")
+
+
+def _equivalent(amount: float, item: EverydayItem) -> str:
+    """Phrase an amount in dollars as a number of an everyday item."""
+    count = amount * item.per_dollar
+    noun = item.singular if round(count, 1) == 1 else item.plural
+    return f"{_count(count)} {noun}"
+
+
+def everyday_equivalents(amount: float) -> List[RoastEquivalent]:
+    """How many of each everyday item an amount in dollars buys.
+
+    Args:
+        amount: Amount in dollars
+
+    Returns:
+        One entry per item in EVERYDAY_ITEMS
+    """
+    return [RoastEquivalent(item=item.plural, count=round(amount * item.per_dollar, 1)) for item in EVERYDAY_ITEMS]
+
+
+def _most_wasteful(services: Sequence[ServiceCost]) -> Optional[ServiceCost]:
+    """The costliest service that has a waste explanation."""
+    wasteful = [svc for svc in services if svc.waste_factor]
+    return max(wasteful, key=lambda svc: svc.total_cost) if wasteful else None
+
+
+def build_roast(burn_plan: BurnPlan, session_id: str = "") -> LocalRoast:
+    """Build a template roast for a burn plan.
+
+    The same session always gets the same roast.
+
+    Args:
+        burn_plan: Burn plan to roast
+        session_id: Session ID, used to pick the templates
+
+    Returns:
+        Roast text and the everyday-item equivalents of the total spend
+    """
+    seed = zlib.crc32(session_id.encode("utf-8"))
+    total = burn_plan.total_calculated_cost or sum(svc.total_cost for svc in burn_plan.services_deployed)
+    lines = [_pick(OPENERS.get(burn_plan.efficiency_level, DEFAULT_OPENERS), seed, 0)]
+
+    lines.append(_pick(TOTAL_LINES, seed, 1).format(
+        cost=_money(total),
+        days=burn_plan.timeline_days,
+        equivalent=_equivalent(total, EVERYDAY_ITEMS[seed % len(EVERYDAY_ITEMS)])
+    ))
+
+    services = burn_plan.services_deployed
+    top = max(services, key=lambda svc: svc.total_cost) if services else None
+    if top is not None and top.total_cost > 0:
+        lines.append(_pick(TOP_SERVICE_LINES, seed, 2).format(
+            service=top.service_name,
+            cost=_money(top.total_cost),
+            share=round(100 * top.total_cost / total) if total else 100,
+            equivalent=_equivalent(top.total_cost, EVERYDAY_ITEMS[(seed + 1) % len(EVERYDAY_ITEMS)])
+        ))
+
+    wasteful = _most_wasteful(services)
+    if wasteful is not None:
+        lines.append(_pick(WASTE_LINES, seed, 3).format(
+            service=wasteful.service_name,
+            waste=wasteful.waste_factor.strip().rstrip(".")
+        ))
+
+    if burn_plan.key_mistakes:
+        mistake = burn_plan.key_mistakes[seed % len(burn_plan.key_mistakes)].strip().rstrip(".")
+        lines.append(_pick(MISTAKE_LINES, seed, 4).format(mistake=mistake[:1].lower() + mistake[1:]))
+
+    lines.append(_pick(CLOSERS, seed, 5))
+    return LocalRoast(" ".join(lines), everyday_equivalents(total))
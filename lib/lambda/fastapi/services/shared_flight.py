@@ -0,0 +1,225 @@
+"""Coalescing of identical burn plan generations across Lambda containers.
+
+Concurrent identical requests land in different Lambda containers, so the
+in-process SingleFlight never sees them together. This tier coordinates them
+through the shared burn plan cache table instead: the first container to
+claim a lease on the normalized config key generates the plan and publishes
+it on the lease item; the others poll that item within their request deadline
+and answer from the published plan. Lease items live under their own cache
+key (``<key>#flight``), so they never count as cached variants.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+import time
+import uuid
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from models import BurnPlan
+from utils.agentcore_client import AgentTimeoutError
+from utils.aws_clients import get_resource
+from utils.deadline import Deadline
+from utils.structured_logging import get_logger
+
+logger = get_logger("shared_flight")
+
+# Seconds a lease is held while its owner generates; covers the request budget
+FLIGHT_LEASE_SECONDS = int(os.environ.get("BURN_PLAN_FLIGHT_LEASE_SECONDS", "30"))
+# Seconds a published plan keeps answering identical requests
+FLIGHT_RESULT_SECONDS = int(os.environ.get("BURN_PLAN_FLIGHT_RESULT_SECONDS", "30"))
+# Seconds between lease polls while another container generates
+FLIGHT_POLL_SECONDS = float(os.environ.get("BURN_PLAN_FLIGHT_POLL_SECONDS", "0.5"))
+
+FLIGHT_KEY_SUFFIX = "#flight"
+FLIGHT_VARIANT = 0
+
+
+class SharedFlight:
+    """Run at most one burn plan generation per key across containers.
+
+    The first caller for a key claims a lease with a conditional put and runs
+    the generation; callers arriving while the lease is held wait for the
+    plan its owner publishes. If the owner fails (it releases the lease) or
+    dies (the lease expires), a waiting caller claims the key and generates
+    itself. DynamoDB errors never fail a request: the caller generates
+    without coalescing.
+    """
+
+    def __init__(
+        self,
+        table_name: str,
+        lease_seconds: int = FLIGHT_LEASE_SECONDS,
+        result_seconds: int = FLIGHT_RESULT_SECONDS,
+        poll_seconds: float = FLIGHT_POLL_SECONDS
+    ):
+        """Initialize shared flight group.
+
+        Args:
+            table_name: Shared burn plan cache table
+            lease_seconds: Seconds a lease is held while its owner generates
+            result_seconds: Seconds a published plan keeps answering identical requests
+            poll_seconds: Seconds between lease polls while waiting
+        """
+        self.table_name = table_name
+        self.lease_seconds = lease_seconds
+        self.result_seconds = result_seconds
+        self.poll_seconds = poll_seconds
+        self._lock = threading.Lock()
+        self._stats = {"executions": 0, "coalesced": 0, "errors": 0}
+
+    async def do(
+        self,
+        key: str,
+        func: Callable[[], Awaitable[BurnPlan]],
+        deadline: Optional[Deadline] = None
+    ) -> BurnPlan:
+        """Generate the plan for key, or wait for the container generating it.
+
+        Args:
+            key: Normalized config key
+            func: Zero-argument coroutine function generating the plan
+            deadline: Request deadline bounding the wait
+
+        Returns:
+            The generated or published burn plan
+
+        Raises:
+            AgentTimeoutError: If the deadline passes while another container generates
+            Exception: Whatever func raised, when this caller generated
+        """
+        token = uuid.uuid4().hex
+        while True:
+            try:
+                claimed = await asyncio.to_thread(self._claim, key, token)
+            except Exception as e:
+                self._error("claim", e)
+                return await func()
+
+            if claimed:
+                self._count("executions")
+                try:
+                    burn_plan = await func()
+                except BaseException:
+                    await asyncio.to_thread(self._release, key, token)
+                    raise
+                await asyncio.to_thread(self._publish, key, token, burn_plan)
+                return burn_plan
+
+            try:
+                burn_plan = await self._wait(key, deadline)
+            except AgentTimeoutError:
+                raise
+            except Exception as e:
+                self._error("wait", e)
+                return await func()
+            if burn_plan is not None:
+                self._count("coalesced")
+                return burn_plan
+            # Released or expired without a plan: try to claim it again
+
+    def stats(self) -> Dict[str, int]:
+        """Return execution, coalescing and error counters for this process.
+
+        Returns:
+            Dictionary with executions, coalesced and errors counts
+        """
+        with self._lock:
+            return dict(self._stats)
+
+    def _claim(self, key: str, token: str) -> bool:
+        """Claim the lease for key unless another live lease or result holds it."""
+        from boto3.dynamodb.conditions import Attr
+        from botocore.exceptions import ClientError
+
+        now = int(time.time())
+        try:
+            self._table().put_item(
+                Item={
+                    "cache_key": key + FLIGHT_KEY_SUFFIX,
+                    "variant": FLIGHT_VARIANT,
+                    "owner": token,
+                    "expires_at": now + self.lease_seconds
+                },
+                # DynamoDB TTL deletes lazily, so an expired lease may still be there
+                ConditionExpression=Attr("cache_key").not_exists() | Attr("expires_at").lte(now)
+            )
+            return True
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") != "ConditionalCheckFailedException":
+                raise
+            return False
+
+    async def _wait(self, key: str, deadline: Optional[Deadline]) -> Optional[BurnPlan]:
+        """Poll the lease for key until its plan is published.
+
+        Returns:
+            The published plan, or None if the lease was released or expired
+        """
+        while True:
+            item = await asyncio.to_thread(self._read, key)
+            if item is None or int(item.get("expires_at", 0)) <= int(time.time()):
+                return None
+            if "plan" in item:
+                return BurnPlan.model_validate_json(item["plan"])
+            if deadline is not None and deadline.remaining() <= self.poll_seconds:
+                raise AgentTimeoutError("Timed out waiting for an identical burn plan generation")
+            await asyncio.sleep(self.poll_seconds)
+
+    def _read(self, key: str) -> Optional[Dict[str, Any]]:
+        """Read the lease item for key."""
+        response = self._table().get_item(
+            Key={"cache_key": key + FLIGHT_KEY_SUFFIX, "variant": FLIGHT_VARIANT},
+            ConsistentRead=True
+        )
+        return response.get("Item")
+
+    def _publish(self, key: str, token: str, burn_plan: BurnPlan) -> None:
+        """Put the generated plan on the lease so waiting callers can answer with it."""
+        from boto3.dynamodb.conditions import Attr
+
+        try:
+            self._table().update_item(
+                Key={"cache_key": key + FLIGHT_KEY_SUFFIX, "variant": FLIGHT_VARIANT},
+                UpdateExpression="SET #plan = :plan, expires_at = :expires_at",
+                ExpressionAttributeNames={"#plan": "plan"},
+                ExpressionAttributeValues={
+                    ":plan": burn_plan.model_dump_json(),
+                    ":expires_at": int(time.time()) + self.result_seconds
+                },
+                ConditionExpression=Attr("owner").eq(token)
+            )
+        except Exception as e:
+            # Waiters claim the key themselves once the lease expires
+            self._error("publish", e)
+
+    def _release(self, key: str, token: str) -> None:
+        """Drop the lease after a failed generation, so a waiting caller can claim it."""
+        from boto3.dynamodb.conditions import Attr
+
+        try:
+            self._table().delete_item(
+                Key={"cache_key": key + FLIGHT_KEY_SUFFIX, "variant": FLIGHT_VARIANT},
+                ConditionExpression=Attr("owner").eq(token)
+            )
+        except Exception as e:
+            self._error("release", e)
+
+    def _error(self, operation: str, error: Exception) -> None:
+        """Count and log a DynamoDB error."""
+        self._count("errors")
+        logger.warning("Burn plan shared flight failed", extra={"fields": {
+            "operation": operation,
+            "error": str(error)
+        }})
+
+    def _count(self, name: str) -> None:
+        """Increment a stats counter."""
+        with self._lock:
+            self._stats[name] += 1
+
+    def _table(self):
+        """Shared cache table bound to this thread's pooled DynamoDB resource."""
+        return get_resource("dynamodb").Table(self.table_name)
@@ -0,0 +1,75 @@
+"""Coalescing of identical concurrent async calls.
+
+Calls are coalesced within one process and one event loop only. That helps
+where a single process serves many requests at once (the app run by uvicorn
+or another ASGI server). A Lambda container handles one request at a time,
+so concurrent requests land in different containers and never meet here;
+there, services.shared_flight coalesces them through DynamoDB, and this is
+only the first tier in front of it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from typing import Any, Awaitable, Callable, Dict, TypeVar
+
+T = TypeVar("T")
+
+# Coalesce identical burn plan requests (in process, and across containers
+# when the shared cache table is configured)
+COALESCING_ENABLED = os.environ.get("BURN_PLAN_COALESCING", "true").lower() == "true"
+
+
+class SingleFlight:
+    """Run at most one call per key at a time and share its outcome.
+
+    The first caller for a key starts the work as a task; callers arriving
+    while it is in flight await the same task instead of starting their own.
+    The task is shielded, so a caller that disconnects does not cancel the
+    work for everyone else waiting on it.
+    """
+
+    def __init__(self):
+        """Initialize single-flight group."""
+        self._inflight: Dict[str, "asyncio.Task[Any]"] = {}
+        self._stats = {"executions": 0, "coalesced": 0}
+
+    async def do(self, key: str, func: Callable[[], Awaitable[T]]) -> T:
+        """Run func for key, or join the call already in flight for key.
+
+        Args:
+            key: Coalescing key; calls with equal keys share one execution
+            func: Zero-argument coroutine function doing the work
+
+        Returns:
+            The result of the shared execution
+
+        Raises:
+            Exception: Whatever the shared execution raised
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(func())
+            self._inflight[key] = task
+            self._stats["executions"] += 1
+            task.add_done_callback(lambda done: self._finish(key, done))
+        else:
+            self._stats["coalesced"] += 1
+
+        return await asyncio.shield(task)
+
+    def stats(self) -> Dict[str, int]:
+        """Return execution and coalescing counters.
+
+        Returns:
+            Dictionary with executions, coalesced and in_flight counts
+        """
+        return {**self._stats, "in_flight": len(self._inflight)}
+
+    def _finish(self, key: str, task: "asyncio.Task[Any]") -> None:
+        """Forget a finished task and mark its exception as retrieved."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            task.exception()
@@ -2,29 +2,41 @@
 
 from __future__ import annotations
 
-import json
-from typing import Dict, Any
+import asyncio
+from typing import Dict, Any, Iterator, Optional, Tuple, Union
 
-from utils.agentcore_client import AgentCoreClient, AgentCoreError
-from models import BurnConfig, BurnPlan
+from utils.agentcore_client import AgentCoreClient, AgentCoreError, AsyncAgentCoreClient
+from utils.burn_plan_stream import ServiceCostStreamParser
+from models import BurnConfig, BurnPlan, ServiceCost
+from utils.deadline import Deadline
+from utils.structured_logging import get_logger, log_payload
+from services.burn_plan_cache import BurnPlanCache, normalize_config_key
+from services.cost_solver import BURN_PLAN_COST_MODE, COST_TOLERANCE, CostSolverError, parse_amount, solve_plan_costs
+from services.shared_flight import SharedFlight
+from services.single_flight import SingleFlight
+
+logger = get_logger("strands")
 
 
 class StrandsService:
     """Service for interacting with Strands agents."""
 
-    def __init__(self, agentcore_client: AgentCoreClient):
+    def __init__(self, agentcore_client: AgentCoreClient, cache: Optional[BurnPlanCache] = None):
         """Initialize Strands service.
 
         Args:
             agentcore_client: Configured AgentCore client instance
+            cache: Burn plan cache consulted before invoking the agent
         """
         self.client = agentcore_client
+        self.cache = cache
 
-    def generate_burn_plan(self, config: BurnConfig) -> BurnPlan:
+    def generate_burn_plan(self, config: BurnConfig, deadline: Optional[Deadline] = None) -> BurnPlan:
         """Generate burn plan using Strands agent.
 
         Args:
             config: Burn configuration
+            deadline: Request deadline bounding agent invocation attempts
 
         Returns:
             Generated burn plan
@@ -32,48 +44,72 @@ class StrandsService:
         Raises:
             AgentCoreError: If agent invocation fails
         """
-        # Convert config to dict for agent
-        config_dict = {
-            "amount": config.amount,
-            "timeline": config.timeline,
-            "stupidity": config.stupidity,
-            "architecture": config.architecture,
-            "burning_style": config.burning_style
-        }
+        if self.cache is not None:
+            cached = self.cache.get(config)
+            if cached is not None:
+                return cached
+
+        response = self.client.generate_burn_plan(self._build_config_dict(config), deadline)
+        burn_plan = self._parse_burn_plan(config, response)
+
+        if self.cache is not None:
+            self.cache.put(config, burn_plan)
+
+        return burn_plan
+
+    def stream_burn_plan(
+        self,
+        config: BurnConfig,
+        deadline: Optional[Deadline] = None
+    ) -> Iterator[Tuple[str, Union[ServiceCost, BurnPlan]]]:
+        """Generate burn plan using Strands agent, yielding services as they arrive.
+
+        Args:
+            config: Burn configuration
+            deadline: Request deadline bounding the agent stream
 
-        # Invoke agent
-        response = self.client.generate_burn_plan(config_dict)
+        Yields:
+            ("service", ServiceCost) for each service as soon as the agent has
+            produced it, then ("plan", BurnPlan) with the validated full plan
+
+        Raises:
+            AgentCoreError: If agent invocation fails or the plan is invalid
+        """
+        if self.cache is not None:
+            cached = self.cache.get(config)
+            if cached is not None:
+                for service in cached.services_deployed:
+                    yield "service", service
+                yield "plan", cached
+                return
+
+        parser = ServiceCostStreamParser()
+
+        for chunk in self.client.stream_burn_plan(self._build_config_dict(config), deadline):
+            for service in parser.feed(chunk):
+                try:
+                    yield "service", ServiceCost(**service)
+                except Exception as e:
+                    raise AgentCoreError(f"Failed to parse streamed service: {e}")
 
-        # Parse and validate response
         try:
-            # Check if response is wrapped in 'analysis' key
-            if isinstance(response, dict) and 'analysis' in response:
-                burn_plan_data = response['analysis']
-            else:
-                burn_plan_data = response
-            
-            # Log the burn plan data for debugging
-            print(f"Burn plan data being parsed: {json.dumps(burn_plan_data, indent=2)}")
-            
-            burn_plan = BurnPlan(**burn_plan_data)
-            
-            # Log the parsed burn plan to verify pdf_invoice is included
-            print(f"Parsed burn plan includes pdf_invoice: {burn_plan.pdf_invoice is not None}")
-            if burn_plan.pdf_invoice:
-                print(f"PDF invoice details: {json.dumps(burn_plan.pdf_invoice, indent=2)}")
-        except Exception as e:
+            response = parser.result()
+        except ValueError as e:
             raise AgentCoreError(f"Failed to parse burn plan response: {e}")
 
-        # Validate cost matches requested amount (within 10%)
-        self._validate_cost_match(config.amount, burn_plan.total_calculated_cost)
+        burn_plan = self._parse_burn_plan(config, response)
 
-        return burn_plan
+        if self.cache is not None:
+            self.cache.put(config, burn_plan)
+
+        yield "plan", burn_plan
 
-    def generate_roast(self, burn_plan: BurnPlan) -> str:
+    def generate_roast(self, burn_plan: BurnPlan, deadline: Optional[Deadline] = None) -> str:
         """Generate roast commentary for burn plan.
 
         Args:
             burn_plan: Burn plan to roast
+            deadline: Request deadline bounding agent invocation attempts
 
         Returns:
             Roast commentary text
@@ -81,8 +117,28 @@ class StrandsService:
         Raises:
             AgentCoreError: If agent invocation fails
         """
-        # Build context for roast
-        context = {
+        roast_text = self.client.generate_roast(self._build_roast_context(burn_plan), deadline)
+
+        if not roast_text:
+            raise AgentCoreError("Agent returned empty roast text")
+
+        return roast_text
+
+    @staticmethod
+    def _build_config_dict(config: BurnConfig) -> Dict[str, Any]:
+        """Convert burn config to the dict passed to the agent."""
+        return {
+            "amount": config.amount,
+            "timeline": config.timeline,
+            "stupidity": config.stupidity,
+            "architecture": config.architecture,
+            "burning_style": config.burning_style
+        }
+
+    @staticmethod
+    def _build_roast_context(burn_plan: BurnPlan) -> Dict[str, Any]:
+        """Build the roast context passed to the agent."""
+        return {
             "total_amount": burn_plan.total_amount,
             "services": [
                 {
@@ -95,39 +151,183 @@ class StrandsService:
             "stupidity_level": burn_plan.efficiency_level
         }
 
-        # Invoke agent
-        roast_text = self.client.generate_roast(context)
+    def _parse_burn_plan(self, config: BurnConfig, response: Dict[str, Any]) -> BurnPlan:
+        """Parse and validate the agent response into a burn plan.
 
-        if not roast_text:
-            raise AgentCoreError("Agent returned empty roast text")
+        Args:
+            config: Burn configuration the plan was generated for
+            response: Raw agent response
 
-        return roast_text
+        Returns:
+            Validated burn plan
+
+        Raises:
+            AgentCoreError: If the response is invalid, or costs don't match the
+                requested amount in "validate" cost mode (or in "solve" mode,
+                when they are too far off for the solver)
+        """
+        try:
+            # Check if response is wrapped in 'analysis' key
+            if isinstance(response, dict) and 'analysis' in response:
+                burn_plan_data = response['analysis']
+            else:
+                burn_plan_data = response
+            
+            log_payload(logger, "Burn plan data being parsed", burn_plan_data)
+
+            burn_plan = BurnPlan(**burn_plan_data)
+
+            logger.debug("Parsed burn plan", extra={"fields": {
+                "services": len(burn_plan.services_deployed),
+                "total_calculated_cost": burn_plan.total_calculated_cost,
+                "has_pdf_invoice": burn_plan.pdf_invoice is not None
+            }})
+        except Exception as e:
+            raise AgentCoreError(f"Failed to parse burn plan response: {e}")
+
+        requested_value = parse_amount(config.amount)
+        if requested_value is None:
+            return burn_plan  # Can't match, keep the plan as generated
+
+        if BURN_PLAN_COST_MODE == "validate":
+            self._validate_cost_match(config.amount, requested_value, burn_plan.total_calculated_cost)
+            return burn_plan
 
-    def _validate_cost_match(self, requested_amount: str, calculated_cost: float) -> None:
+        # Make the services add up to the requested amount instead of rejecting the plan
+        try:
+            solved = solve_plan_costs(burn_plan, requested_value)
+        except CostSolverError as e:
+            # Too far off to solve without inventing rates: validate the plan as generated
+            logger.warning("Burn plan costs out of solver bounds", extra={"fields": {
+                "requested": requested_value,
+                "error": str(e)
+            }})
+            self._validate_cost_match(config.amount, requested_value, burn_plan.total_calculated_cost)
+            return burn_plan
+        except ValueError as e:
+            raise AgentCoreError(f"Failed to match burn plan cost: {e}")
+
+        if solved.adjusted:
+            logger.info("Adjusted burn plan costs to requested amount", extra={"fields": {
+                "requested": requested_value,
+                "services_total": round(solved.original_cost, 2),
+                "total_calculated_cost": burn_plan.total_calculated_cost
+            }})
+
+        return solved.plan
+
+    @staticmethod
+    def _validate_cost_match(requested_amount: str, requested_value: float, calculated_cost: float) -> None:
         """Validate that calculated cost matches requested amount.
 
         Args:
             requested_amount: Requested amount string (e.g., "$1000")
+            requested_value: Numeric value of the requested amount
             calculated_cost: Calculated total cost
 
         Raises:
             AgentCoreError: If costs don't match within tolerance
         """
-        # Extract numeric value from amount string
-        import re
-        match = re.search(r"[\d,]+\.?\d*", requested_amount)
-        if not match:
-            return  # Can't validate, skip
-
-        requested_value = float(match.group().replace(",", ""))
-
-        # Check within 10% tolerance
-        tolerance = 0.10
-        lower_bound = requested_value * (1 - tolerance)
-        upper_bound = requested_value * (1 + tolerance)
+        lower_bound = requested_value * (1 - COST_TOLERANCE)
+        upper_bound = requested_value * (1 + COST_TOLERANCE)
 
         if not (lower_bound <= calculated_cost <= upper_bound):
             raise AgentCoreError(
                 f"Cost mismatch: requested {requested_amount} ({requested_value}), "
-                f"but calculated {calculated_cost:.2f} (outside 10% tolerance)"
+                f"but calculated {calculated_cost:.2f} (outside {COST_TOLERANCE:.0%} tolerance)"
             )
+
+
+class AsyncStrandsService(StrandsService):
+    """Strands service whose agent calls are awaitable.
+
+    Shares request building and response validation with StrandsService, but
+    awaits an AsyncAgentCoreClient so async routers never block the event loop.
+    """
+
+    def __init__(
+        self,
+        agentcore_client: AsyncAgentCoreClient,
+        cache: Optional[BurnPlanCache] = None,
+        flights: Optional[SingleFlight] = None,
+        shared_flights: Optional[SharedFlight] = None
+    ):
+        """Initialize async Strands service.
+
+        Args:
+            agentcore_client: Configured async AgentCore client instance
+            cache: Burn plan cache consulted before invoking the agent
+            flights: Process-wide single-flight group; concurrent requests with
+                the same normalized config share one agent invocation
+            shared_flights: Cross-container flight group behind flights; the
+                same, for requests served by different containers
+        """
+        self.client = agentcore_client
+        self.cache = cache
+        self.flights = flights
+        self.shared_flights = shared_flights
+
+    async def generate_burn_plan(self, config: BurnConfig, deadline: Optional[Deadline] = None) -> BurnPlan:
+        """Generate burn plan using Strands agent.
+
+        Args:
+            config: Burn configuration
+            deadline: Request deadline bounding agent invocation attempts
+
+        Returns:
+            Generated burn plan
+
+        Raises:
+            AgentCoreError: If agent invocation fails
+        """
+        if self.cache is not None:
+            cached = await self._run_cache(self.cache.get, config)
+            if cached is not None:
+                return cached
+
+        key = normalize_config_key(config)
+
+        async def generate() -> BurnPlan:
+            if self.shared_flights is None:
+                return await self._generate_and_cache(config, deadline)
+            return await self.shared_flights.do(key, lambda: self._generate_and_cache(config, deadline), deadline)
+
+        if self.flights is None:
+            return await generate()
+        return await self.flights.do(key, generate)
+
+    async def _generate_and_cache(self, config: BurnConfig, deadline: Optional[Deadline]) -> BurnPlan:
+        """Invoke the agent for a burn plan and store the result in the cache."""
+        response = await self.client.generate_burn_plan(self._build_config_dict(config), deadline)
+        burn_plan = self._parse_burn_plan(config, response)
+
+        if self.cache is not None:
+            await self._run_cache(self.cache.put, config, burn_plan)
+
+        return burn_plan
+
+    async def generate_roast(self, burn_plan: BurnPlan, deadline: Optional[Deadline] = None) -> str:
+        """Generate roast commentary for burn plan.
+
+        Args:
+            burn_plan: Burn plan to roast
+            deadline: Request deadline bounding agent invocation attempts
+
+        Returns:
+            Roast commentary text
+
+        Raises:
+            AgentCoreError: If agent invocation fails
+        """
+        roast_text = await self.client.generate_roast(self._build_roast_context(burn_plan), deadline)
+
+        if not roast_text:
+            raise AgentCoreError("Agent returned empty roast text")
+
+        return roast_text
+
+    async def _run_cache(self, func, *args: Any) -> Any:
+        """Call a cache method, off the event loop when it may hit DynamoDB."""
+        if self.cache.shared_enabled:
+            return await asyncio.to_thread(func, *args)
+        return func(*args)
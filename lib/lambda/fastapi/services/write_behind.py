@@ -0,0 +1,249 @@
+"""Write-behind persistence for generated burn plans.
+
+With ``BURN_PLAN_WRITE_MODE=background`` the API responds as soon as a plan is
+generated and stores it afterwards in a background task, so the DynamoDB (and
+S3 overflow) round trip is off the response path. Until the write lands the
+plan is staged in the DynamoDB service, so ``GET /burn-plan/{id}`` and batch
+lookups still find it. Writes are retried with jittered exponential backoff;
+plans that still fail are spooled to a local dead-letter directory, unstaged
+(they stay readable until the session cache evicts them), and replayed after
+the next successful write.
+
+Background mode is refused on Lambda. Mangum runs background tasks before the
+invocation returns, so it saves no latency there, and the dead-letter spool
+would sit in the container's ephemeral /tmp, replayed only if that container
+serves another write: a client could hold a session ID for a plan that is
+never stored. It is meant for an ASGI server that sends the response first
+and keeps a durable spool (uvicorn, containers with a mounted volume).
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import random
+import threading
+import time
+import uuid
+from typing import Any, Dict, List, Optional
+
+from models import BurnPlan
+from services.dynamodb_service import DynamoDBService
+from utils.structured_logging import get_logger
+
+logger = get_logger("write_behind")
+
+# 'sync' stores before responding; 'background' stores after the response is sent
+BURN_PLAN_WRITE_MODE = os.environ.get("BURN_PLAN_WRITE_MODE", "sync")
+# Store attempts per plan before it is dead-lettered
+BURN_PLAN_WRITE_MAX_ATTEMPTS = int(os.environ.get("BURN_PLAN_WRITE_MAX_ATTEMPTS", "3"))
+# Base delay for the jittered exponential backoff between attempts
+BURN_PLAN_WRITE_BACKOFF_SECONDS = float(os.environ.get("BURN_PLAN_WRITE_BACKOFF_SECONDS", "0.2"))
+BURN_PLAN_DEAD_LETTER_DIR = os.environ.get("BURN_PLAN_DEAD_LETTER_DIR", "/tmp/burn-plans/dead-letter")
+
+
+class WriteBehindPersister:
+    """Store burn plans after the response, with retries and a dead-letter spool."""
+
+    def __init__(
+        self,
+        dynamodb_service: DynamoDBService,
+        mode: str = "sync",
+        max_attempts: int = 3,
+        backoff_seconds: float = 0.2,
+        dead_letter_dir: str = BURN_PLAN_DEAD_LETTER_DIR
+    ):
+        """Initialize write-behind persister.
+
+        Args:
+            dynamodb_service: Service the plans are stored with
+            mode: 'sync' or 'background'
+            max_attempts: Store attempts per plan before it is dead-lettered
+            backoff_seconds: Base delay between attempts
+            dead_letter_dir: Directory plans that could not be stored are spooled to
+
+        Raises:
+            ValueError: If the mode is unknown
+        """
+        if mode not in ("sync", "background"):
+            raise ValueError(f"Unknown BURN_PLAN_WRITE_MODE: {mode}")
+        self.dynamodb_service = dynamodb_service
+        self.mode = mode
+        self.max_attempts = max(1, max_attempts)
+        self.backoff_seconds = backoff_seconds
+        self.dead_letter_dir = dead_letter_dir
+        self._lock = threading.Lock()
+        self._replay_lock = threading.Lock()
+        self._stats = {"persisted": 0, "retries": 0, "dead_lettered": 0, "replayed": 0}
+
+    @classmethod
+    def from_env(cls, dynamodb_service: DynamoDBService) -> "WriteBehindPersister":
+        """Create a persister configured from BURN_PLAN_WRITE_* environment variables.
+
+        Raises:
+            ValueError: If the mode is unknown, or background on Lambda
+        """
+        if BURN_PLAN_WRITE_MODE == "background" and os.environ.get("AWS_LAMBDA_FUNCTION_NAME"):
+            raise ValueError(
+                "BURN_PLAN_WRITE_MODE=background is not supported on Lambda: background tasks "
+                "run before the invocation returns and the dead-letter spool is not durable"
+            )
+        return cls(
+            dynamodb_service,
+            mode=BURN_PLAN_WRITE_MODE,
+            max_attempts=BURN_PLAN_WRITE_MAX_ATTEMPTS,
+            backoff_seconds=BURN_PLAN_WRITE_BACKOFF_SECONDS,
+            dead_letter_dir=BURN_PLAN_DEAD_LETTER_DIR
+        )
+
+    @property
+    def background(self) -> bool:
+        """Whether plans are stored after the response."""
+        return self.mode == "background"
+
+    def stage(self, session_id: str, burn_plan: BurnPlan) -> None:
+        """Make a plan readable by session ID ahead of persist().
+
+        Args:
+            session_id: Session identifier
+            burn_plan: Burn plan to be stored
+        """
+        self.dynamodb_service.stage_burn_plan(session_id, burn_plan)
+
+    def persist(self, session_id: str, burn_plan: BurnPlan) -> bool:
+        """Store a staged plan, retrying and dead-lettering on failure.
+
+        Runs as a background task, so it never raises. After a successful
+        write, plans left in the dead-letter spool are replayed. A plan that
+        is dead-lettered is unstaged once it is spooled; if it cannot be
+        spooled it stays staged, memory being its only copy.
+
+        Args:
+            session_id: Session identifier
+            burn_plan: Burn plan to store
+
+        Returns:
+            True if the plan was stored, False if it was dead-lettered
+        """
+        error = self._store_with_retries(session_id, burn_plan)
+        if error is None:
+            self._count("persisted")
+            self.replay_dead_letters()
+            return True
+
+        try:
+            self._write_dead_letter(session_id, burn_plan, error)
+            self.dynamodb_service.unstage_burn_plan(session_id)
+        except (OSError, ValueError):
+            logger.exception("Failed to spool burn plan dead letter", extra={"fields": {"session": session_id}})
+        self._count("dead_lettered")
+        logger.error("Burn plan write dead-lettered", extra={"fields": {
+            "session": session_id,
+            "attempts": self.max_attempts,
+            "error": str(error)
+        }})
+        return False
+
+    def replay_dead_letters(self) -> int:
+        """Store plans from the dead-letter spool, oldest first.
+
+        Stops at the first failure, since the table is most likely still
+        unavailable. Only one replay runs at a time per process.
+
+        Returns:
+            Number of plans stored
+        """
+        if not self._replay_lock.acquire(blocking=False):
+            return 0
+        replayed = 0
+        try:
+            for path in self._dead_letter_paths():
+                try:
+                    with open(path, encoding="utf-8") as f:
+                        record = json.load(f)
+                    session_id = record["session_id"]
+                    burn_plan = BurnPlan.model_validate(record["burn_plan"])
+                except FileNotFoundError:
+                    continue
+                except (OSError, ValueError, KeyError):
+                    logger.exception("Unreadable burn plan dead letter", extra={"fields": {"path": path}})
+                    continue
+
+                try:
+                    self.dynamodb_service.store_burn_plan(session_id, burn_plan)
+                except Exception as e:
+                    logger.warning("Burn plan dead letter replay failed", extra={"fields": {
+                        "session": session_id,
+                        "error": str(e)
+                    }})
+                    break
+
+                os.remove(path)
+                replayed += 1
+                self._count("replayed")
+        finally:
+            self._replay_lock.release()
+
+        if replayed:
+            logger.info("Replayed burn plan dead letters", extra={"fields": {"replayed": replayed}})
+        return replayed
+
+    def stats(self) -> Dict[str, Any]:
+        """Return write counters, staged plans and the dead-letter backlog.
+
+        Returns:
+            Dictionary of counters and configuration
+        """
+        with self._lock:
+            stats: Dict[str, Any] = dict(self._stats)
+        stats["pending"] = self.dynamodb_service.pending_count
+        stats["dead_letter_backlog"] = len(self._dead_letter_paths())
+        stats["mode"] = self.mode
+        return stats
+
+    def _store_with_retries(self, session_id: str, burn_plan: BurnPlan) -> Optional[Exception]:
+        """Try to store a plan up to max_attempts times; return the last error, if any."""
+        error: Optional[Exception] = None
+        for attempt in range(self.max_attempts):
+            if attempt:
+                self._count("retries")
+                time.sleep(random.uniform(0, self.backoff_seconds * (2 ** (attempt - 1))))
+            try:
+                self.dynamodb_service.store_burn_plan(session_id, burn_plan)
+                return None
+            except Exception as e:
+                error = e
+                logger.warning("Burn plan write failed", extra={"fields": {
+                    "session": session_id,
+                    "attempt": attempt + 1,
+                    "error": str(e)
+                }})
+        return error
+
+    def _write_dead_letter(self, session_id: str, burn_plan: BurnPlan, error: Exception) -> None:
+        """Spool a plan that could not be stored."""
+        os.makedirs(self.dead_letter_dir, exist_ok=True)
+        record = {
+            "session_id": session_id,
+            "burn_plan": burn_plan.model_dump(mode="json"),
+            "error": str(error),
+            "failed_at": int(time.time() * 1000)
+        }
+        # Millisecond prefix keeps the spool in failure order when listed
+        path = os.path.join(self.dead_letter_dir, f"{record['failed_at']:013d}-{uuid.UUID(session_id)}.json")
+        tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(record, f)
+        os.replace(tmp_path, path)
+
+    def _dead_letter_paths(self) -> List[str]:
+        """Spooled dead letters, oldest first."""
+        try:
+            names = sorted(os.listdir(self.dead_letter_dir))
+        except FileNotFoundError:
+            return []
+        return [os.path.join(self.dead_letter_dir, name) for name in names if name.endswith(".json")]
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._stats[name] += 1
@@ -0,0 +1,75 @@
+"""Test the shared burn plan cache tier with several containers on one table.
+
+Runs offline against the in-memory DynamoDB stand-in: each BurnPlanCache
+plays a separate Lambda container, so their local tiers know nothing of
+each other's stores and shared-tier slots have to be chosen from the table.
+
+Usage:
+    python test_burn_plan_cache.py
+"""
+
+from benchmarks.fake_dynamodb import FakeDynamoDBResource
+from benchmarks.fixtures import BENCH_CONFIG, sample_burn_plan_dict
+
+from models import BurnConfig, BurnPlan
+from services import burn_plan_cache
+from services.burn_plan_cache import BurnPlanCache, normalize_config_key
+
+VARIANTS = 3
+
+resource = FakeDynamoDBResource()
+table = resource.create_table("burn-plan-cache", "cache_key", "variant")
+burn_plan_cache.get_resource = lambda *args, **kwargs: resource
+
+config = BurnConfig(**BENCH_CONFIG)
+key = normalize_config_key(config)
+plans = [BurnPlan(**sample_burn_plan_dict(num_services=n + 2)) for n in range(VARIANTS + 1)]
+
+
+def stored_plans():
+    return {item["variant"]: item["plan"] for item in table.scan()["Items"]}
+
+
+# Two containers, each storing plans it generated on its own
+first, second = (BurnPlanCache(variants_per_key=VARIANTS, table_name="burn-plan-cache") for _ in range(2))
+first.put(config, plans[0])
+second.put(config, plans[1])
+first.put(config, plans[2])
+stored = stored_plans()
+assert sorted(stored) == list(range(VARIANTS)), stored
+assert sorted(stored.values()) == sorted(plan.model_dump_json() for plan in plans[:VARIANTS])
+assert first.stats()["shared_errors"] == second.stats()["shared_errors"] == 0
+print(f"✅ Two containers filled distinct slots: {[int(slot) for slot in sorted(stored)]}")
+
+# A third container finds the key fully populated in the shared tier
+third = BurnPlanCache(variants_per_key=VARIANTS, table_name="burn-plan-cache")
+assert third.get(config) in plans[:VARIANTS]
+assert third.stats()["shared_hits"] == 1
+print("✅ Fully populated key served from the shared tier")
+
+# Once full, a store replaces the variant closest to expiry
+table.put_item(Item={**table.get_item(Key={"cache_key": key, "variant": 1})["Item"], "expires_at": 1})
+second.put(config, plans[3])
+stored = stored_plans()
+assert len(stored) == VARIANTS and stored[1] == plans[3].model_dump_json()
+print("✅ Expired slot reused instead of a live one")
+
+# A store that loses its slot to a concurrent write moves to another slot
+table.delete_item(Key={"cache_key": key, "variant": 2})
+original_query = table.query
+
+
+def racing_query(**kwargs):
+    # Another container claims slot 2 between this container's read and its write
+    response = original_query(**kwargs)
+    table.query = original_query
+    table.put_item(Item={"cache_key": key, "variant": 2, "plan": plans[0].model_dump_json(), "expires_at": 2 ** 40})
+    return response
+
+
+table.query = racing_query
+first.put(config, plans[3])
+stored = stored_plans()
+assert stored[2] == plans[0].model_dump_json(), "concurrent write was overwritten"
+assert first.stats()["shared_errors"] == 0
+print("✅ Lost slot race retried without overwriting the winner")
@@ -0,0 +1,75 @@
+"""Test the cost solver's bounds and the consistency of the services it solves.
+
+Runs offline on sample plans: solved services must keep the rate they were
+proposed at (cost per unit per day), and plans too far off for the bounds
+must be rejected rather than inflated to the target.
+
+Usage:
+    python test_cost_solver.py
+"""
+
+from benchmarks.fixtures import BENCH_CONFIG, sample_burn_plan_dict
+
+from models import BurnConfig, BurnPlan
+from services.cost_solver import BURN_PLAN_COST_SPREAD_TOLERANCE, CostSolverError, solve_plan_costs
+from services.strands_service import StrandsService
+from utils.agentcore_client import AgentCoreError
+
+TARGET = 5000.0
+
+
+def active_days(service, timeline):
+    end = timeline if service.end_day < 0 else service.end_day
+    return end - service.start_day
+
+
+def rates(plan):
+    """Implied cost per unit per day of each service."""
+    return [
+        service.total_cost / (service.quantity * active_days(service, plan.timeline_days))
+        for service in plan.services_deployed
+    ]
+
+
+def off_by(scale, windows=()):
+    """Sample plan whose services total TARGET * scale."""
+    data = sample_burn_plan_dict(num_services=4, amount=TARGET)
+    for service, (start, end) in zip(data["services_deployed"], windows):
+        service["start_day"], service["end_day"] = start, end
+    for service in data["services_deployed"]:
+        service["total_cost"] = round(service["total_cost"] * scale, 2)
+    return BurnPlan(**data)
+
+
+# A plan that already adds up is left alone
+plan = BurnPlan(**sample_burn_plan_dict(num_services=4, amount=TARGET))
+assert solve_plan_costs(plan, TARGET) == (plan, False, TARGET)
+print("✅ Matching plan left unchanged")
+
+# Plans off within the bounds sum to the target, each service at its proposed rate
+for scale, windows in [(0.93, ()), (1.4, [(3, 18), (10, 11)]), (0.25, [(0, 7)]), (6.0, ())]:
+    plan = off_by(scale, windows)
+    solved = solve_plan_costs(plan, TARGET).plan
+    assert round(sum(s.total_cost for s in solved.services_deployed), 2) == solved.total_calculated_cost == TARGET
+    for before, after in zip(rates(plan), rates(solved)):
+        assert abs(after / before - 1) <= BURN_PLAN_COST_SPREAD_TOLERANCE + 0.01, (scale, before, after)
+    print(f"✅ Plan off by {scale}x solved with rates kept: "
+          f"{[(s.quantity, active_days(s, solved.timeline_days)) for s in solved.services_deployed]}")
+
+# A plan generated for $5,000 but requested for $2,500,000 is beyond the bounds
+plan = off_by(1.0)
+try:
+    solve_plan_costs(plan, 2_500_000)
+    raise AssertionError("Expected CostSolverError for a plan 500x off")
+except CostSolverError as e:
+    print(f"✅ Plan 500x off rejected by the solver: {e}")
+
+# ...and falls back to the cost check, which rejects it (502) instead of inflating its rates
+config = BurnConfig(**{**BENCH_CONFIG, "amount": "$2,500,000"})
+try:
+    StrandsService(None)._parse_burn_plan(config, {"analysis": plan.model_dump()})
+    raise AssertionError("Expected AgentCoreError for a plan 500x off")
+except AgentCoreError as e:
+    assert "Cost mismatch" in str(e), e
+    print(f"✅ Out-of-bounds plan reported: {e}")
+
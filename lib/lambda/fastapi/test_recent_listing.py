@@ -0,0 +1,70 @@
+"""Test recent plans and summary listings across days without plans.
+
+Runs offline against the in-memory DynamoDB stand-in: plans are stored on a
+few days with weeks of nothing between them, and listings must still reach
+every plan, ending only after the oldest one.
+
+Usage:
+    python test_recent_listing.py
+"""
+
+import time
+
+from benchmarks.fake_dynamodb import make_burn_plans_resource, use_fake_dynamodb
+from benchmarks.fixtures import sample_burn_plan_dict
+
+from backfill_recent_index import backfill
+from models import BurnPlan
+from services.dynamodb_service import PLAN_DAYS_ID, DynamoDBService
+from utils.session_ids import new_session_id
+
+DAY_MS = 86_400_000
+# Days ago each plan was created: gaps of three weeks and a month between them
+PLAN_AGES = [0, 0, 21, 21, 21, 52, 90]
+
+now = int(time.time() * 1000)
+burn_plan = BurnPlan(**sample_burn_plan_dict(num_services=2))
+session_ids = [new_session_id(now - age * DAY_MS - i) for i, age in enumerate(PLAN_AGES)]
+
+with use_fake_dynamodb(make_burn_plans_resource()) as resource:
+    service = DynamoDBService()
+    for session_id in session_ids:
+        service.store_burn_plan(session_id, burn_plan)
+
+    # /recent skips the empty weeks instead of stopping at them
+    recent = service.get_recent_burn_plans(limit=6)
+    assert [plan["id"] for plan in recent] == session_ids[:6], recent
+    print(f"✅ /recent reached plans {PLAN_AGES[5]} days old across empty weeks")
+
+    # Paging through the listing returns every plan once, then ends
+    listed, cursor, pages = [], None, 0
+    while True:
+        items, cursor = service.list_burn_plan_summaries(limit=2, cursor=cursor)
+        listed.extend(item["id"] for item in items)
+        pages += 1
+        if cursor is None:
+            break
+    assert listed == session_ids, listed
+    assert pages == 4, pages
+    print(f"✅ Listing paged through all {len(listed)} plans in {pages} pages, last page has no cursor")
+
+    # An exactly full last page has no next page either
+    items, cursor = service.list_burn_plan_summaries(limit=len(session_ids))
+    assert len(items) == len(session_ids) and cursor is None
+    print("✅ Full last page reports no next page")
+
+    # The day index holds one item per day, outside the recent index and session lookups
+    table = resource.Table("burn-plans")
+    days = [item for item in table.scan()["Items"] if item["id"] == PLAN_DAYS_ID]
+    assert len(days) == len(set(PLAN_AGES)), days
+    assert service.get_burn_plan(PLAN_DAYS_ID) is None
+    print(f"✅ Day index holds {len(days)} days")
+
+    # Plans stored before the day index are reachable once the backfill records their days
+    for item in days:
+        table.delete_item(Key={"id": PLAN_DAYS_ID, "timestamp": item["timestamp"]})
+    counts = backfill(table)
+    assert counts["days"] == len(days) and counts["scanned"] == len(session_ids), counts
+    items, cursor = DynamoDBService().list_burn_plan_summaries(limit=len(session_ids))
+    assert [item["id"] for item in items] == session_ids and cursor is None
+    print(f"✅ Backfill rebuilt the day index: {counts}")
@@ -0,0 +1,102 @@
+"""Test burn plan coalescing across containers through the shared cache table.
+
+Runs offline against the in-memory DynamoDB stand-in: each SharedFlight plays
+a separate Lambda container, so identical requests can only meet through
+the table's lease items.
+
+Usage:
+    python test_shared_flight.py
+"""
+
+import asyncio
+
+from benchmarks.fake_dynamodb import FakeDynamoDBResource
+from benchmarks.fixtures import BENCH_CONFIG, sample_burn_plan_dict
+
+from models import BurnConfig, BurnPlan
+from services import shared_flight
+from services.burn_plan_cache import normalize_config_key
+from services.shared_flight import FLIGHT_KEY_SUFFIX, SharedFlight
+from utils.agentcore_client import AgentRateLimitError, AgentTimeoutError
+from utils.deadline import Deadline
+
+CONTAINERS = 8
+
+resource = FakeDynamoDBResource()
+table = resource.create_table("burn-plan-cache", "cache_key", "variant")
+shared_flight.get_resource = lambda *args, **kwargs: resource
+
+key = normalize_config_key(BurnConfig(**BENCH_CONFIG))
+burn_plan = BurnPlan(**sample_burn_plan_dict(num_services=3))
+containers = [SharedFlight("burn-plan-cache", poll_seconds=0.01) for _ in range(CONTAINERS)]
+invocations = []
+
+
+async def generate():
+    invocations.append(1)
+    await asyncio.sleep(0.1)
+    return burn_plan
+
+
+async def burst(flights, func, deadline=None):
+    return await asyncio.gather(*(flight.do(key, func, deadline) for flight in flights), return_exceptions=True)
+
+
+# A burst of identical requests on separate containers makes one agent invocation
+results = asyncio.run(burst(containers, generate))
+assert all(result == burn_plan for result in results), results
+assert len(invocations) == 1
+assert sum(flight.stats()["executions"] for flight in containers) == 1
+assert sum(flight.stats()["coalesced"] for flight in containers) == CONTAINERS - 1
+print(f"✅ {CONTAINERS} containers, 1 agent invocation")
+
+# An identical request shortly after is answered from the published plan
+assert asyncio.run(SharedFlight("burn-plan-cache").do(key, generate)) == burn_plan
+assert len(invocations) == 1
+print("✅ Published plan answers a request arriving after the burst")
+
+# A failed generation releases the lease: a waiting container claims it and generates
+table.delete_item(Key={"cache_key": key + FLIGHT_KEY_SUFFIX, "variant": 0})
+invocations.clear()
+
+
+async def throttled_once():
+    invocations.append(1)
+    await asyncio.sleep(0.05)
+    if len(invocations) == 1:
+        raise AgentRateLimitError("Rate limit exceeded")
+    return burn_plan
+
+
+results = asyncio.run(burst(containers[:3], throttled_once))
+assert sum(isinstance(result, AgentRateLimitError) for result in results) == 1, results
+assert sum(result == burn_plan for result in results) == 2 and len(invocations) == 2, results
+print("✅ Failed generation handed over to a waiting container")
+
+# A waiting container gives up at its deadline instead of outliving the request
+table.delete_item(Key={"cache_key": key + FLIGHT_KEY_SUFFIX, "variant": 0})
+
+
+async def slow():
+    await asyncio.sleep(0.5)
+    return burn_plan
+
+
+async def late_waiter():
+    owner = asyncio.ensure_future(containers[0].do(key, slow))
+    await asyncio.sleep(0.05)
+    try:
+        await containers[1].do(key, slow, Deadline.after(0.1))
+        raise AssertionError("Expected AgentTimeoutError while waiting")
+    except AgentTimeoutError as e:
+        print(f"✅ Waiter stopped at its deadline: {e}")
+    assert await owner == burn_plan
+
+
+asyncio.run(late_waiter())
+
+# A lease left by a container that died mid-generation is taken over once it expires
+table.put_item(Item={"cache_key": key + FLIGHT_KEY_SUFFIX, "variant": 0, "owner": "dead", "expires_at": 1})
+invocations.clear()
+assert asyncio.run(containers[2].do(key, generate)) == burn_plan and len(invocations) == 1
+print("✅ Expired lease taken over")
@@ -2,16 +2,38 @@
 
 from __future__ import annotations
 
+import asyncio
+import codecs
+import functools
 import json
 import os
+import random
+import threading
 import time
 import uuid
-from typing import Any, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, Optional
 
-try:
-    import boto3
-except ImportError:
-    boto3 = None
+from utils.aws_clients import SERVICE_CONFIGS, get_client
+from utils.deadline import Deadline
+from utils.structured_logging import get_logger, log_payload
+
+logger = get_logger("agentcore")
+
+
+# Upper bound on blocking AgentCore calls in flight per process when driven from asyncio
+AGENTCORE_MAX_CONCURRENCY = int(os.environ.get("AGENTCORE_MAX_CONCURRENCY", "16"))
+
+# Don't start an attempt with less time than this left before the request deadline
+AGENTCORE_MIN_ATTEMPT_SECONDS = float(os.environ.get("AGENTCORE_MIN_ATTEMPT_SECONDS", "5"))
+# Cap on a single retry backoff (full jitter below the cap)
+AGENTCORE_MAX_BACKOFF_SECONDS = 4.0
+# Deadline-narrowed read timeouts are rounded down to this granularity so only a
+# handful of pooled clients (one per bucket) are ever created
+AGENTCORE_TIMEOUT_BUCKET_SECONDS = 2
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
 
 
 class AgentCoreError(Exception):
@@ -36,6 +58,24 @@ class AgentConnectionError(AgentCoreError):
     pass
 
 
+def http_status_for_error(error: Exception) -> int:
+    """Map a burn plan generation error to the HTTP status the REST route uses.
+
+    Args:
+        error: Exception raised while generating a burn plan
+
+    Returns:
+        504 for timeouts, 429 for rate limiting, 502 for other agent errors, else 500
+    """
+    if isinstance(error, AgentTimeoutError):
+        return 504
+    if isinstance(error, AgentRateLimitError):
+        return 429
+    if isinstance(error, AgentCoreError):
+        return 502
+    return 500
+
+
 class AgentCoreClient:
     """Client for interacting with Strands agents via AgentCore SDK."""
 
@@ -43,7 +83,7 @@ class AgentCoreClient:
         self,
         agent_runtime_arn: Optional[str] = None,
         region: Optional[str] = None,
-        timeout: int = 30,
+        timeout: Optional[int] = None,
         max_retries: int = 2
     ):
         """Initialize AgentCore client with IAM authentication.
@@ -51,31 +91,29 @@ class AgentCoreClient:
         Args:
             agent_runtime_arn: AgentCore agent runtime ARN (defaults to AGENTCORE_AGENT_RUNTIME_ARN env var)
             region: AWS region (defaults to AWS_REGION env var)
-            timeout: Request timeout in seconds
+            timeout: Per-attempt read timeout in seconds, narrowed further by a request
+                deadline (defaults to AGENTCORE_READ_TIMEOUT)
             max_retries: Maximum number of retry attempts
         """
         self.agent_runtime_arn = agent_runtime_arn or os.environ.get("AGENTCORE_AGENT_RUNTIME_ARN", "")
         self.region = region or os.environ.get("AWS_REGION", "us-east-1")
-        self.timeout = timeout
+        self.timeout = timeout or SERVICE_CONFIGS["bedrock-agentcore"]["read_timeout"]
         self.max_retries = max_retries
 
         if not self.agent_runtime_arn:
             raise AgentCoreError("AGENTCORE_AGENT_RUNTIME_ARN is required")
 
-        if boto3 is None:
-            raise AgentCoreError("boto3 package is not installed")
-
         try:
-            # Initialize boto3 bedrock-agentcore client with IAM authentication
+            # Reuse the process-wide bedrock-agentcore client with IAM authentication
             # The Lambda execution role will provide credentials automatically
-            self.client = boto3.client(
-                'bedrock-agentcore',
-                region_name=self.region
-            )
+            # (boto3 is imported here, on first use, rather than at cold start)
+            self.client = get_client('bedrock-agentcore', region_name=self.region, read_timeout=self.timeout)
+        except ImportError:
+            raise AgentCoreError("boto3 package is not installed")
         except Exception as e:
             raise AgentConnectionError(f"Failed to initialize AgentCore client: {e}")
 
-    def generate_burn_plan(self, config: Dict[str, Any]) -> Dict[str, Any]:
+    def generate_burn_plan(self, config: Dict[str, Any], deadline: Optional[Deadline] = None) -> Dict[str, Any]:
         """Generate AWS spending burn plan using Strands agent.
 
         Args:
@@ -85,6 +123,7 @@ class AgentCoreClient:
                 - stupidity: Efficiency level (str)
                 - architecture: Architecture type (str)
                 - burning_style: Burning style (str)
+            deadline: Request deadline bounding all attempts
 
         Returns:
             Structured burn plan with services and costs
@@ -105,10 +144,111 @@ class AgentCoreClient:
         return self._invoke_agent(
             task_name="burn-plan-generator",
             instructions=instructions,
-            parameters=parameters
+            parameters=parameters,
+            deadline=deadline
+        )
+
+    def stream_burn_plan(self, config: Dict[str, Any], deadline: Optional[Deadline] = None) -> Iterator[str]:
+        """Stream the agent's burn plan JSON text as it is generated.
+
+        Asks the agent runtime for a streamed response and yields text chunks as
+        they arrive. Runtimes that do not stream return the whole document,
+        which is then yielded in chunks as it is read. Not retried: once output
+        has been forwarded to the caller a retry would duplicate it. The read
+        timeout is capped by the deadline and the stream is abandoned once it
+        passes.
+
+        Args:
+            config: Burn configuration (see generate_burn_plan)
+            deadline: Request deadline bounding the stream (no bound if omitted)
+
+        Yields:
+            Chunks of the burn plan JSON text
+
+        Raises:
+            AgentTimeoutError: If agent invocation times out or the deadline passes
+            AgentRateLimitError: If rate limited
+            AgentCoreError: If the agent reports an error
+        """
+        instructions = self._build_burn_plan_instructions(config)
+        payload = {
+            "prompt": instructions,
+            "amount": config.get("amount"),
+            "timeline": config.get("timeline"),
+            "stupidity_level": config.get("stupidity"),
+            "architecture": config.get("architecture"),
+            "burning_style": config.get("burning_style"),
+            "stream": True
+        }
+        session_id = str(uuid.uuid4()) + "-" + str(uuid.uuid4())[:5]
+
+        client = self.client
+        if deadline is not None:
+            remaining = deadline.remaining()
+            if remaining < AGENTCORE_MIN_ATTEMPT_SECONDS:
+                raise AgentTimeoutError(
+                    f"Request deadline leaves {remaining:.1f}s, not enough for an agent invocation"
+                )
+            read_timeout = self._deadline_read_timeout(remaining)
+            client = self._client_for_attempt(read_timeout)
+            payload["budget_ms"] = read_timeout * 1000
+
+        try:
+            response = client.invoke_agent_runtime(
+                agentRuntimeArn=self.agent_runtime_arn,
+                runtimeSessionId=session_id,
+                payload=json.dumps(payload),
+                qualifier="DEFAULT"
+            )
+        except client.exceptions.ThrottlingException as e:
+            raise AgentRateLimitError(
+                f"Rate limit exceeded: {e}",
+                retry_after=self._extract_retry_after(str(e))
+            )
+        except Exception as e:
+            error_msg = str(e).lower()
+            if "timeout" in error_msg or "timed out" in error_msg:
+                raise AgentTimeoutError(f"Agent invocation timed out: {e}")
+            raise AgentCoreError(f"Agent invocation failed: {e}")
+
+        logger.info(
+            "Agent stream opened",
+            extra={"fields": {"task": "burn-plan-generator", "session": session_id}}
         )
+        body = response["response"]
 
-    def generate_roast(self, context: Dict[str, Any]) -> str:
+        def check_deadline() -> None:
+            if deadline is not None and deadline.expired:
+                body.close()
+                raise AgentTimeoutError("Request deadline passed while streaming the burn plan")
+
+        try:
+            if "text/event-stream" in response.get("contentType", ""):
+                for line in body.iter_lines():
+                    check_deadline()
+                    line = line.decode("utf-8")
+                    if not line.startswith("data:"):
+                        continue
+                    event = json.loads(line[5:].strip())
+                    if isinstance(event, str):
+                        yield event
+                    elif isinstance(event, dict) and event.get("status") == "error":
+                        raise AgentCoreError(f"Agent error: {event.get('error')}")
+            else:
+                decoder = codecs.getincrementaldecoder("utf-8")()
+                for chunk in body.iter_chunks():
+                    check_deadline()
+                    yield decoder.decode(chunk)
+                yield decoder.decode(b"", final=True)
+        except AgentCoreError:
+            raise
+        except Exception as e:
+            error_msg = str(e).lower()
+            if "timeout" in error_msg or "timed out" in error_msg:
+                raise AgentTimeoutError(f"Agent stream timed out: {e}")
+            raise AgentCoreError(f"Agent stream failed: {e}")
+
+    def generate_roast(self, context: Dict[str, Any], deadline: Optional[Deadline] = None) -> str:
         """Generate roast commentary for spending scenario.
 
         Args:
@@ -116,13 +256,17 @@ class AgentCoreClient:
                 - total_amount: Total spending amount
                 - services: List of services deployed
                 - stupidity_level: Efficiency level
+            deadline: Request deadline bounding all attempts
+
+        The agent runtime handles it as its "roast-generator" task and
+        answers with roast_text.
 
         Returns:
             Roast commentary text
 
         Raises:
             AgentTimeoutError: If agent invocation times out
-            AgentCoreError: If agent returns invalid response
+            AgentCoreError: If agent returns invalid response or refuses
         """
         instructions = self._build_roast_instructions(context)
         parameters = {
@@ -134,9 +278,12 @@ class AgentCoreClient:
         result = self._invoke_agent(
             task_name="roast-generator",
             instructions=instructions,
-            parameters=parameters
+            parameters=parameters,
+            deadline=deadline
         )
 
+        if result.get("status") == "error":
+            raise AgentCoreError(f"Agent error: {result.get('message') or result.get('error')}")
         return result.get("roast_text", "")
 
     def _build_burn_plan_instructions(self, config: Dict[str, Any]) -> str:
@@ -180,20 +327,26 @@ Focus on the absurdity of the spending choices."""
         self,
         task_name: str,
         instructions: str,
-        parameters: Dict[str, Any]
+        parameters: Dict[str, Any],
+        deadline: Optional[Deadline] = None
     ) -> Dict[str, Any]:
-        """Invoke Strands agent with retry logic.
+        """Invoke Strands agent with deadline-aware retry logic.
+
+        Each attempt's read timeout is capped by the time left before the
+        deadline, and an attempt (or retry backoff) that could not finish in
+        time is not started. Backoff uses full jitter.
 
         Args:
             task_name: Name of the agent task
             instructions: Task instructions
             parameters: Task parameters
+            deadline: Request deadline bounding all attempts (no bound if omitted)
 
         Returns:
             Agent response as dictionary
 
         Raises:
-            AgentTimeoutError: If agent times out
+            AgentTimeoutError: If agent times out or the deadline leaves no time for an attempt
             AgentRateLimitError: If rate limited
             AgentConnectionError: If connection fails
             AgentCoreError: For other errors
@@ -201,6 +354,19 @@ Focus on the absurdity of the spending choices."""
         last_error = None
 
         for attempt in range(self.max_retries + 1):
+            read_timeout = self.timeout
+            if deadline is not None:
+                remaining = deadline.remaining()
+                if remaining < AGENTCORE_MIN_ATTEMPT_SECONDS:
+                    if last_error is not None:
+                        raise last_error
+                    raise AgentTimeoutError(
+                        f"Request deadline leaves {remaining:.1f}s, not enough for an agent invocation"
+                    )
+                read_timeout = self._deadline_read_timeout(remaining)
+
+            client = self._client_for_attempt(read_timeout)
+
             try:
                 start_time = time.time()
 
@@ -208,117 +374,130 @@ Focus on the absurdity of the spending choices."""
                 session_id = str(uuid.uuid4()) + "-" + str(uuid.uuid4())[:5]
 
                 # Build payload with prompt and parameters
+                # budget_ms tells the agent how long this attempt will wait, so
+                # its model routing and fallbacks stay within it
                 payload = json.dumps({
+                    "task": task_name,
                     "prompt": instructions,
-                    **parameters
+                    **parameters,
+                    "budget_ms": read_timeout * 1000
                 })
 
                 # Invoke agent via boto3 bedrock-agentcore client
-                response = self.client.invoke_agent_runtime(
+                response = client.invoke_agent_runtime(
                     agentRuntimeArn=self.agent_runtime_arn,
                     runtimeSessionId=session_id,
                     payload=payload,
                     qualifier="DEFAULT"
                 )
 
-                elapsed = time.time() - start_time
-
-                # Log invocation
-                print(f"Agent invocation: task={task_name}, elapsed={elapsed:.2f}s, attempt={attempt + 1}, session={session_id}")
-
                 # Parse response
                 response_body = response['response'].read()
                 response_data = json.loads(response_body)
+                elapsed = time.time() - start_time
 
                 # Validate response
                 if not response_data or not isinstance(response_data, dict):
                     raise AgentCoreError("Invalid response format from agent")
 
-                # Log full response for debugging
-                print(f"Full AgentCore response: {json.dumps(response_data, indent=2)}")
-                
-                # Check if pdf_invoice is in the response
-                if 'pdf_invoice' in response_data:
-                    print(f"✓ pdf_invoice found in AgentCore response")
-                elif 'analysis' in response_data and isinstance(response_data['analysis'], dict):
-                    if 'pdf_invoice' in response_data['analysis']:
-                        print(f"✓ pdf_invoice found in response['analysis']")
-                    else:
-                        print(f"⚠ pdf_invoice NOT found in response['analysis']")
-                else:
-                    print(f"⚠ pdf_invoice NOT found in AgentCore response")
+                analysis = response_data.get('analysis')
+                has_pdf_invoice = 'pdf_invoice' in response_data or (
+                    isinstance(analysis, dict) and 'pdf_invoice' in analysis
+                )
+
+                logger.info("Agent invocation", extra={"fields": {
+                    "task": task_name,
+                    "elapsed": round(elapsed, 3),
+                    "attempt": attempt + 1,
+                    "read_timeout": read_timeout,
+                    "session": session_id,
+                    "response_bytes": len(response_body),
+                    "has_pdf_invoice": has_pdf_invoice
+                }})
+                log_payload(logger, "AgentCore response", response_data, task=task_name, session=session_id)
 
                 return response_data
 
-            except self.client.exceptions.ThrottlingException as e:
+            except client.exceptions.ThrottlingException as e:
                 retry_after = self._extract_retry_after(str(e))
-                last_error = AgentRateLimitError(
+                raise AgentRateLimitError(
                     f"Rate limit exceeded: {e}",
                     retry_after=retry_after
                 )
-                raise last_error
 
-            except self.client.exceptions.InternalServerException as e:
+            except client.exceptions.InternalServerException as e:
                 last_error = AgentConnectionError(f"Internal server error: {e}")
-                if attempt < self.max_retries:
-                    wait_time = 2 ** attempt
-                    print(f"Internal server error on attempt {attempt + 1}, retrying in {wait_time}s...")
-                    time.sleep(wait_time)
-                    continue
-                raise last_error
+                label = "Internal server error"
 
             except (
-                self.client.exceptions.AccessDeniedException,
-                self.client.exceptions.UnauthorizedException
+                client.exceptions.AccessDeniedException,
+                client.exceptions.UnauthorizedException
             ) as e:
                 # Don't retry auth errors
-                last_error = AgentCoreError(f"Authentication/Authorization failed: {e}")
-                raise last_error
+                raise AgentCoreError(f"Authentication/Authorization failed: {e}")
 
             except (
-                self.client.exceptions.ResourceNotFoundException,
-                self.client.exceptions.InvalidInputException,
-                self.client.exceptions.ValidationException
+                client.exceptions.ResourceNotFoundException,
+                client.exceptions.InvalidInputException,
+                client.exceptions.ValidationException
             ) as e:
                 # Don't retry validation errors
-                last_error = AgentCoreError(f"Invalid request: {e}")
-                raise last_error
+                raise AgentCoreError(f"Invalid request: {e}")
 
             except Exception as e:
                 error_msg = str(e).lower()
 
-                # Check for timeout
                 if "timeout" in error_msg or "timed out" in error_msg:
                     last_error = AgentTimeoutError(f"Agent invocation timed out: {e}")
-                    if attempt < self.max_retries:
-                        wait_time = 2 ** attempt
-                        print(f"Timeout on attempt {attempt + 1}, retrying in {wait_time}s...")
-                        time.sleep(wait_time)
-                        continue
-                    raise last_error
-
-                # Check for connection errors
-                if "connection" in error_msg or "network" in error_msg:
+                    label = "Timeout"
+                elif "connection" in error_msg or "network" in error_msg:
                     last_error = AgentConnectionError(f"Connection failed: {e}")
-                    if attempt < self.max_retries:
-                        wait_time = 2 ** attempt
-                        print(f"Connection error on attempt {attempt + 1}, retrying in {wait_time}s...")
-                        time.sleep(wait_time)
-                        continue
-                    raise last_error
-
-                # Generic error
-                last_error = AgentCoreError(f"Agent invocation failed: {e}")
-                if attempt < self.max_retries:
-                    wait_time = 2 ** attempt
-                    print(f"Error on attempt {attempt + 1}, retrying in {wait_time}s...")
-                    time.sleep(wait_time)
-                    continue
+                    label = "Connection error"
+                else:
+                    last_error = AgentCoreError(f"Agent invocation failed: {e}")
+                    label = "Error"
+
+            if attempt >= self.max_retries:
                 raise last_error
 
+            wait_time = random.uniform(0, min(AGENTCORE_MAX_BACKOFF_SECONDS, 2 ** attempt))
+            if deadline is not None and deadline.remaining() - wait_time < AGENTCORE_MIN_ATTEMPT_SECONDS:
+                logger.warning("Agent invocation failed, request deadline too close to retry", extra={"fields": {
+                    "task": task_name,
+                    "error_type": label,
+                    "attempt": attempt + 1,
+                    "deadline_remaining": round(deadline.remaining(), 3),
+                    "error": str(last_error)
+                }})
+                raise last_error
+
+            logger.warning("Agent invocation failed, retrying", extra={"fields": {
+                "task": task_name,
+                "error_type": label,
+                "attempt": attempt + 1,
+                "backoff": round(wait_time, 3),
+                "error": str(last_error)
+            }})
+            time.sleep(wait_time)
+
         # Should not reach here, but just in case
         raise last_error or AgentCoreError("Agent invocation failed after all retries")
 
+    def _deadline_read_timeout(self, remaining: float) -> int:
+        """Read timeout for an attempt with remaining seconds left, rounded down to a bucket."""
+        bucket = AGENTCORE_TIMEOUT_BUCKET_SECONDS
+        return min(self.timeout, max(bucket, int(remaining) // bucket * bucket))
+
+    def _client_for_attempt(self, read_timeout: int) -> Any:
+        """Return the bedrock-agentcore client to use for an attempt.
+
+        Timeouts tighter than the client default come from the registry, which
+        keeps one pooled client per read timeout bucket.
+        """
+        if read_timeout >= self.timeout:
+            return self.client
+        return get_client('bedrock-agentcore', region_name=self.region, read_timeout=read_timeout)
+
     def _extract_retry_after(self, error_message: str) -> Optional[int]:
         """Extract retry-after value from error message."""
         import re
@@ -326,3 +505,77 @@ Focus on the absurdity of the spending choices."""
         if match:
             return int(match.group(1))
         return None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Return the process-wide thread pool used to offload AgentCore calls."""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=AGENTCORE_MAX_CONCURRENCY,
+                    thread_name_prefix="agentcore"
+                )
+    return _executor
+
+
+class AsyncAgentCoreClient:
+    """Asyncio-friendly AgentCore client.
+
+    boto3 has no native async transport, so each blocking ``invoke_agent_runtime``
+    call (including its retries and backoff sleeps) runs on a bounded, process-wide
+    thread pool. The event loop stays free to serve other requests while a
+    generation is in flight; calls beyond ``AGENTCORE_MAX_CONCURRENCY`` queue in
+    the pool instead of spawning unbounded threads.
+    """
+
+    def __init__(self, client: Optional[AgentCoreClient] = None, **client_kwargs: Any):
+        """Initialize async AgentCore client.
+
+        Args:
+            client: Existing synchronous client to wrap (created from client_kwargs if omitted)
+            **client_kwargs: Arguments forwarded to AgentCoreClient when creating a client
+        """
+        self.client = client or AgentCoreClient(**client_kwargs)
+
+    async def generate_burn_plan(self, config: Dict[str, Any], deadline: Optional[Deadline] = None) -> Dict[str, Any]:
+        """Generate AWS spending burn plan without blocking the event loop.
+
+        Args:
+            config: Burn configuration (see AgentCoreClient.generate_burn_plan)
+            deadline: Request deadline bounding all attempts
+
+        Returns:
+            Structured burn plan with services and costs
+
+        Raises:
+            AgentTimeoutError: If agent invocation times out
+            AgentCoreError: If agent returns invalid response
+        """
+        return await self._run(self.client.generate_burn_plan, config, deadline)
+
+    async def generate_roast(self, context: Dict[str, Any], deadline: Optional[Deadline] = None) -> str:
+        """Generate roast commentary without blocking the event loop.
+
+        Args:
+            context: Roast context (see AgentCoreClient.generate_roast)
+            deadline: Request deadline bounding all attempts
+
+        The agent runtime handles it as its "roast-generator" task and
+        answers with roast_text.
+
+        Returns:
+            Roast commentary text
+
+        Raises:
+            AgentTimeoutError: If agent invocation times out
+            AgentCoreError: If agent returns invalid response or refuses
+        """
+        return await self._run(self.client.generate_roast, context, deadline)
+
+    @staticmethod
+    async def _run(func: Callable[..., Any], *args: Any) -> Any:
+        """Run a blocking client call on the AgentCore thread pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_get_executor(), functools.partial(func, *args))
@@ -0,0 +1,108 @@
+"""Incremental parsing of burn plan JSON streamed from the agent."""
+
+from __future__ import annotations
+
+import json
+import re
+from typing import Any, Dict, List, Optional
+
+_SERVICES_KEY_PATTERN = re.compile(r'"services_deployed"\s*:\s*$')
+
+
+class ServiceCostStreamParser:
+    """Extract ``services_deployed`` items from burn plan JSON as it arrives.
+
+    Feed text chunks in order; each call returns the service objects whose
+    closing brace arrived in that chunk. Once the stream is exhausted,
+    ``result()`` parses the whole document.
+    """
+
+    def __init__(self):
+        """Initialize parser state."""
+        self._text = ""
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._array_depth: Optional[int] = None
+        self._array_done = False
+        self._item_start: Optional[int] = None
+
+    def feed(self, chunk: str) -> List[Dict[str, Any]]:
+        """Consume a chunk of streamed text.
+
+        Args:
+            chunk: Next piece of the agent's JSON output
+
+        Returns:
+            Service dictionaries completed by this chunk
+        """
+        self._text += chunk
+        text = self._text
+        completed = []
+
+        for pos in range(self._pos, len(text)):
+            char = text[pos]
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+                continue
+
+            if char == '"':
+                self._in_string = True
+            elif char in "{[":
+                self._depth += 1
+                if (
+                    char == "["
+                    and self._array_depth is None
+                    and not self._array_done
+                    and _SERVICES_KEY_PATTERN.search(text[max(0, pos - 64):pos])
+                ):
+                    self._array_depth = self._depth
+                elif char == "{" and self._array_depth is not None and self._depth == self._array_depth + 1:
+                    self._item_start = pos
+            elif char in "}]":
+                if (
+                    char == "}"
+                    and self._item_start is not None
+                    and self._depth == self._array_depth + 1
+                ):
+                    try:
+                        completed.append(json.loads(text[self._item_start:pos + 1]))
+                    except json.JSONDecodeError:
+                        pass  # Left for full-document validation in result()
+                    self._item_start = None
+                elif char == "]" and self._array_depth is not None and self._depth == self._array_depth:
+                    self._array_depth = None
+                    self._array_done = True
+                self._depth -= 1
+
+        self._pos = len(text)
+        return completed
+
+    @property
+    def text(self) -> str:
+        """All text received so far."""
+        return self._text
+
+    def result(self) -> Dict[str, Any]:
+        """Parse the complete streamed document.
+
+        Tolerates markdown code fences and prose around the JSON object.
+
+        Returns:
+            Parsed burn plan response dictionary
+
+        Raises:
+            ValueError: If no JSON object can be parsed from the stream
+        """
+        start = self._text.find("{")
+        end = self._text.rfind("}")
+        if start == -1 or end < start:
+            raise ValueError("No JSON object found in streamed agent response")
+        return json.loads(self._text[start:end + 1])
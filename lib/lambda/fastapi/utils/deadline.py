@@ -0,0 +1,69 @@
+"""Request deadlines for budgeting time across downstream calls."""
+
+from __future__ import annotations
+
+import os
+import time
+from typing import Any, Optional
+
+# API Gateway cuts requests off at 29 s; keep headroom to store and respond
+DEFAULT_REQUEST_BUDGET_SECONDS = float(os.environ.get("REQUEST_BUDGET_SECONDS", "27"))
+# Time reserved after the last downstream call (persisting the plan, serializing the response)
+DEADLINE_SAFETY_MARGIN_SECONDS = float(os.environ.get("DEADLINE_SAFETY_MARGIN_SECONDS", "1.5"))
+
+
+class Deadline:
+    """A point in time by which a request must have finished its work."""
+
+    def __init__(self, expires_at: float):
+        """Initialize deadline.
+
+        Args:
+            expires_at: Expiry as a time.monotonic() timestamp
+        """
+        self.expires_at = expires_at
+
+    @classmethod
+    def after(cls, seconds: float) -> "Deadline":
+        """Create a deadline the given number of seconds from now."""
+        return cls(time.monotonic() + seconds)
+
+    @classmethod
+    def for_request(
+        cls,
+        lambda_context: Optional[Any] = None,
+        budget_seconds: Optional[float] = None
+    ) -> "Deadline":
+        """Create the deadline for an incoming request.
+
+        Uses the tighter of the per-request budget and the Lambda invocation's
+        remaining time (less a safety margin), so work stops before either
+        API Gateway or the Lambda runtime kills the request.
+
+        Args:
+            lambda_context: Lambda context object, if running in Lambda
+            budget_seconds: Per-request budget (defaults to REQUEST_BUDGET_SECONDS)
+
+        Returns:
+            Request deadline
+        """
+        seconds = DEFAULT_REQUEST_BUDGET_SECONDS if budget_seconds is None else budget_seconds
+
+        get_remaining = getattr(lambda_context, "get_remaining_time_in_millis", None)
+        if callable(get_remaining):
+            lambda_seconds = get_remaining() / 1000.0 - DEADLINE_SAFETY_MARGIN_SECONDS
+            seconds = min(seconds, lambda_seconds)
+
+        return cls.after(max(0.0, seconds))
+
+    def remaining(self) -> float:
+        """Seconds left before the deadline (never negative)."""
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        """Whether the deadline has passed."""
+        return self.remaining() <= 0.0
+
+    def __repr__(self) -> str:
+        return f"Deadline(remaining={self.remaining():.2f}s)"
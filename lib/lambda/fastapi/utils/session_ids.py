@@ -0,0 +1,53 @@
+"""Time-ordered session IDs that carry their creation timestamp.
+
+Session IDs are UUIDv7 (RFC 9562): the first 48 bits are the Unix time in
+milliseconds. The burn-plans table's sort key is that same timestamp, so the
+full primary key of a plan can be derived from its session ID alone, which is
+what BatchGetItem and GetItem need.
+"""
+
+from __future__ import annotations
+
+import secrets
+import time
+import uuid
+from typing import Optional
+
+
+def new_session_id(timestamp_ms: Optional[int] = None) -> str:
+    """Generate a UUIDv7 session ID.
+
+    Args:
+        timestamp_ms: Creation time in epoch milliseconds (defaults to now)
+
+    Returns:
+        Session ID string
+    """
+    if timestamp_ms is None:
+        timestamp_ms = int(time.time() * 1000)
+
+    value = (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80
+    value |= 0x7 << 76                          # version 7
+    value |= secrets.randbits(12) << 64         # rand_a
+    value |= 0b10 << 62                         # RFC 9562 variant
+    value |= secrets.randbits(62)               # rand_b
+    return str(uuid.UUID(int=value))
+
+
+def session_timestamp(session_id: str) -> Optional[int]:
+    """Extract the creation timestamp from a session ID.
+
+    Args:
+        session_id: Session ID
+
+    Returns:
+        Epoch milliseconds for UUIDv7 IDs; None for other IDs (e.g. the UUIDv4
+        IDs issued before session IDs were time-ordered)
+    """
+    try:
+        parsed = uuid.UUID(session_id)
+    except (ValueError, TypeError, AttributeError):
+        return None
+    if parsed.version != 7:
+        return None
+    return parsed.int >> 80
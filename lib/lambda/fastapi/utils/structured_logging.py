@@ -0,0 +1,95 @@
+"""Structured, level-gated JSON logging for the API hot path.
+
+Every record is emitted as a single JSON line, which CloudWatch Logs Insights
+can query field by field. Structured fields are passed through ``extra``::
+
+    logger.info("Agent invocation", extra={"fields": {"task": task_name, "elapsed": 1.2}})
+
+Large payloads go through ``log_payload``, which does no serialization work
+unless DEBUG is enabled and the record is picked by payload sampling.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import random
+import sys
+import threading
+from typing import Any
+
+LOGGER_NAMESPACE = "bill_burner"
+
+# Root level for bill_burner loggers (DEBUG enables payload dumps)
+LOG_LEVEL = os.environ.get("LOG_LEVEL", "INFO").upper()
+# Fraction of payload dumps emitted when DEBUG is enabled
+LOG_PAYLOAD_SAMPLE_RATE = float(os.environ.get("LOG_PAYLOAD_SAMPLE_RATE", "1.0"))
+
+_configured = False
+_configure_lock = threading.Lock()
+
+
+class JsonFormatter(logging.Formatter):
+    """Format log records as single-line JSON objects."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Serialize a record, merging its structured fields."""
+        entry = {
+            "timestamp": self.formatTime(record, "%Y-%m-%dT%H:%M:%S"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        fields = getattr(record, "fields", None)
+        if fields:
+            entry.update(fields)
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str, separators=(",", ":"))
+
+
+def _configure() -> None:
+    """Attach the JSON handler to the namespace logger once per process."""
+    global _configured
+    with _configure_lock:
+        if _configured:
+            return
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(JsonFormatter())
+        root = logging.getLogger(LOGGER_NAMESPACE)
+        root.addHandler(handler)
+        root.setLevel(LOG_LEVEL)
+        # The Lambda runtime installs its own root handler; don't log twice
+        root.propagate = False
+        _configured = True
+
+
+def get_logger(name: str) -> logging.Logger:
+    """Get a structured logger under the bill_burner namespace.
+
+    Args:
+        name: Logger name suffix (e.g., 'agentcore')
+
+    Returns:
+        Configured logger
+    """
+    if not _configured:
+        _configure()
+    return logging.getLogger(f"{LOGGER_NAMESPACE}.{name}")
+
+
+def log_payload(logger: logging.Logger, message: str, payload: Any, **fields: Any) -> None:
+    """Log a full payload at DEBUG level, subject to sampling.
+
+    Args:
+        logger: Logger to emit on
+        message: Log message
+        payload: JSON-serializable payload to include under 'payload'
+        **fields: Additional structured fields
+    """
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
+    if LOG_PAYLOAD_SAMPLE_RATE < 1.0 and random.random() >= LOG_PAYLOAD_SAMPLE_RATE:
+        return
+    logger.debug(message, extra={"fields": {**fields, "payload": payload}})
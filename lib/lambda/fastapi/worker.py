@@ -0,0 +1,88 @@
+"""Burn plan job worker: SQS-triggered Lambda handler and local spool drainer."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import time
+from functools import lru_cache
+from typing import Any, Dict
+
+from services.burn_plan_cache import BurnPlanCache
+from services.burn_plan_jobs import (
+    BURN_PLAN_JOB_BUDGET_SECONDS,
+    BurnPlanJobWorker,
+    LocalFileJobQueue,
+    create_job_store
+)
+from services.dynamodb_service import DynamoDBService
+from services.strands_service import StrandsService
+from utils.agentcore_client import AgentCoreClient
+from utils.deadline import Deadline
+from utils.structured_logging import get_logger
+
+logger = get_logger("worker")
+
+
+@lru_cache(maxsize=1)
+def get_worker() -> BurnPlanJobWorker:
+    """Build the job worker once per process (reused by warm invocations)."""
+    return BurnPlanJobWorker(
+        create_job_store(),
+        StrandsService(AgentCoreClient(), cache=BurnPlanCache.from_env()),
+        DynamoDBService()
+    )
+
+
+def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
+    """Process burn plan jobs delivered by SQS.
+
+    Generation failures are recorded on the job; only infrastructure errors
+    (e.g. the job store being unreachable) fail the message for redelivery.
+
+    Args:
+        event: SQS event with one message per job
+        context: Lambda context
+
+    Returns:
+        Partial batch response listing messages to redeliver
+    """
+    worker = get_worker()
+    failures = []
+
+    for record in event.get("Records", []):
+        try:
+            job_id = json.loads(record["body"])["job_id"]
+            worker.process(job_id, Deadline.for_request(context, BURN_PLAN_JOB_BUDGET_SECONDS))
+        except Exception:
+            logger.exception("Burn plan job message failed", extra={"fields": {"message_id": record.get("messageId")}})
+            failures.append({"itemIdentifier": record["messageId"]})
+
+    return {"batchItemFailures": failures}
+
+
+def main() -> None:
+    """Drain a local spool-directory queue (BURN_PLAN_JOB_QUEUE=file)."""
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument(
+        "--spool",
+        default=os.environ.get("BURN_PLAN_JOB_SPOOL_DIR", "/tmp/burn-plan-jobs/spool"),
+        help="Spool directory the API enqueues jobs into"
+    )
+    parser.add_argument("--watch", action="store_true", help="Keep polling the spool instead of exiting")
+    parser.add_argument("--interval", type=float, default=1.0, help="Seconds between polls with --watch")
+    args = parser.parse_args()
+
+    queue = LocalFileJobQueue(args.spool)
+    while True:
+        processed = queue.drain(get_worker())
+        if processed or not args.watch:
+            print(f"Processed {processed} job(s) from {args.spool}")
+        if not args.watch:
+            break
+        time.sleep(args.interval)
+
+
+if __name__ == "__main__":
+    main()
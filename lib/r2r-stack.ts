@@ -13,6 +13,8 @@ import * as targets from 'aws-cdk-lib/aws-route53-targets';
 import * as acm from 'aws-cdk-lib/aws-certificatemanager';
 import * as iam from 'aws-cdk-lib/aws-iam';
 import * as dynamodb from 'aws-cdk-lib/aws-dynamodb';
+import * as sqs from 'aws-cdk-lib/aws-sqs';
+import * as lambdaEventSources from 'aws-cdk-lib/aws-lambda-event-sources';
 import * as path from 'path';
 
 export class R2RStack extends cdk.Stack {
@@ -210,6 +212,69 @@ export class R2RStack extends cdk.Stack {
       removalPolicy: cdk.RemovalPolicy.DESTROY,
     });
 
+    // Index /burn-plan/recent queries: plans bucketed by UTC creation day, newest first
+    burnPlansTable.addGlobalSecondaryIndex({
+      indexName: 'recent-by-day',
+      partitionKey: {
+        name: 'created_day',
+        type: dynamodb.AttributeType.STRING,
+      },
+      sortKey: {
+        name: 'timestamp',
+        type: dynamodb.AttributeType.NUMBER,
+      },
+      projectionType: dynamodb.ProjectionType.ALL,
+    });
+
+    // Create S3 bucket for burn plans too large to store in a DynamoDB item
+    const burnPlanOverflowBucket = new s3.Bucket(this, 'BurnPlanOverflowBucket', {
+      removalPolicy: cdk.RemovalPolicy.DESTROY,
+      autoDeleteObjects: true,
+      blockPublicAccess: s3.BlockPublicAccess.BLOCK_ALL,
+      encryption: s3.BucketEncryption.S3_MANAGED,
+    });
+
+    // Create DynamoDB table for the shared burn plan cache (entries expire via TTL)
+    const burnPlanCacheTable = new dynamodb.Table(this, 'BurnPlanCacheTable', {
+      tableName: 'burn-plan-cache',
+      partitionKey: {
+        name: 'cache_key',
+        type: dynamodb.AttributeType.STRING,
+      },
+      sortKey: {
+        name: 'variant',
+        type: dynamodb.AttributeType.NUMBER,
+      },
+      timeToLiveAttribute: 'expires_at',
+      billingMode: dynamodb.BillingMode.PAY_PER_REQUEST,
+      removalPolicy: cdk.RemovalPolicy.DESTROY,
+    });
+
+    // Create DynamoDB table for asynchronous burn plan jobs (records expire via TTL)
+    const burnPlanJobsTable = new dynamodb.Table(this, 'BurnPlanJobsTable', {
+      tableName: 'burn-plan-jobs',
+      partitionKey: {
+        name: 'job_id',
+        type: dynamodb.AttributeType.STRING,
+      },
+      timeToLiveAttribute: 'expires_at',
+      billingMode: dynamodb.BillingMode.PAY_PER_REQUEST,
+      removalPolicy: cdk.RemovalPolicy.DESTROY,
+    });
+
+    // Create SQS queue feeding burn plan jobs to the worker Lambda
+    const burnPlanJobDeadLetterQueue = new sqs.Queue(this, 'BurnPlanJobDeadLetterQueue', {
+      retentionPeriod: cdk.Duration.days(4),
+    });
+    const burnPlanJobQueue = new sqs.Queue(this, 'BurnPlanJobQueue', {
+      // Must exceed the worker timeout so in-flight jobs aren't redelivered
+      visibilityTimeout: cdk.Duration.seconds(180),
+      deadLetterQueue: {
+        queue: burnPlanJobDeadLetterQueue,
+        maxReceiveCount: 3,
+      },
+    });
+
     // Create Lambda function
     const helloWorldFunction = new lambda.NodejsFunction(this, 'HelloWorldFunction', {
       entry: path.join(__dirname, 'lambda', 'hello-world.ts'),
@@ -248,28 +313,37 @@ export class R2RStack extends cdk.Stack {
     // Grant Lambda permission to write to DynamoDB
     burnPlansTable.grantWriteData(burnPlanFunction);
 
+    // FastAPI code asset, shared by the API and the burn plan job worker
+    const fastapiCode = pythonLambda.Code.fromAsset(
+      path.join(__dirname, 'lambda', 'fastapi'),
+      {
+        bundling: {
+          image: pythonLambda.Runtime.PYTHON_3_13.bundlingImage,
+          command: [
+            'bash',
+            '-c',
+            'pip install -r requirements.txt -t /asset-output && cp -au . /asset-output',
+          ],
+        },
+      }
+    );
+
     // Create FastAPI Lambda function
     const fastapiFunction = new pythonLambda.Function(this, 'FastAPIFunction', {
       runtime: pythonLambda.Runtime.PYTHON_3_13,
       handler: 'main.handler',
-      code: pythonLambda.Code.fromAsset(
-        path.join(__dirname, 'lambda', 'fastapi'),
-        {
-          bundling: {
-            image: pythonLambda.Runtime.PYTHON_3_13.bundlingImage,
-            command: [
-              'bash',
-              '-c',
-              'pip install -r requirements.txt -t /asset-output && cp -au . /asset-output',
-            ],
-          },
-        }
-      ),
+      code: fastapiCode,
       timeout: cdk.Duration.seconds(29),
       memorySize: 512,
       environment: {
         AGENTCORE_AGENT_RUNTIME_ARN: 'arn:aws:bedrock-agentcore:us-east-1:114713347049:runtime/money_spender_aws_agent-VDHCzRHLoE',
         BURN_PLANS_TABLE_NAME: burnPlansTable.tableName,
+        BURN_PLANS_OVERFLOW_BUCKET: burnPlanOverflowBucket.bucketName,
+        BURN_PLAN_CACHE_TABLE_NAME: burnPlanCacheTable.tableName,
+        BURN_PLAN_JOBS_TABLE_NAME: burnPlanJobsTable.tableName,
+        BURN_PLAN_JOB_QUEUE_URL: burnPlanJobQueue.queueUrl,
+        // API Gateway REST buffers streamed responses; serve /burn-plan/stream elsewhere
+        BURN_PLAN_STREAM_ENABLED: 'false',
       },
     });
 
@@ -286,6 +360,52 @@ export class R2RStack extends cdk.Stack {
 
     // Grant Lambda permission to read/write DynamoDB
     burnPlansTable.grantReadWriteData(fastapiFunction);
+    burnPlanOverflowBucket.grantReadWrite(fastapiFunction);
+    burnPlanCacheTable.grantReadWriteData(fastapiFunction);
+    burnPlanJobsTable.grantReadWriteData(fastapiFunction);
+    burnPlanJobQueue.grantSendMessages(fastapiFunction);
+
+    // Create burn plan job worker Lambda (generations aren't bound by API Gateway's 29 s)
+    const burnPlanWorkerFunction = new pythonLambda.Function(this, 'BurnPlanWorkerFunction', {
+      runtime: pythonLambda.Runtime.PYTHON_3_13,
+      handler: 'worker.handler',
+      code: fastapiCode,
+      timeout: cdk.Duration.seconds(120),
+      memorySize: 512,
+      environment: {
+        AGENTCORE_AGENT_RUNTIME_ARN: 'arn:aws:bedrock-agentcore:us-east-1:114713347049:runtime/money_spender_aws_agent-VDHCzRHLoE',
+        AGENTCORE_READ_TIMEOUT: '100',
+        BURN_PLAN_JOB_BUDGET_SECONDS: '115',
+        BURN_PLANS_TABLE_NAME: burnPlansTable.tableName,
+        BURN_PLANS_OVERFLOW_BUCKET: burnPlanOverflowBucket.bucketName,
+        BURN_PLAN_CACHE_TABLE_NAME: burnPlanCacheTable.tableName,
+        BURN_PLAN_JOBS_TABLE_NAME: burnPlanJobsTable.tableName,
+      },
+    });
+
+    burnPlanWorkerFunction.addEventSource(
+      new lambdaEventSources.SqsEventSource(burnPlanJobQueue, {
+        batchSize: 1,
+        reportBatchItemFailures: true,
+      })
+    );
+
+    // Grant worker permission to invoke AgentCore agent runtime
+    burnPlanWorkerFunction.addToRolePolicy(
+      new iam.PolicyStatement({
+        effect: iam.Effect.ALLOW,
+        actions: [
+          'bedrock-agentcore:InvokeAgentRuntime',
+        ],
+        resources: ['*'],
+      })
+    );
+
+    // Grant worker permission to read/write DynamoDB
+    burnPlansTable.grantReadWriteData(burnPlanWorkerFunction);
+    burnPlanOverflowBucket.grantReadWrite(burnPlanWorkerFunction);
+    burnPlanCacheTable.grantReadWriteData(burnPlanWorkerFunction);
+    burnPlanJobsTable.grantReadWriteData(burnPlanWorkerFunction);
 
     // // Create API Gateway with Cognito Authorizer
     const api = new apigateway.RestApi(this, 'R2RApi', {